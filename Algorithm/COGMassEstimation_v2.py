@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional
 
 from Algorithm.algorithmtype import ALGORITHM_TYPE
 from datainfo import SensorFrame, SENSORLOCATION, AlgorithmData
+from frame_batch import FrameBatch
 
 # 상위 디렉토리의 모듈을 import 하기 위한 경로 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,6 +36,34 @@ class COGMassEstimation(AlgorithmBase):
         }
         self.laser_changes = {i: [] for i in range(4)}
 
+        # 보정 상수 테이블을 정렬된 NumPy 배열로 미리 변환 (searchsorted 기반 최근접 탐색용)
+        self.constant_tables = {}
+        for location, values in self.constants.items():
+            table = np.asarray(values, dtype=np.float64)
+            order = np.argsort(table, kind='stable')
+            self.constant_tables[location] = (table[order], order)
+
+    def nearest_constant_index(self, location: int, values) -> np.ndarray:
+        """
+        values 각각에 대해 constants[location]에서 가장 가까운 상수의 인덱스를 반환
+        거리가 같으면 리스트에서 먼저 나오는 인덱스 (min + list.index 와 동일)
+        """
+        table, order = self.constant_tables[location]
+        values = np.asarray(values, dtype=np.float64)
+
+        pos = np.searchsorted(table, values, side='left')
+        left = np.clip(pos - 1, 0, len(table) - 1)
+        right = np.clip(pos, 0, len(table) - 1)
+        # 같은 값이 여러 개면 그 중 첫 번째 위치 사용
+        left = np.searchsorted(table, table[left], side='left')
+
+        left_dist = np.abs(values - table[left])
+        right_dist = np.abs(values - table[right])
+        left_idx = order[left]
+        right_idx = order[right]
+        return np.where(left_dist < right_dist, left_idx,
+                        np.where(right_dist < left_dist, right_idx, np.minimum(left_idx, right_idx)))
+
     def compute_deltas(self, current_values: List[float]) -> List[float]:
         if not hasattr(self, 'initial_laser_values'):
             # 유효한 초기값 조건 확인 (-1이나 0이 아닌 경우만)
@@ -164,8 +193,7 @@ class COGMassEstimation(AlgorithmBase):
 
         if location in self.constants and location in mapping:
             avg = sum(mapping[location]) / len(mapping[location]) if mapping[location] else 0
-            closest = min(self.constants[location], key=lambda x: abs(x - avg))
-            return self.constants[location].index(closest)
+            return int(self.nearest_constant_index(location, [avg])[0])
         return None
 
     def runAlgo(self) -> AlgorithmData:
@@ -193,10 +221,100 @@ class COGMassEstimation(AlgorithmBase):
         #     'delta_values': recent_deltas
         # }
 
+    def estimate_batch(self, distances):
+        """
+        N개 프레임의 위치와 무게를 한 번에 추정
+
+        Args:
+            distances: (N, 4) 거리 배열 (TOP_LEFT, BOTTOM_LEFT, TOP_RIGHT, BOTTOM_RIGHT 순서)
+
+        Returns:
+            (positions, weights) - 각각 (N,) 정수 배열
+            프레임 순서대로 runAlgo를 호출한 것과 같은 결과이며, 초기값/변화량 상태도 동일하게 갱신됨
+        """
+        raw = np.asarray(distances).reshape(-1, 4)
+        values = raw.astype(np.float64)
+        n = len(values)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        # 1. 변화량 계산 (compute_deltas와 동일 - 초기값이 정해지기 전까지는 0)
+        deltas = np.zeros((n, 4), dtype=np.float64)
+        if hasattr(self, 'initial_laser_values'):
+            deltas = np.asarray(self.initial_laser_values, dtype=np.float64) - values
+        else:
+            valid = np.all((values != -1) & (values != 0), axis=1)
+            if valid.any():
+                first = int(np.argmax(valid))
+                self.initial_laser_values = raw[first].tolist()
+                deltas[first + 1:] = values[first] - values[first + 1:]
+
+        top_left, bottom_left, top_right, bottom_right = deltas.T
+        for idx, change in enumerate(deltas[-1].tolist()):
+            self.laser_changes[idx] = [change]
+
+        # 2. 적재 위치 (determine_loading_position)
+        vsum = top_left + bottom_left
+        hsum = top_left + top_right
+        vcog = np.divide(top_left, vsum, out=np.zeros(n), where=vsum != 0)
+        hcog = np.divide(top_left, hsum, out=np.zeros(n), where=hsum != 0)
+
+        row = np.where(vcog > 0.43, 0, np.where(vcog >= 0.20, 1, 2))  # front / center / rear
+        col = np.where(hcog > 0.65, 0, np.where(hcog >= 0.35, 1, 2))  # Left / Middle / Right
+        positions = row * 3 + col + 1
+
+        # 3. 위치별 변화량 평균 (calculate_weight_estimation의 mapping)
+        candidates = np.stack([
+            top_left,
+            (top_left + top_right) / 2,
+            top_right,
+            (top_left + bottom_left) / 2,
+            (top_left + bottom_left + top_right + bottom_right) / 4,
+            (top_right + bottom_right) / 2,
+            bottom_left,
+            (bottom_left + bottom_right) / 2,
+            bottom_right
+        ])
+        avg = candidates[positions - 1, np.arange(n)]
+
+        # 4. 위치별로 묶어서 보정 상수 최근접 탐색
+        weights = np.zeros(n, dtype=np.int64)
+        for location in np.unique(positions):
+            mask = positions == location
+            weights[mask] = self.nearest_constant_index(int(location), avg[mask])
+
+        return positions, weights
+
+    def runAlgoBatch(self, frames: List[SensorFrame]) -> Optional[List[AlgorithmData]]:
+        locations = (SENSORLOCATION.TOP_LEFT, SENSORLOCATION.BOTTOM_LEFT,
+                     SENSORLOCATION.TOP_RIGHT, SENSORLOCATION.BOTTOM_RIGHT)
+        if isinstance(frames, FrameBatch):
+            # 배치 리시뮬레이션 : 센서 객체를 만들지 않고 배열에서 바로 꺼냄
+            return self._toResults(*self.estimate_batch(frames.distances(locations)))
+        try:
+            distances = [[frame.get_sensor_data(loc).distance for loc in locations] for frame in frames]
+        except (IndexError, AttributeError, TypeError):
+            return None  # 센서 데이터가 빠진 프레임은 프레임 단위 처리
+
+        return self._toResults(*self.estimate_batch(distances))
+
+    @staticmethod
+    def _toResults(positions, weights) -> List[AlgorithmData]:
+        return [AlgorithmData(algo_type=ALGORITHM_TYPE.COGMassEstimation,
+                              predicted_weight=int(weight),
+                              error=0,
+                              position=int(position))
+                for position, weight in zip(positions, weights)]
+
     def initAlgorithm(self):
         pass
         #print('init Algorithm -> ', self.name)
 
+    def resetAlgorithm(self):
+        if hasattr(self, 'initial_laser_values'):
+            del self.initial_laser_values
+        self.laser_changes = {i: [] for i in range(4)}
+
 
 if __name__ == "__main__":
     predictor = COGMassEstimation()
@@ -3,7 +3,7 @@ import sys
 import time
 import numpy as np
 import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
@@ -16,6 +16,9 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 from AlgorithmInterface import AlgorithmBase
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from datainfo import SensorFrame, SENSORLOCATION, AlgorithmData
+from frame_batch import FrameBatch
 
 
 class KerasMLPPredictor(AlgorithmBase):
@@ -23,6 +26,14 @@ class KerasMLPPredictor(AlgorithmBase):
     Keras 기반 MLP 모델을 사용한 무게 및 위치 예측 알고리즘 (센서 변화량 기반)
     """
 
+    # 모델 입력 순서 (레거시 dict 입력의 VCOM1~4와 같은 순서)
+    SENSOR_LOCATIONS = [SENSORLOCATION.get_sensor_location(i) for i in range(4)]
+    VCOM_KEYS = ["VCOM1", "VCOM2", "VCOM3", "VCOM4"]
+
+    # AlgorithmData.error 코드
+    ERROR_NOT_LOADED = 1  # 모델 또는 스케일러 로드 실패
+    ERROR_NO_SENSOR = 2  # 프레임에 센서 데이터가 없음
+
     def __init__(self, name):
         super().__init__(
             name=name,
@@ -31,11 +42,17 @@ class KerasMLPPredictor(AlgorithmBase):
         )
 
         self.scaler_path = "../model/scaler_20250403_135334.save"
+        self.model = None  # initAlgorithm에서 로드
+        self.scaler = None
         self.input_data.append("value")
 
-        # 센서 초기값 저장용
+        # 센서 초기값 저장용 {SENSORLOCATION: 값} (프레임 / 배치 / 레거시 dict 입력 공통)
         self.initial_values = {}
 
+        # 마이크로 배치 설정 - batch_size 개가 모이거나 batch_deadline(초)이 지나면 한 번에 추론
+        self.batch_size = 64
+        self.batch_deadline = 0.02
+
     def initAlgorithm(self):
         # 모델 및 스케일러 로드
         model_abspath = os.path.join(os.path.dirname(os.path.abspath(__file__)), self.model_path)
@@ -50,36 +67,22 @@ class KerasMLPPredictor(AlgorithmBase):
             self.model = None
             self.scaler = None
 
-    def runAlgo(self) -> Dict[str, Any]:
+    def runAlgo(self):
+        if not isinstance(self.data, dict):
+            # SensorFrame / FrameView : 배치 경로와 같은 계산 (결과 / 초기값 상태가 항상 같음)
+            return self.runAlgoBatch([self.data])[0]
+
         try:
             if self.model is None or self.scaler is None:
                 return {'error': "모델 또는 스케일러가 초기화되지 않았습니다."}
 
-            # 현재 센서값 추출
-            current_values = {
-                "VCOM1": self.data["VCOM1"]["value"],
-                "VCOM2": self.data["VCOM2"]["value"],
-                "VCOM3": self.data["VCOM3"]["value"],
-                "VCOM4": self.data["VCOM4"]["value"]
-            }
-
-            # 초기값 저장 (최초 실행 시에만)
-            for key in current_values:
-                if key not in self.initial_values:
-                    self.initial_values[key] = current_values[key]
+            # 현재 센서값 추출 (VCOM1~4 = SENSOR_LOCATIONS 순서)
+            current_values = {key: self.data[key]["value"] for key in self.VCOM_KEYS}
 
-            # 변화량 계산
-            delta_values = [
-                current_values["VCOM1"] - self.initial_values["VCOM1"],
-                current_values["VCOM2"] - self.initial_values["VCOM2"],
-                current_values["VCOM3"] - self.initial_values["VCOM3"],
-                current_values["VCOM4"] - self.initial_values["VCOM4"]
-            ]
-
-            # 스케일링 및 예측
-            input_array = np.array(delta_values).reshape(1, -1)
-            scaled_input = self.scaler.transform(input_array)
-            predictions = self.model.predict(scaled_input, verbose=0)
+            # 변화량 계산 (초기값은 최초 실행 시에만 저장)
+            delta_values = self._deltas(np.array([[current_values[key] for key in self.VCOM_KEYS]],
+                                                 dtype=np.float64))
+            predictions = self._predict(delta_values)
 
             weight = float(predictions[0][0])
             position = int(round(predictions[0][1]))
@@ -89,14 +92,69 @@ class KerasMLPPredictor(AlgorithmBase):
                 'position': position,
                 'raw_predictions': predictions.tolist(),
                 'input_values': current_values,
-                'delta_values': delta_values
+                'delta_values': delta_values[0].tolist()
             }
 
         except Exception as e:
             return {'error': f"모델 예측 중 오류 발생: {str(e)}"}
 
+    def runAlgoBatch(self, frames: List[SensorFrame]) -> Optional[List[AlgorithmData]]:
+        """
+        마이크로 배치 추론
+        스케일러와 모델을 배치당 한 번만 호출 (predict의 호출당 고정 오버헤드를 피하기 위해 모델을 직접 호출)
+        모델이 로드되지 않았거나 센서 데이터가 빠진 프레임은 error가 설정된 AlgorithmData로 반환
+        """
+        if self.model is None or self.scaler is None:
+            return [self._errorResult(self.ERROR_NOT_LOADED) for _ in range(len(frames))]
+
+        if isinstance(frames, FrameBatch):
+            current_values = frames.distances(self.SENSOR_LOCATIONS).astype(np.float64)
+            valid = list(range(len(frames)))
+        else:
+            rows, valid = [], []
+            for index, frame in enumerate(frames):
+                try:
+                    rows.append([frame.get_sensor_data(loc).distance for loc in self.SENSOR_LOCATIONS])
+                    valid.append(index)
+                except (IndexError, AttributeError, TypeError):
+                    pass
+            current_values = np.array(rows, dtype=np.float64).reshape(-1, len(self.SENSOR_LOCATIONS))
+
+        results = [self._errorResult(self.ERROR_NO_SENSOR)] * len(frames)
+        if valid:
+            predictions = self._predict(self._deltas(current_values))
+            for index, (weight, position) in zip(valid, predictions[:, :2]):
+                results[index] = AlgorithmData(algo_type=ALGORITHM_TYPE.MLPPredictor,
+                                               predicted_weight=int(np.clip(round(float(weight)), 0, 0xFFFF)),
+                                               error=0,
+                                               position=int(np.clip(round(float(position)), 0, 0xFFFF)))
+        return results
+
+    def _deltas(self, current_values: np.ndarray) -> np.ndarray:
+        """(N, 4) 센서값 -> 초기값 대비 변화량 (초기값은 SENSORLOCATION별로 처음 들어온 값)"""
+        for idx, loc in enumerate(self.SENSOR_LOCATIONS):
+            if loc not in self.initial_values:
+                self.initial_values[loc] = float(current_values[0][idx])
+        initial = np.array([self.initial_values[loc] for loc in self.SENSOR_LOCATIONS])
+        return current_values - initial
+
+    def _predict(self, delta_values: np.ndarray) -> np.ndarray:
+        scaled_input = self.scaler.transform(delta_values)
+        return np.asarray(self.model(scaled_input, training=False))
+
+    @staticmethod
+    def _errorResult(error: int) -> AlgorithmData:
+        return AlgorithmData(algo_type=ALGORITHM_TYPE.MLPPredictor, predicted_weight=0, error=error, position=0)
+
     def execute(self, input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         self.data = input_data
+        if not isinstance(input_data, dict):
+            # SensorFrame / FrameView : 레거시 preprocessing 없이 다른 알고리즘과 같은 {'input', 'output'} 형식
+            start_time = time.time()
+            output = None if input_data is None or input_data.isEoF else self.runAlgo()
+            self.execution_time = time.time() - start_time
+            return {'input': input_data, 'output': output}
+
         self.preprocessing()
 
         try:
@@ -127,6 +185,9 @@ class KerasMLPPredictor(AlgorithmBase):
         self.initial_values = {}
         #print("🌀 초기 센서값이 리셋되었습니다.")
 
+    def resetAlgorithm(self):
+        self.reset_initial_values()
+
 
 # 테스트 코드
 if __name__ == "__main__":
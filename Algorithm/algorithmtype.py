@@ -1,3 +1,4 @@
+import importlib
 from enum import Enum
 from typing import List
 
@@ -19,4 +20,23 @@ class ALGORITHM_TYPE(Enum):
 
     @staticmethod
     def list_all() -> List['ALGORITHM_TYPE']:
-        return list(ALGORITHM_TYPE)
\ No newline at end of file
+        return list(ALGORITHM_TYPE)
+
+    def get_class_path(self) -> str:
+        return ALGORITHM_CLASS_PATH[self.name]
+
+    def load_class(self):
+        """
+        알고리즘 클래스를 import 경로로 로드
+        TensorFlow / sklearn 등 무거운 모듈은 이 함수를 호출한 프로세스에서만 import 됨
+        """
+        module_name, class_name = self.get_class_path().rsplit('.', 1)
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+# 알고리즘 클래스 import 경로 (모듈.클래스)
+ALGORITHM_CLASS_PATH = {
+    'COGMassEstimation': 'Algorithm.COGMassEstimation_v2.COGMassEstimation',
+    'MLPPredictor': 'Algorithm.MLPPredictor.KerasMLPPredictor',
+    'RandomForestPredictor': 'Algorithm.RandomForestPredictor.RandomForestPredictor',
+}
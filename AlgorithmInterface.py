@@ -3,6 +3,7 @@ import time
 from enum import Enum
 from typing import Dict, List, Any, Optional
 from time import sleep
+from queue import Empty
 from datainfo import SensorFrame, AlgorithmData
 from procImpl import processImpl
 
@@ -33,6 +34,9 @@ class AlgorithmBase(processImpl):
         self.is_running = False
         self.isTerminated = False
         self.execution_history = []
+        self.batch_size = 32  # doProc에서 한 번에 꺼내는 최대 프레임 수
+        self.batch_deadline = 0  # 첫 프레임 이후 배치를 채우기 위해 더 기다리는 시간 (초), 0이면 대기하지 않음
+        self.poll_timeout = 0.5  # 데이터 대기 timeout (초)
 
     @abstractmethod
     def runAlgo(self) -> AlgorithmData:
@@ -71,23 +75,84 @@ class AlgorithmBase(processImpl):
         """
         return self.execution_history
 
+    def runAlgoBatch(self, frames: List[SensorFrame]) -> Optional[List[AlgorithmData]]:
+        """
+        여러 프레임을 한 번에 처리하는 선택적 훅
+        배치 처리가 가능한 알고리즘은 오버라이드하여 프레임 순서대로 결과 리스트를 반환
+
+        Returns:
+            프레임별 처리 결과, None 이면 프레임 단위 runAlgo로 처리
+        """
+        return None
+
     @abstractmethod
     def initAlgorithm(self):
         pass
 
-    def doProc(self):
+    def resetAlgorithm(self):
+        """
+        로그 파일(측정 세션)이 바뀔 때 호출되는 상태 초기화 훅
+        초기 센서값처럼 세션마다 새로 잡아야 하는 상태만 지우고, 로드된 모델은 유지
+        """
+        pass
+
+    def prepare(self):
         #print('init Algorithm..',self.name)
         self.initAlgorithm()
+
+    def doProc(self):
         while True:
-            if not self.databuf.empty():
-                data:SensorFrame = self.databuf.get()#print('run algorithm->',self.name,' : ',self.databuf.get())
-                if data.isEoF:
-                    break
-                res = self.execute(data)
-                self.resBuf.put(res)
+            frames = self._getBatch()
+            if not frames:
+                continue
+
+            isEoF = frames[-1].isEoF
+            if isEoF:
+                frames.pop()
+
+            if frames:
+                for res in self.executeBatch(frames):
+                    self.resBuf.put(res)
                 #print('run algorithm->', self.name, ' : ', res)
-            #print('run algorithm->',self.name)
-            # sleep(0.1)
+            if isEoF:
+                # 결과를 받는 쪽에서도 끝을 알 수 있도록 EoF 전달
+                self.resBuf.put({'input': SensorFrame(timestamp=None, sensors=None, isEoF=True), 'output': None})
+                break
+
+    def _getBatch(self) -> List[SensorFrame]:
+        """
+        데이터가 들어올 때까지 block 하고, 쌓여있는 프레임을 batch_size 까지 꺼냄
+        batch_deadline이 설정되어 있으면 첫 프레임 이후 그 시간만큼 배치가 차기를 기다림
+        EoF 프레임을 만나면 거기까지만 반환
+        """
+        try:
+            data: SensorFrame = self.databuf.get(timeout=self.poll_timeout)
+        except Empty:
+            return []
+
+        frames = [data]
+        deadline = time.monotonic() + self.batch_deadline
+        while not data.isEoF and len(frames) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    data = self.databuf.get(timeout=remaining)
+                else:
+                    data = self.databuf.get_nowait()
+            except Empty:
+                break
+            frames.append(data)
+        return frames
+
+    def executeBatch(self, frames: List[SensorFrame]) -> List[Dict[str, Any]]:
+        start_time = time.time()
+        results = self.runAlgoBatch(frames)
+        if results is None:
+            # execute()는 같은 output_data 객체를 재사용하므로 프레임마다 복사
+            return [dict(self.execute(frame)) for frame in frames]
+
+        self.execution_time = time.time() - start_time
+        return [{'input': frame, 'output': res} for frame, res in zip(frames, results)]
 
     def execute(self, input_data: Optional[SensorFrame] = None) -> Dict[str, Any]:
         if input_data is None:
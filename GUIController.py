@@ -1,33 +1,72 @@
+import time
+from queue import Empty
+
 from PyQt5.QtCore import QThread, pyqtSignal
 
 
 class GUIController(QThread):
+    """
+    SerialManager.exper_buffer의 프레임을 GUI 모듈의 plot_data에 반영하고 그래프 갱신을 요청하는 스레드
+
+    쌓여있는 프레임은 한 번에 모두 꺼내 버퍼에 반영하고,
+    plot_updated는 refresh_rate(Hz)당 최대 한 번만 emit 하여 GUI 이벤트 큐가 밀리지 않도록 함
+    """
     plot_updated = pyqtSignal()
-    def __init__(self, GUI, serial_manager):
+
+    def __init__(self, GUI, serial_manager, refresh_rate=30):
         super(GUIController, self).__init__()
         self.guiModule = GUI
         self.serialManager = serial_manager
+        self.refresh_interval = 1.0 / refresh_rate
+
+        self.frames_received = 0  # 받은 프레임 수
+        self.redraws = 0  # plot_updated emit 수
+        self.coalesced = 0  # 그래프 갱신 없이 합쳐진 프레임 수 (frames_received - redraws)
+
+    def setRefreshRate(self, refresh_rate):
+        self.refresh_interval = 1.0 / refresh_rate
 
     def run(self):
         print('run GUI Thread')
+        pending = 0  # 마지막 그래프 갱신 이후 반영한 프레임 수
+        next_emit = time.monotonic()
         while True:
             try:
-                group_data = self.serialManager.exper_buffer.get()
-                for data in group_data.sensors:
-                    self.dataUpdate(data)
-                self.plot_updated.emit()
+                # 반영한 프레임이 있으면 다음 갱신 시점까지만 대기
+                timeout = max(0.0, next_emit - time.monotonic()) if pending else None
+                for group_data in self._drain(timeout):
+                    for data in group_data.sensors:
+                        self.dataUpdate(data)
+                    pending += 1
+                    self.frames_received += 1
+
+                now = time.monotonic()
+                if pending and now >= next_emit:
+                    self.plot_updated.emit()
+                    self.redraws += 1
+                    self.coalesced += pending - 1
+                    pending = 0
+                    next_emit = now + self.refresh_interval
             except Exception as e:
                 print("GUIController : ", e)
-            # self.msleep(15)
 
+    def _drain(self, timeout):
+        """첫 프레임은 timeout까지 기다리고, 이후 쌓여있는 프레임은 모두 꺼냄"""
+        frames = []
+        try:
+            frames.append(self.serialManager.exper_buffer.get(timeout=timeout))
+            while True:
+                frames.append(self.serialManager.exper_buffer.get_nowait())
+        except Empty:
+            pass
+        return frames
 
     def dataUpdate(self, data):
         plot_data = self.guiModule.plot_data.get(data.serial_port)
-        plot_change = self.guiModule.plot_change.get(data.serial_port)
-
-        plot_curve = self.guiModule.plot_curve[data.serial_port]
-        plot_curve_change = self.guiModule.plot_curve_change[data.serial_port]
+        if plot_data is None:
+            return
 
-        plot_data.append(data)
-        plot_change.append(data)
-        # print(data.serialport, data.timestamp, data.value, data.port_index)
\ No newline at end of file
+        plot_data.append(data)  # SensorRingBuffer
+        save_data = self.guiModule.save_data.get(data.serial_port)
+        if save_data is not None:
+            save_data.append(data)  # 파일 기록용
@@ -141,6 +141,11 @@ class AlgorithmMultiProcV2(QWidget):
         self.timer.timeout.connect(self.updateData)
         self.timer.start(50)
 
+        # 알고리즘 프로세스가 링버퍼에서 놓친 프레임 확인 (1초마다)
+        self.overrunTimer = QTimer(self)
+        self.overrunTimer.timeout.connect(self.procmanager.checkOverruns)
+        self.overrunTimer.start(1000)
+
     def setOutputLabels(self):
         self.clear_layout(self.weight_layout)
 
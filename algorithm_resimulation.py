@@ -1,12 +1,29 @@
 import os
 
-from PyQt5.QtCore import QTimer, QSize, pyqtSignal
+from PyQt5.QtCore import QTimer, QSize, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import *
 
 from Algorithm.algorithmtype import ALGORITHM_TYPE
 from file_manager import AlgorithmFileManager
-from resimulation_manager import ResimulationManager
+from resimulation_manager import ResimulationManager, REPLAY_MODE
+from batch_resimulation import BatchResimulator, find_log_files
+
+
+class BatchResimulThread(QThread):
+    progressSignal = pyqtSignal(int, int)  # 완료 파일 수, 전체 파일 수
+    finishSignal = pyqtSignal()
+
+    def __init__(self, resimulator: BatchResimulator, files):
+        super().__init__()
+        self.resimulator = resimulator
+        self.files = files
+        self.summaries = []
+
+    def run(self):
+        self.summaries = self.resimulator.run(
+            self.files, callback=lambda done, total, summary: self.progressSignal.emit(done, total))
+        self.finishSignal.emit()
 
 
 class AlgorithmResimulation(QWidget):
@@ -20,6 +37,7 @@ class AlgorithmResimulation(QWidget):
         self.algorithm_checkbox = []
         self.outputLabels = dict()
         self.filepath = None
+        self.batchThread = None
 
         self.loadAlgorithmCbx()
         self.initUI()
@@ -40,9 +58,27 @@ class AlgorithmResimulation(QWidget):
         self.fileBtn.clicked.connect(self.loadDataFile)
         self.fileBtn.setMinimumSize(QSize(120, 50))
         self.fileBtn.setFont(font)
+        self.batchBtn = QPushButton("Batch Run")  # 디렉토리 안의 모든 로그를 선택한 알고리즘으로 일괄 처리
+        self.batchBtn.clicked.connect(self.runBatch)
+        self.batchBtn.setMinimumSize(QSize(120, 50))
+        self.batchBtn.setFont(font)
         self.filenameLabel = QLabel("")
         self.filenameLabel.setMaximumHeight(50)
 
+        # 재생 방식 (최대 속도 / 실시간 / N배속)
+        self.replayCbx = QComboBox()
+        self.replayCbx.addItem("As fast as possible", userData=REPLAY_MODE.ASAP)
+        self.replayCbx.addItem("Real time", userData=REPLAY_MODE.REALTIME)
+        self.replayCbx.addItem("xN speed", userData=REPLAY_MODE.SCALED)
+        self.replayCbx.currentIndexChanged.connect(
+            lambda _: self.speedSpin.setEnabled(self.replayCbx.currentData() == REPLAY_MODE.SCALED))
+        self.speedSpin = QDoubleSpinBox()
+        self.speedSpin.setRange(0.1, 1000.0)
+        self.speedSpin.setValue(2.0)
+        self.speedSpin.setSuffix(" x")
+        self.speedSpin.setEnabled(False)
+        self.statsLabel = QLabel("")
+
         self.checkbox_layout = QVBoxLayout()
         self.algorithm_list.setLayout(self.checkbox_layout)
         for cbx in self.algorithm_checkbox:
@@ -75,9 +111,17 @@ class AlgorithmResimulation(QWidget):
         top_layout = QHBoxLayout()  # 알고리즘, 버튼 박스와 분리를 위한 레이아웃
         top_layout.addWidget(self.toggleBtn)
         top_layout.addWidget(self.fileBtn)
+        top_layout.addWidget(self.batchBtn)
         top_layout.addWidget(self.filenameLabel)
         top_layout.addStretch()  # 버튼 오른쪽 공간 채우기
 
+        replay_layout = QHBoxLayout()
+        replay_layout.addWidget(QLabel("Replay : "))
+        replay_layout.addWidget(self.replayCbx)
+        replay_layout.addWidget(self.speedSpin)
+        replay_layout.addWidget(self.statsLabel)
+        replay_layout.addStretch()
+
         btn_layout = QVBoxLayout()
         btn_layout.addWidget(self.start_btn)
         btn_layout.addWidget(self.all_btn)
@@ -85,6 +129,7 @@ class AlgorithmResimulation(QWidget):
 
         layout1 = QVBoxLayout()
         layout1.addLayout(top_layout)
+        layout1.addLayout(replay_layout)
         layout1.addWidget(groupbox)
         layout1.addLayout(btn_layout)
 
@@ -135,6 +180,8 @@ class AlgorithmResimulation(QWidget):
 
     def runAlgorithm(self):
         self.resimulManager.getDataFile(self.filepath)
+        self.resimulManager.setReplayMode(self.replayCbx.currentData(), self.speedSpin.value())
+        self.statsLabel.setText("")
         for cbx in self.algorithm_checkbox:
             if cbx.isChecked():
                 print('run - ', cbx.text())
@@ -142,7 +189,43 @@ class AlgorithmResimulation(QWidget):
                     print('select algorithm file -> ',cbx.text(), self.files[cbx.text()])
                     self.resimulManager.addProcess(self.files[cbx.text()])
 
-        self.resimulManager.startThread(callback=lambda: self.stop_btn.setEnabled(True))
+        self.resimulManager.startThread(callback=self.showReplayStats,
+                                        onStart=lambda: self.stop_btn.setEnabled(True))
+
+    def showReplayStats(self):
+        stats = self.resimulManager.replayStats
+        self.statsLabel.setText(', '.join(f"{name}: {stat['fps']:.1f} fps" for name, stat in stats.items()))
+
+    def runBatch(self):
+        algorithms = [self.files[cbx.text()] for cbx in self.algorithm_checkbox
+                      if cbx.isChecked() and cbx.text() in self.files]
+        if not algorithms:
+            print('No checkbox selected')
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Log directory", "log")
+        if not directory:
+            return
+        files = find_log_files(directory)
+        if not files:
+            print('No log files in', directory)
+            return
+
+        self.batchBtn.setEnabled(False)
+        self.filenameLabel.setText(directory)
+        self.batchThread = BatchResimulThread(BatchResimulator(algorithms), files)
+        self.batchThread.progressSignal.connect(
+            lambda done, total: self.statsLabel.setText(f"Batch : {done}/{total} files"))
+        self.batchThread.finishSignal.connect(self.finishBatch)
+        self.batchThread.start()
+
+    def finishBatch(self):
+        summaries = self.batchThread.summaries
+        for summary in summaries:
+            for name, error in summary['errors'].items():
+                print(summary['file'], name, error)
+        frames = sum(summary['frames'] for summary in summaries)
+        self.statsLabel.setText(f"Batch : {len(summaries)} files, {frames} frames done")
+        self.batchBtn.setEnabled(True)
 
     def finishAllAlgorithms(self):
         self.resimulManager.terminate()
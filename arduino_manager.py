@@ -8,11 +8,17 @@ from PyQt5.QtCore import QThread, QObject, pyqtSignal, QCoreApplication, QTimer
 from PyQt5.QtWidgets import QApplication
 import sys
 import random
-import datetime
-from threading import Thread, Lock
+from threading import Thread, Lock, Condition
 import time
+import selectors
+from enum import Enum
 
 from datainfo import SensorData, SENSORLOCATION, SensorFrame
+from synchronizer import ApproximateTimeSynchronizer, InterpolatingSynchronizer, SYNC_MODE
+from frame_buffer import FrameBuffer, OVERFLOW_POLICY
+from frame_dispatcher import FrameDispatcher
+from serial_protocol import SERIAL_PROTOCOL, DEFAULT_BAUDRATE, BinaryFrameParser, AsciiLineParser
+from timebase import NS_PER_MS, now_ns, to_datetime
 
 
 def find_arduino_port():
@@ -33,22 +39,72 @@ def get_arduino_ports(DEBUG_MODE=False):
     ]
     return ports
 
+def decode_samples(parser, chunk, port, timestamp: int) -> list:
+    """
+    수신한 chunk를 프로토콜 파서로 SensorData 목록으로 변환 (같은 chunk의 샘플은 같은 수신 시각)
+    timestamp는 serial.read() 직후의 now_ns() (파싱 시간이 포함되지 않도록 호출 측에서 측정)
+    """
+    samples = []
+    for location, distance, intensity, temperature in parser.feed(chunk):
+        # 유효한 센서 위치인지 확인
+        if location not in range(4):
+            continue
+        samples.append(SensorData(
+            timestamp=timestamp,
+            serial_port=port,
+            location=SENSORLOCATION.get_sensor_location(location),
+            distance=distance,
+            intensity=intensity,
+            temperature=temperature
+        ))
+    return samples
+
+
+class SensorNotifier:
+    """
+    센서 스레드들이 공유하는 데이터 도착 알림 채널
+    센서는 databuf에 데이터를 넣은 뒤 notify()를 호출하고,
+    동기화 스레드는 wait()에서 데이터가 들어올 때까지 잠들어 있음
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self._pending = False
+
+    def notify(self):
+        with self._cond:
+            self._pending = True
+            self._cond.notify()
+
+    def wait(self, timeout=None) -> bool:
+        """알림이 있었으면 True, timeout 이 지나면 False"""
+        with self._cond:
+            if not self._pending:
+                self._cond.wait(timeout)
+            signaled = self._pending
+            self._pending = False
+            return signaled
+
+
 class Sensor(QThread):
     errorSignal = pyqtSignal(str)  #serialManager에 전달하는 시그널
 
-    def __init__(self, port, baudrate=9600):
+    def __init__(self, port, baudrate=None, protocol=SERIAL_PROTOCOL.ASCII):
         super().__init__()
         self.is_running = True
         self.is_paused = False
 
         self.databuf = Queue(maxsize=1000)
+        self.notifier = None
         self.weight_a = [0] * 9
         self.refValue = -1
 
         self.sensorInitted = False
         self.serial = None
         self.port = port or find_arduino_port()
-        self.baudrate = baudrate
+        self.protocol = protocol
+        self.baudrate = baudrate or DEFAULT_BAUDRATE[protocol]
+        self.parser = BinaryFrameParser() if protocol == SERIAL_PROTOCOL.BINARY else AsciiLineParser()
         self.sensorLoc = SENSORLOCATION.NONE
         self._initSensor()
 
@@ -68,8 +124,11 @@ class Sensor(QThread):
         data = None
         self.msleep(100)
         while data is None:
-            data = self.__getDatafromSerial()
-            self.msleep(1)
+            samples = self._readSamples(block=True)
+            data = samples[0] if samples else None
+        # 첫 chunk에 같이 들어온 샘플도 버리지 않고 전달
+        for sdata in samples:
+            self._pushData(sdata)
 
         #set sensor location
         if self._setSensorLoc(data) is True:
@@ -78,6 +137,14 @@ class Sensor(QThread):
         #set sensor reference value
         self.refValue = data.distance
 
+    def setNotifier(self, notifier: SensorNotifier):
+        self.notifier = notifier
+
+    def _pushData(self, sdata: SensorData):
+        self.databuf.put(sdata)
+        if self.notifier is not None:
+            self.notifier.notify()
+
     def _setSensorLoc(self, data: 'SensorData'):
         if data is not None:
             self.sensorLoc = data.getSensorLoc()
@@ -89,61 +156,29 @@ class Sensor(QThread):
     def run(self):
         while self.sensorInitted is True and self.is_running is True:
             try:
-                if not self.is_paused and self.serial.in_waiting > 0:
-                        resData = self.__getDatafromSerial()
-                        if resData is not None:
-                            self.databuf.put(resData)
-                self.msleep(1)
+                if self.is_paused:
+                    self.msleep(1)
+                    continue
+                # 수신 버퍼의 byte를 한 번에 읽어 들어온 샘플을 모두 전달 (샘플마다 sleep 하지 않음)
+                # 수신된 byte가 없으면 serial timeout까지 첫 byte를 기다림
+                for sdata in self._readSamples(block=True):
+                    self._pushData(sdata)
             except serial.SerialException:
                 print('센서 연결 끊김')
                 self.errorSignal.emit("센서 연결 끊김")
                 break
 
-    def __getDatafromSerial(self):
-        try:
-            data = self.serial.readline().decode('utf-8', errors='ignore').strip()
-        except Exception as e:
-            print(f"데이터 수신 오류: {e}")
-            return None
-
-        if not data:
-            return None
-
-        parts = data.split(',')
-        if len(parts) != 4:
-            print(f"[경고] 잘못된 데이터 형식: {data}")
-            return None
+    def _readSamples(self, block=False) -> list:
+        """수신 버퍼의 byte를 모두 읽어 프로토콜 파서로 SensorData 목록으로 변환"""
+        waiting = self.serial.in_waiting
+        if waiting == 0 and not block:
+            return []
+        chunk = self.serial.read(max(1, waiting))
+        timestamp = now_ns()
+        if not chunk:
+            return []
 
-        try:
-            location = int(parts[0].strip())
-            distance = int(parts[1].strip())
-            intensity = int(parts[2].strip())
-            temperature = int(parts[3].strip())
-        except ValueError as ve:
-            print(f"[경고] 데이터 파싱 실패: {data} ({ve})")
-            return None
-
-        # 유효한 센서 위치인지 확인
-        if location not in range(4):
-            print(f"[경고] 잘못된 센서 위치: {location}")
-            return None
-
-        timestamp = datetime.datetime.now()
-
-        try:
-            sensor_data = SensorData(
-                timestamp=timestamp,
-                serial_port=self.port,
-                location=SENSORLOCATION.get_sensor_location(location),
-                distance=distance,
-                intensity=intensity,
-                temperature=temperature
-            )
-            self.databuf.put(sensor_data)
-            return sensor_data
-        except Exception as e:
-            print(f"[오류] SensorData 생성 실패: {e}")
-            return None
+        return decode_samples(self.parser, chunk, self.port, timestamp)
 
     def pause(self):
         self.is_paused = True
@@ -151,6 +186,7 @@ class Sensor(QThread):
     def resume(self):
         if hasattr(self, 'ser'):
             self.ser.flushInput()
+        self.parser.reset()
         self.is_paused = False
 
     def stop(self):
@@ -193,9 +229,8 @@ class SensorVirtual(Sensor):
             pidxGap = 0
 
         while self.is_running:
-            base_time = datetime.datetime.now()
             offset_ms = random.randint(0, 20)
-            timestamp = base_time + datetime.timedelta(milliseconds=offset_ms)
+            timestamp = now_ns() + offset_ms * NS_PER_MS
 
             # 시뮬레이션용 랜덤 센서 값 생성
             distance = random.randint(600 + (pidxGap * 10), 700 + (pidxGap * 10))
@@ -211,27 +246,200 @@ class SensorVirtual(Sensor):
                 temperature=temperature
             )
 
-            self.databuf.put(sdata)
+            self._pushData(sdata)
             self.msleep(100)
 
 
+class INGEST_MODE(Enum):
+    THREADS = 0   # 포트마다 Sensor 스레드 + databuf + poll 스레드 (기존 방식)
+    SELECTOR = 1  # SerialSelectorReader 스레드 하나가 모든 포트를 selectors로 읽음 (POSIX 전용)
+
+
+class SerialPort:
+    """
+    SerialSelectorReader가 관리하는 시리얼 포트 하나
+    SerialManager.sensors에서 Sensor 대신 사용되므로 port / sensorLoc / refValue 등 같은 속성을 제공
+    """
+
+    def __init__(self, port, baudrate=None, protocol=SERIAL_PROTOCOL.ASCII):
+        self.port = port
+        self.protocol = protocol
+        self.baudrate = baudrate or DEFAULT_BAUDRATE[protocol]
+        self.parser = BinaryFrameParser() if protocol == SERIAL_PROTOCOL.BINARY else AsciiLineParser()
+        self.serial = None
+        self.sensorLoc = SENSORLOCATION.NONE
+        self.sensorInitted = False
+        self.refValue = -1
+        self.is_paused = False
+
+    def open(self):
+        # timeout=0 : non-blocking (읽을 데이터가 있는지는 selector가 판단)
+        self.serial = serial.Serial(self.port, self.baudrate, timeout=0)
+
+    @property
+    def is_open(self) -> bool:
+        return self.serial is not None and self.serial.is_open
+
+    def fileno(self):
+        return self.serial.fileno()
+
+    def read(self) -> list:
+        """수신 버퍼의 byte를 모두 읽어 SensorData 목록으로 변환"""
+        chunk = self.serial.read(max(1, self.serial.in_waiting))
+        timestamp = now_ns()
+        if not chunk or self.is_paused:
+            return []  # 일시정지 중에는 읽은 데이터를 버림 (읽지 않으면 selector가 계속 깨어남)
+
+        samples = decode_samples(self.parser, chunk, self.port, timestamp)
+        if samples and not self.sensorInitted:
+            # 첫 데이터로 센서 위치 / 기준값 설정
+            self.sensorLoc = samples[0].getSensorLoc()
+            self.refValue = samples[0].distance
+            self.sensorInitted = True
+        return samples
+
+    def pause(self):
+        self.is_paused = True
+
+    def resume(self):
+        self.parser.reset()
+        self.is_paused = False
+
+    def close(self):
+        if self.serial is not None:
+            self.serial.close()
+
+
+class SerialSelectorReader:
+    """
+    모든 시리얼 포트를 스레드 하나에서 읽는 수집기
+
+    포트의 file descriptor를 selectors에 등록하고, 데이터가 들어온 포트만 읽어
+    파싱한 SensorData를 sink(SerialManager.try_sync)로 바로 전달 (중간 databuf Queue 없음)
+    센서 수와 관계없이 스레드는 하나이며, selectors가 file descriptor를 지원하는 POSIX에서만 동작
+    """
+
+    def __init__(self, ports, sink, baudrate=None, protocol=SERIAL_PROTOCOL.ASCII, onError=None):
+        self.sink = sink
+        self.onError = onError
+        self.ports = [SerialPort(port, baudrate, protocol) for port in ports]
+        self.selector = selectors.DefaultSelector()
+        self.is_running = False
+        self._thread = None
+
+    def open(self, init_timeout=5.0) -> list:
+        """
+        포트를 열고 각 포트의 첫 데이터(센서 위치)를 init_timeout 동안 기다림
+
+        Returns:
+            열린 SerialPort 목록
+        """
+        opened = []
+        for sport in self.ports:
+            try:
+                sport.open()
+            except Exception as e:
+                print(f"포트 {sport.port} 열기 실패: {e}")
+                self._error(f"port {sport.port} open fail: {e}")
+                continue
+            self.selector.register(sport.fileno(), selectors.EVENT_READ, sport)
+            opened.append(sport)
+        self.ports = opened
+
+        deadline = time.monotonic() + init_timeout
+        while not all(sport.sensorInitted for sport in self.ports):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for sport in self.ports:
+                    if not sport.sensorInitted:
+                        print(f"포트 {sport.port} 에서 데이터를 받지 못했습니다.")
+                break
+            self._poll(remaining)
+        return self.ports
+
+    def start(self):
+        self.is_running = True
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self.is_running:
+            self._poll(0.5)
+
+    def _poll(self, timeout):
+        for key, _ in self.selector.select(timeout):
+            sport = key.data
+            try:
+                samples = sport.read()
+            except (serial.SerialException, OSError) as e:
+                print('센서 연결 끊김', sport.port, e)
+                self._error(f"센서 연결 끊김 ({sport.port})")
+                self.selector.unregister(key.fd)
+                sport.close()
+                continue
+            for sdata in samples:
+                self.sink(sdata)
+
+    def _error(self, msg):
+        if self.onError is not None:
+            self.onError(msg)
+
+    def stop(self):
+        self.is_running = False
+        if self._thread is not None:
+            self._thread.join()
+        for sport in self.ports:
+            if not sport.is_open:
+                continue  # 연결이 끊겨 _poll에서 이미 닫은 포트
+            try:
+                self.selector.unregister(sport.fileno())
+            except (KeyError, ValueError, serial.SerialException):
+                pass
+            sport.close()
+        self.selector.close()
+
+
 class SerialManager(QObject):
     """
     ROS의 ApproximateTimeSynchronizer와 유사하게 4개의 센서에서 발생하는 데이터를 동기화
     동기화 알고리즘은 각 센서 버퍼에서 가장 오래된 메시지를 후보로 삼아,
     후보들 간의 타임스탬프 차이가 설정한 slop(초) 이하이면 동기화된 그룹으로 인정
     ndi동기화된 그룹은 self.cadate_window 변수에 저장됨
+    실제 매칭은 ApproximateTimeSynchronizer(synchronizer.py)가 수행
+    sync_mode=SYNC_MODE.INTERPOLATE면 InterpolatingSynchronizer가 sync_rate(Hz) 고정 주기로 보간한 프레임을 생성
+    adaptive_slop=True면 포트별 오프셋 / 지터를 추정하여 slop을 자동 조정 (max_slop 이하, 기본값은 slop)
+    동기화 상태(yield, 현재 slop 등)는 getSyncStats() 또는 syncStatsUpdated 시그널로 확인
+    (start_threads 이후 stats_interval 초마다 QTimer로 emit 하므로 데이터가 멈춰도 갱신됨)
     """
 
     errorSignal = pyqtSignal(str)  # Sensor에서 발생하는 에러 메시지를 main에 전송하기 위한 시그널
-    def __init__(self, debug_mode, slop=0.1, callback=None):
+    syncStatsUpdated = pyqtSignal(dict)  # getSyncStats() 결과
+    def __init__(self, debug_mode, slop=0.1, callback=None, event_driven=True,
+                 exper_buffer_size=256, exper_policy=OVERFLOW_POLICY.DROP_OLDEST,
+                 protocol=SERIAL_PROTOCOL.ASCII, baudrate=None, ingest=INGEST_MODE.THREADS,
+                 sync_mode=SYNC_MODE.APPROXIMATE, sync_rate=50.0,
+                 adaptive_slop=False, max_slop=None, stats_interval=1.0, dispatch_queue_size=1024):
         super().__init__()  # QObject상속을 위한 호출 (pyqtSignal사용을 위해 QObject상속)
         self.debug_mode = debug_mode
+        self.event_driven = event_driven  # False면 기존 10ms 폴링 방식 사용
+        self.protocol = protocol  # 센서 펌웨어의 전송 방식 (ASCII / BINARY)
+        self.baudrate = baudrate  # None이면 프로토콜별 기본값
+        self.ingest = ingest  # 센서 데이터 수집 방식 (debug_mode에서는 항상 THREADS)
+        self.reader = None  # INGEST_MODE.SELECTOR 일 때의 SerialSelectorReader
+        self.notifier = SensorNotifier()
         self.ports = get_arduino_ports(self.debug_mode)
-        self.slop = slop  # 초 단위 허용 오차
+        self.slop = slop  # 초 단위 허용 오차 (APPROXIMATE)
+        self.sync_mode = sync_mode
+        self.sync_rate = sync_rate  # 출력 프레임 주기 Hz (INTERPOLATE)
         self.callback = callback
-        self.buffers = {port: [] for port in self.ports}
+        self.adaptive_slop = adaptive_slop
+        self.max_slop = max_slop
+        self.synchronizer = self._createSynchronizer(self.ports)
+        self.stats_interval = stats_interval
+        self.statsTimer = QTimer(self)
+        self.statsTimer.timeout.connect(self.emitSyncStats)
         self.lock = Lock()
+        self.deliverLock = Lock()  # dispatcher의 프레임 전달 1회 동안 잡음 (remove_buffer가 진행 중인 전달을 기다림)
         self.candidate_window = {}  # 동기화된 그룹 저장
 
         # 각 포트별 스레드 생성 및 실행
@@ -239,25 +447,41 @@ class SerialManager(QObject):
 
         # 공유 큐들을 저장할 리스트
         self.algo_buffers = []  # 각 요소는 알고리즘에서 전달받은 Queue 객체
-        self.exper_buffer = Queue()
+        # GUI(Experiment)용 버퍼 - GUI가 늦어져도 exper_buffer_size 이상 쌓이지 않음
+        self.exper_buffer = FrameBuffer(maxsize=exper_buffer_size, policy=exper_policy)
+
+        # 동기화된 프레임의 전달(callback / 알고리즘 버퍼 / GUI 버퍼)은 별도 스레드에서 lock 없이 수행
+        self.dispatcher = FrameDispatcher(self._deliver, maxsize=dispatch_queue_size)
+        self.dispatcher.start()
 
+    # algo_buffers는 통째로 교체하므로 dispatcher 스레드는 동기화 lock 없이 현재 목록을 순회할 수 있음
     def add_buffer(self, buffer):
         with self.lock:
             if buffer not in self.algo_buffers:
-                self.algo_buffers.append(buffer)
+                self.algo_buffers = self.algo_buffers + [buffer]
 
     def remove_buffer(self, buffer):
         with self.lock:
             if buffer in self.algo_buffers:
-                self.algo_buffers.remove(buffer)
+                self.algo_buffers = [buf for buf in self.algo_buffers if buf is not buffer]
+        # 이전 목록으로 진행 중인 전달이 끝날 때까지 대기 -> 반환 후에는 buffer에 put 하지 않으므로 닫아도 안전
+        with self.deliverLock:
+            pass
 
     def start_threads(self):
+        self.statsTimer.start(round(self.stats_interval * 1000))
+        if self.ingest == INGEST_MODE.SELECTOR and not self.debug_mode:
+            self._start_reader()
+            return
+
         for port in self.ports:
             if self.debug_mode:
                 sensor = SensorVirtual(port)
             else:
-                sensor = Sensor(port)
+                sensor = Sensor(port, baudrate=self.baudrate, protocol=self.protocol)
             sensor.errorSignal.connect(self.hadleThreadSignal)  # 시그널과 연결될 함수
+            if self.event_driven:
+                sensor.setNotifier(self.notifier)
             sensor.start()
             self.sensors.append(sensor)
 
@@ -268,82 +492,99 @@ class SerialManager(QObject):
         self.poll_thread = Thread(target=self.poll_sensors, daemon=True)
         self.poll_thread.start()
 
+    def _start_reader(self):
+        # 스레드 하나가 모든 포트를 읽어 try_sync로 바로 전달 (Sensor 스레드 / poll 스레드 없음)
+        self.reader = SerialSelectorReader(self.ports, sink=self.try_sync, baudrate=self.baudrate,
+                                           protocol=self.protocol, onError=self.hadleThreadSignal)
+        self.sensors = self.reader.open()
+        self.sensors.sort(key=lambda s: s.sensorLoc.value)
+        opened = [sport.port for sport in self.reader.ports]
+        if opened != self.ports:
+            # 열지 못한 포트의 샘플을 기다리지 않도록 열린 포트만으로 동기화 엔진을 다시 만듦
+            with self.lock:
+                self.synchronizer = self._createSynchronizer(opened)
+        self.reader.start()
+
+    def _createSynchronizer(self, ports):
+        if self.sync_mode == SYNC_MODE.INTERPOLATE:
+            return InterpolatingSynchronizer(ports, rate=self.sync_rate)
+        return ApproximateTimeSynchronizer(ports, self.slop, adaptive=self.adaptive_slop, max_slop=self.max_slop)
+
     def hadleThreadSignal(self, massage):
         self.errorSignal.emit(massage)
 
-    def __insert_by_timestamp(self, buffer, sdata):
-        left, right = 0, len(buffer)
-        while left < right:
-            mid = (left + right) // 2
-            if buffer[mid].timestamp < sdata.timestamp:
-                left = mid + 1
-            else:
-                right = mid
-        buffer.insert(left, sdata)
-
     def poll_sensors(self):
         """
         각 센서 스레드의 databuf에서 데이터를 읽어
-        각 포트별 버퍼(self.buffers)에 저장하고 동기화를 시도합니다.
+        동기화 엔진에 전달하고 동기화를 시도합니다.
+        event_driven 모드에서는 센서의 알림이 올 때만 깨어납니다.
         """
         while True:
+            if self.event_driven:
+                self.notifier.wait(timeout=1.0)
             for sensor in self.sensors:
                 try:
                     while True:
                         sdata = sensor.databuf.get_nowait()  # sdata : SensorData 객체
-                        port = sdata.serial_port
-                        with self.lock:
-                            self.__insert_by_timestamp(self.buffers[port], sdata)
-                            # self.buffers[port].append(sdata)
-                            # self.buffers[port].sort(key=lambda x: x.timestamp)
-                        self.try_sync()
+                        self.try_sync(sdata)
                 except Empty:
                     pass
-            time.sleep(0.01)
+            if not self.event_driven:
+                time.sleep(0.01)
 
-    def try_sync(self):
+    def try_sync(self, sdata: SensorData):
         """
-        각 포트 버퍼의 가장 오래된 메시지를 후보로 선택하여,
-        후보들의 타임스탬프 차이가 slop 이하이면 동기화된 그룹으로 처리합니다.
+        샘플을 동기화 엔진에 넣고, 완성된 SensorFrame을 dispatcher에 넘깁니다.
+        소비자에게 전달하는 작업은 dispatcher 스레드에서 lock 밖에서 수행됩니다.
         """
         with self.lock:
-            if not all(self.buffers[port] for port in self.ports):
-                return
-
-            candidate_list = [self.buffers[port][0] for port in self.ports]
-            times = [obj.timestamp for obj in candidate_list]
-            min_time, max_time = min(times), max(times)
-
-            if (max_time - min_time).total_seconds() <= self.slop:
-                frame = SensorFrame(
-                    timestamp=max_time,  # 동기화 기준 시간
-                    sensors=candidate_list.copy()
-                )
-                self.candidate_window = candidate_list.copy()
-                for port in self.ports:
-                    self.buffers[port].pop(0)
-                if self.callback:
-                    self.callback(frame)
-                for buf in self.algo_buffers:
-                    buf.put(frame)
-                self.exper_buffer.put(frame)
-            else:
-                oldest_port = min(self.ports, key=lambda p: self.buffers[p][0].timestamp)
-                dropped = self.buffers[oldest_port].pop(0)
-                # print(f"[Dropped] Sensor {oldest_port} data {dropped} dropped")
+            frames = self.synchronizer.push(sdata)
+            if frames:
+                self.candidate_window = frames[-1].sensors.copy()
+                self.dispatcher.submit(frames)
+
+    def _deliver(self, frame: SensorFrame):
+        # dispatcher 스레드에서 호출됨
+        if self.callback:
+            self.callback(frame)
+        with self.deliverLock:
+            for buf in self.algo_buffers:
+                buf.put(frame)
+        self.exper_buffer.put(frame)
 
     def stop_threads(self):
-        for thread in self.sensors:
-            thread.stop()
+        self.statsTimer.stop()
+        if self.reader is not None:
+            self.reader.stop()
+        else:
+            for thread in self.sensors:
+                thread.stop()
+        self.dispatcher.stop(timeout=1.0)
+
+    def getBufferStats(self) -> dict:
+        """exper_buffer 상태 (size, received, dropped 등) - dropped가 늘면 GUI가 데이터를 따라가지 못하는 중"""
+        return self.exper_buffer.stats()
+
+    def getDispatchStats(self) -> dict:
+        """dispatcher 대기 큐 상태 - dropped가 늘면 소비자(callback / 알고리즘 버퍼 put)가 동기화 속도를 따라가지 못하는 중"""
+        return self.dispatcher.stats()
+
+    def getSyncStats(self) -> dict:
+        """동기화 결과 (생성된 프레임 수, 버려진 샘플 수, yield, 현재 slop 등 - synchronizer.stats() 참고)"""
+        with self.lock:
+            return self.synchronizer.stats()
+
+    def emitSyncStats(self):
+        self.syncStatsUpdated.emit(self.getSyncStats())
 
     def getSensors(self):
         return self.sensors
 
 def sync_callback(frame: SensorFrame):
     print("Synchronized group:")
-    print(f"\ntimestamp={frame.timestamp}, scenario={frame.get_scenario_name()}")
+    print(f"\ntimestamp={to_datetime(frame.timestamp)}, scenario={frame.get_scenario_name()}")
     for data in frame.sensors:
-        print(f"{data.serial_port}: (Timestamp: {data.timestamp}, location: {data.location.name}, value: {data.distance}, sub1: {data.intensity}, sub2: {data.temperature})")
+        print(f"{data.serial_port}: (Timestamp: {to_datetime(data.timestamp)}, location: {data.location.name}, value: {data.distance}, sub1: {data.intensity}, sub2: {data.temperature})")
     print("----")
 
 
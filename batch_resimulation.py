@@ -0,0 +1,184 @@
+"""
+여러 로그 파일 일괄 리시뮬레이션
+
+디렉토리 또는 glob 패턴에 해당하는 .bin 로그들을 CPU 수만큼의 워커 프로세스에 나누어 처리
+각 워커는 시작할 때 한 번만 알고리즘(모델)을 로드하고, 파일마다 resetAlgorithm()으로 세션 상태만 초기화
+결과는 파일/알고리즘별로 AlgorithmData가 채워진 SensorFrame 로그로 저장
+로그는 chunk 단위로 FrameBatch(배열)로 읽어 알고리즘에 batch_size씩 넘기므로 프레임마다 객체를 만들지 않음
+
+    python batch_resimulation.py log/ --algorithms COGMassEstimation MLPPredictor
+    python batch_resimulation.py "log/2025*.bin" --workers 8 --out log/resim
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import multiprocessing as mp
+from typing import List, Optional
+
+import numpy as np
+
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from datainfo import AlgorithmData
+from frame_batch import FrameBatch
+from frame_log import SensorFrameLog
+
+# 워커 프로세스별 알고리즘 인스턴스 (initializer에서 한 번만 생성)
+_algorithms = dict()
+_loadErrors = dict()  # 로드에 실패한 알고리즘 {이름: 오류}
+
+
+def find_log_files(source: str) -> List[str]:
+    """디렉토리면 그 안의 .bin 파일, 아니면 glob 패턴으로 파일 목록 반환"""
+    if os.path.isdir(source):
+        source = os.path.join(source, '*.bin')
+    return sorted(path for path in glob.glob(source) if os.path.isfile(path))
+
+
+def _init_worker(algoNames: List[str]):
+    # 워커 수만큼 프로세스가 뜨므로 TensorFlow 연산 스레드는 1개로 제한 (코어 과점유 방지)
+    os.environ.setdefault('TF_NUM_INTRAOP_THREADS', '1')
+    os.environ.setdefault('TF_NUM_INTEROP_THREADS', '1')
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+
+    for name in algoNames:
+        # initializer에서 예외가 나면 Pool이 워커를 계속 재생성하므로 오류는 기록만 하고 결과 요약으로 전달
+        try:
+            algorithm = ALGORITHM_TYPE.from_name(name).load_class()(name)
+            algorithm.initAlgorithm()
+            _algorithms[name] = algorithm
+        except Exception as e:
+            _loadErrors[name] = f'알고리즘 로드 실패: {e}'
+
+
+def _resimulate_file(task):
+    """워커에서 로그 파일 하나를 모든 알고리즘으로 처리하고 결과 요약을 반환"""
+    path, outDir, chunkSize = task
+    start = time.monotonic()
+    summary = {'file': path, 'frames': 0, 'results': dict(), 'errors': dict(_loadErrors), 'outputs': []}
+
+    log = SensorFrameLog(path)
+    try:
+        summary['frames'] = len(log)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for name, algorithm in _algorithms.items():
+            algorithm.resetAlgorithm()
+            outPath = os.path.join(outDir, f'{stem}_{name}.bin')
+            written = 0
+            try:
+                with open(outPath, 'wb') as f:
+                    for begin in range(0, len(log), chunkSize):
+                        batch = log.batch(begin, begin + chunkSize)
+                        results = []
+                        for offset in range(0, len(batch), algorithm.batch_size):
+                            # 슬라이스는 배열을 복사하지 않음
+                            results += algorithm.executeBatch(batch[offset:offset + algorithm.batch_size])
+                        written += _write_results(f, batch, results)
+            except Exception as e:
+                summary['errors'][name] = str(e)
+            summary['results'][name] = written
+            summary['outputs'].append(outPath)
+    finally:
+        log.close()
+
+    summary['elapsed'] = time.monotonic() - start
+    return summary
+
+
+def _write_results(f, batch: FrameBatch, results) -> int:
+    """batch의 프레임 순서대로 나온 결과를 AlgorithmData가 있는 프레임만 기록"""
+    valid = np.zeros(len(batch), dtype=bool)
+    for index, res in enumerate(results):
+        output = res.get('output') if isinstance(res, dict) else None
+        if not isinstance(output, AlgorithmData):
+            continue  # 오류 결과 등 AlgorithmData가 아닌 출력은 저장하지 않음
+        batch.set_algorithm(index, output)
+        valid[index] = True
+    f.write(batch.to_records()[valid].tobytes())
+    return int(valid.sum())
+
+
+class BatchResimulator:
+    """
+    로그 파일 목록을 프로세스 풀로 리시뮬레이션
+
+    spawn 방식 풀을 사용하므로 부모(GUI) 프로세스는 TensorFlow 등을 import 하지 않고,
+    각 워커는 initializer에서 모델을 한 번 로드한 뒤 여러 파일에 재사용함
+    """
+
+    def __init__(self, algorithms: List[ALGORITHM_TYPE], workers: Optional[int] = None,
+                 outDir: str = os.path.join('log', 'resim'), chunkSize: int = 4096):
+        self.algorithms = list(algorithms)
+        self.workers = workers or os.cpu_count() or 1
+        self.outDir = outDir
+        self.chunkSize = chunkSize
+        self.isStopped = False
+
+    def run(self, files: List[str], callback=None) -> List[dict]:
+        """
+        Args:
+            files: 처리할 로그 파일 목록
+            callback: 파일 하나가 끝날 때마다 (완료 수, 전체 수, 요약) 으로 호출
+
+        Returns:
+            파일별 결과 요약 목록 (완료 순서)
+        """
+        if not files or not self.algorithms:
+            return []
+        os.makedirs(self.outDir, exist_ok=True)
+
+        workers = min(self.workers, len(files))
+        names = [algo.name for algo in self.algorithms]
+        tasks = [(path, self.outDir, self.chunkSize) for path in files]
+        summaries = []
+
+        self.isStopped = False
+        ctx = mp.get_context('spawn')
+        with ctx.Pool(processes=workers, initializer=_init_worker, initargs=(names,)) as pool:
+            for summary in pool.imap_unordered(_resimulate_file, tasks):
+                summaries.append(summary)
+                if callback:
+                    callback(len(summaries), len(tasks), summary)
+                if self.isStopped:
+                    pool.terminate()
+                    break
+        return summaries
+
+    def stop(self):
+        self.isStopped = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='여러 로그 파일 일괄 리시뮬레이션')
+    parser.add_argument('source', help='로그 디렉토리 또는 glob 패턴 (예: "log/*.bin")')
+    parser.add_argument('--algorithms', nargs='+', default=[algo.name for algo in ALGORITHM_TYPE.list_all()])
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--out', default=os.path.join('log', 'resim'), help='결과 저장 디렉토리')
+    args = parser.parse_args(argv)
+
+    files = find_log_files(args.source)
+    if not files:
+        print(f'로그 파일이 없습니다: {args.source}')
+        return 1
+
+    algorithms = [ALGORITHM_TYPE.from_name(name) for name in args.algorithms]
+    resimulator = BatchResimulator(algorithms, workers=args.workers, outDir=args.out)
+    print(f'{len(files)} files, {len(algorithms)} algorithms, {min(resimulator.workers, len(files))} workers')
+
+    def report(done, total, summary):
+        results = ', '.join(f'{name}: {count}' for name, count in summary['results'].items())
+        print(f"[{done}/{total}] {summary['file']} ({summary['frames']} frames, {summary['elapsed']:.2f}s) {results}")
+        for name, error in summary['errors'].items():
+            print(f'    {name} 오류: {error}')
+
+    start = time.monotonic()
+    summaries = resimulator.run(files, callback=report)
+    elapsed = time.monotonic() - start
+    frames = sum(summary['frames'] for summary in summaries)
+    print(f'완료: {len(summaries)} files, {frames} frames, {elapsed:.2f}s ({frames / elapsed if elapsed > 0 else 0:.1f} frames/s)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,6 +9,7 @@ import time
 from collections import deque
 import csv
 from Algorithm.algorithmtype import ALGORITHM_TYPE
+from timebase import to_wall_seconds, from_wall_seconds, to_datetime
 
 
 class SENSORLOCATION(Enum):
@@ -25,7 +26,10 @@ class SENSORLOCATION(Enum):
 
 @dataclass
 class SensorData:
-    timestamp: datetime.datetime
+    # 샘플마다 생성되므로 __dict__ 없이 slot으로 저장 (대량 저장 / 전달은 frame_batch.FrameBatch 사용)
+    __slots__ = ('timestamp', 'serial_port', 'location', 'distance', 'intensity', 'temperature')
+
+    timestamp: int  # time.monotonic_ns() (파일에는 UNIX 시간(초)으로 저장)
     serial_port: str
     location: SENSORLOCATION
     distance: int
@@ -37,7 +41,7 @@ class SensorData:
     def pack(self) -> bytes:
         return struct.pack(
             self.STRUCT_FORMAT,
-            self.timestamp.timestamp(),
+            to_wall_seconds(self.timestamp),
             self.serial_port.encode('utf-8').ljust(16, b'\x00'),
             self.location.value,
             self.distance,
@@ -49,7 +53,7 @@ class SensorData:
     def unpack(cls, data: bytes) -> 'SensorData':
         ts, port_bytes, loc, distance, intensity, temperature = struct.unpack(cls.STRUCT_FORMAT, data)
         return cls(
-            timestamp=datetime.datetime.fromtimestamp(ts),
+            timestamp=from_wall_seconds(ts),
             serial_port=port_bytes.decode('utf-8').rstrip('\x00'),
             location=SENSORLOCATION.get_sensor_location(loc),
             distance=distance,
@@ -61,6 +65,29 @@ class SensorData:
     def get_total_size(cls):
         return struct.calcsize(cls.STRUCT_FORMAT)
 
+    def pack_into(self, buffer, offset: int):
+        struct.pack_into(
+            self.STRUCT_FORMAT, buffer, offset,
+            to_wall_seconds(self.timestamp),
+            self.serial_port.encode('utf-8'),
+            self.location.value,
+            self.distance,
+            self.intensity,
+            self.temperature
+        )
+
+    @classmethod
+    def unpack_from(cls, buffer, offset: int = 0) -> 'SensorData':
+        ts, port_bytes, loc, distance, intensity, temperature = struct.unpack_from(cls.STRUCT_FORMAT, buffer, offset)
+        return cls(
+            timestamp=from_wall_seconds(ts),
+            serial_port=port_bytes.decode('utf-8').rstrip('\x00'),
+            location=SENSORLOCATION.get_sensor_location(loc),
+            distance=distance,
+            intensity=intensity,
+            temperature=temperature
+        )
+
     def getSensorLoc(self):
         return self.location
 
@@ -86,6 +113,13 @@ class ExperimentData():
     def get_total_size(cls):
         return struct.calcsize(cls.STRUCT_FORMAT_EX)
 
+    def pack_into(self, buffer, offset: int):
+        struct.pack_into(self.STRUCT_FORMAT_EX, buffer, offset, *self.weights)
+
+    @classmethod
+    def unpack_from(cls, buffer, offset: int = 0) -> 'ExperimentData':
+        return cls(weights=list(struct.unpack_from(cls.STRUCT_FORMAT_EX, buffer, offset)))
+
 
 @dataclass
 class AlgorithmData():
@@ -113,6 +147,20 @@ class AlgorithmData():
     def get_total_size(cls):
         return struct.calcsize(cls.STRUCT_FORMAT_ALGO)
 
+    def pack_into(self, buffer, offset: int):
+        struct.pack_into(self.STRUCT_FORMAT_ALGO, buffer, offset,
+                         self.algo_type.value, self.predicted_weight, self.error, self.position)
+
+    @classmethod
+    def unpack_from(cls, buffer, offset: int = 0) -> 'AlgorithmData':
+        algotype, pred_weight, error, position = struct.unpack_from(cls.STRUCT_FORMAT_ALGO, buffer, offset)
+        return cls(
+            algo_type=ALGORITHM_TYPE.get_algorithmTypebyValue(algotype),
+            predicted_weight=pred_weight,
+            error=error,
+            position=position
+        )
+
 
 SCENARIO_TYPE_MAP = {
     1000: {
@@ -150,7 +198,10 @@ REVERSE_SCENARIO_DESC_MAP = {
 
 @dataclass
 class SensorFrame:
-    timestamp: datetime.datetime  # UNIX timestamp (int)
+    __slots__ = ('timestamp', 'sensors', 'scenario', 'NofExperiments', 'started', 'measured',
+                 'experiment', 'algorithms', 'isEoF')
+
+    timestamp: int  # time.monotonic_ns() (파일에는 UNIX 시간(초)으로 저장)
     sensors: List[SensorData]
     scenario: int  # Experiment Scenario
     NofExperiments: int
@@ -158,10 +209,10 @@ class SensorFrame:
     measured: bool  # 측정 시작 여부
     experiment: ExperimentData
     algorithms: AlgorithmData
-    isEoF: bool = False
+    isEoF: bool
 
     def __init__(self,
-                 timestamp: datetime.datetime,
+                 timestamp: int,
                  sensors: List[SensorData],
                  scenario: int = 1000,
                  NofExperiments: int = 0,
@@ -197,7 +248,7 @@ class SensorFrame:
     def pack(self) -> bytes:
         packed = struct.pack(
             self.STRUCT_HEADER_FORMAT,
-            self.timestamp.timestamp(),
+            to_wall_seconds(self.timestamp),
             self.scenario,
             self.NofExperiments,
             self.started,
@@ -222,7 +273,7 @@ class SensorFrame:
 
         algorithms = AlgorithmData.unpack(f.read(AlgorithmData.get_total_size()))
 
-        return cls(datetime.datetime.fromtimestamp(timestamp), sensors, scenario, NofExperiments, started, measured, experiment, algorithms)
+        return cls(from_wall_seconds(timestamp), sensors, scenario, NofExperiments, started, measured, experiment, algorithms)
 
 
 class SensorBinaryFileHandler:
@@ -249,6 +300,11 @@ class SensorBinaryFileHandler:
                 frames.append(frame)
         return frames
 
+    def load_mapped(self) -> 'SensorFrameLog':
+        """파일을 memory-map 한 SensorFrameLog 반환 (프레임 객체는 필요할 때만 생성)"""
+        from frame_log import SensorFrameLog
+        return SensorFrameLog(self.filename)
+
     def start_auto_save(self, interval: float = 1.0, meta: SensorFrame = None):
         if meta is not None:
             self._setMetaData(meta, self._metaData)
@@ -307,7 +363,7 @@ class SensorBinaryFileHandler:
 
             for frame in frames:
                 row = [
-                    frame.timestamp,
+                    to_datetime(frame.timestamp),
                     frame.scenario,
                     frame.NofExperiments,
                     frame.started,
@@ -366,6 +422,6 @@ if __name__ == '__main__':
     handler.export_to_csv('COGMassEstimation_center_concentrated_20250423.csv')
     # 출력
     for idx, f in enumerate(loaded_frames):
-        print(f"\n[Frame {idx}] timestamp={f.timestamp}, expStarted={f.started}, isMeasured={f.measured}, scenario={f.get_scenario_name()}, experiment={f.experiment}, algorithms={f.algorithms}")
+        print(f"\n[Frame {idx}] timestamp={to_datetime(f.timestamp)}, expStarted={f.started}, isMeasured={f.measured}, scenario={f.get_scenario_name()}, experiment={f.experiment}, algorithms={f.algorithms}")
         for s in f.sensors:
             print(f"  - {type(s).__name__} @ {s.timestamp} @ {s.serial_port} @ {s.location.name}")
@@ -4,16 +4,49 @@ import sys
 import struct
 from PyQt5.QtCore import *
 from PyQt5.QtWidgets import *
+import numpy as np
 import pyqtgraph as pg
-from collections import deque
 from GUIController import GUIController
 import traceback
 from datainfo import SENSORLOCATION
+from file_manager import BufferedRecordWriter
+from plot_buffer import SensorRingBuffer
+from timebase import NS_PER_SEC, NS_PER_MS, to_datetime, to_wall_ns, refresh_wall_offset
 from weight_action import WeightTable
 
+# 실험 데이터 레코드 (52 byte)
+# 시간(HHMMSSmmm), 9칸 무게, 무게 변화 방향, 센서 위치 이름, distance, intensity, temperature, 실험 상태
+EXPERIMENT_RECORD = struct.Struct('<I9hc16sfffc')
+
+
+def timestamp_to_int(timestamp: int) -> int:
+    # monotonic ns -> 로컬 시간 HHMMSSmmm, int(to_datetime(timestamp).strftime("%H%M%S%f")[:-3])와 같은 값
+    timestamp = to_datetime(timestamp)
+    return (timestamp.hour * 10000000 + timestamp.minute * 100000
+            + timestamp.second * 1000 + timestamp.microsecond // 1000)
+
+
+def timestamps_to_int(timestamps: np.ndarray) -> np.ndarray:
+    # SensorRingBuffer timestamp(monotonic ns) 배열을 timestamp_to_int와 같은 HHMMSSmmm 값으로 변환
+    # 로컬 시간대 오프셋은 첫 샘플과 마지막 샘플이 같으면 한 번만 계산하고,
+    # 배열 안에서 바뀌면(서머타임 전환) 샘플마다 timestamp_to_int로 변환
+    utc_offset = to_datetime(int(timestamps[0])).astimezone().utcoffset()
+    if to_datetime(int(timestamps[-1])).astimezone().utcoffset() != utc_offset:
+        return np.array([timestamp_to_int(timestamp) for timestamp in timestamps.tolist()], dtype=np.int64)
+    local_ns = to_wall_ns(timestamps) + int(utc_offset.total_seconds()) * NS_PER_SEC
+    ms_of_day = (local_ns % (86400 * NS_PER_SEC)) // 1000000
+    hour, rest = np.divmod(ms_of_day, 3600000)
+    minute, rest = np.divmod(rest, 60000)
+    return hour * 10000000 + minute * 100000 + rest
+
 
 class Experiment(QWidget):
-    def __init__(self, serial_manager, wt):
+    def __init__(self, serial_manager, wt, plot_history=300, save_capacity=20000):
+        """
+        Args:
+            plot_history: 그래프에 표시하는 포트별 샘플 수 (1만 개 이상도 가능)
+            save_capacity: 파일 기록용 포트별 버퍼 크기 (auto_save 주기(1초) 동안 들어오는 샘플 수보다 커야 함)
+        """
         super().__init__()
         # weigt Table
         self.weight_table = wt
@@ -32,6 +65,8 @@ class Experiment(QWidget):
         self.port_actual_distances = {}
         self.is_syncing = False
         self.current_filename = datetime.datetime.now().strftime("sensor_data_%Y-%m-%d-%H-%M.bin")
+        # 실험 데이터 파일 기록은 백그라운드 스레드에서 모아서 수행 (GUI 스레드에서 파일 open/close 하지 않음)
+        self.record_writer = BufferedRecordWriter(flush_size=64 * 1024, flush_interval=1.0, fsync=False)
         self.port_comboboxes = {}
         self.port_column_index = {}
         self.port_location = {}
@@ -44,9 +79,20 @@ class Experiment(QWidget):
             'etc': 'purple'
         }
         self.plot_curve = {}
-        self.plot_data = {}
+        self.plot_data = {}  # 포트별 SensorRingBuffer
         self.plot_curve_change = {}
-        self.plot_change = {}
+        self.plot_history = plot_history  # 그래프에 표시하는 포트별 샘플 수
+        self._plot_x = np.arange(self.plot_history)
+        self.plot_refresh_rate = 30  # 그래프 최대 갱신 횟수 (Hz), 그 사이에 들어온 프레임은 합쳐서 한 번에 그림
+        # 파일 기록은 그래프(plot_data)와 별도의 버퍼에서 읽음 (그래프 버퍼는 작아서 기록 전에 덮어쓰일 수 있음)
+        self.save_capacity = save_capacity
+        self.save_data = {}  # 포트별 SensorRingBuffer (실험 파일 / raw_data 기록용)
+        self.recorded_until = {}  # 실험 파일에 포트별로 기록한 샘플 수 (save_data total 기준 high-water mark)
+        self.raw_data_path = None  # auto_save가 기록 중인 raw_data 파일
+        self.saved_until = {}  # auto_save가 포트별로 저장한 샘플 수 (save_data total 기준 high-water mark)
+        self.samples_lost = 0  # 기록 전에 save_data에서 덮어쓰여 저장하지 못한 샘플 수
+        self.samples_lost_reported = 0  # 마지막으로 알린 samples_lost
+        self._save_buffer = bytearray()  # auto_save용 레코드 버퍼 (재사용)
 
         # 정렬된 ports 사용
         self.ports = [sensor.port for sensor in self.serial_manager.sensors]
@@ -66,6 +112,12 @@ class Experiment(QWidget):
         self.auto_save_timer.timeout.connect(self.auto_save)
         self.auto_save_timer.start(1000)
 
+        self.exper_dropped = 0  # 마지막으로 확인한 exper_buffer dropped 수
+        self.dispatch_dropped = 0  # 마지막으로 확인한 dispatcher dropped 수
+        self.record_dropped = 0  # 마지막으로 확인한 record_writer dropped 수
+        self.auto_save_timer.timeout.connect(self.check_buffer_overflow)
+        self.serial_manager.syncStatsUpdated.connect(self.show_sync_stats)
+
     def add_subscriber(self, subscriber):
         self.subscribers.append(subscriber)
 
@@ -186,6 +238,8 @@ class Experiment(QWidget):
         self.weight_position = QLabel("Weight position")
         self.weight_position_output = QLabel("-")
 
+        self.sync_stats_label = QLabel("Sync: -")  # SerialManager.syncStatsUpdated로 갱신
+
         weather_text = QLabel("Weather:")
         weather = QLineEdit()
         weather.returnPressed.connect(lambda name='weather', input=weather: self.enter_update(name, input))
@@ -337,8 +391,8 @@ class Experiment(QWidget):
             if port in self.plot_data:
                 continue
 
-            self.plot_data[port] = deque(maxlen=300)
-            self.plot_change[port] = deque(maxlen=300)
+            self.plot_data[port] = SensorRingBuffer(self.plot_history)
+            self.save_data[port] = SensorRingBuffer(self.save_capacity)
 
             # 기본 색상 설정
             default_color = 'gray'
@@ -361,7 +415,7 @@ class Experiment(QWidget):
     def startGUIThread(self):
         print('start GUIThread')
         # 쓰레드에 SerialManager의 쓰레드도 전달
-        self.GUIThread = GUIController(self, self.serial_manager)
+        self.GUIThread = GUIController(self, self.serial_manager, refresh_rate=self.plot_refresh_rate)
         self.GUIThread.plot_updated.connect(self.updateGraph)
         self.GUIThread.start()
 
@@ -377,8 +431,8 @@ class Experiment(QWidget):
             for port in ports_to_update:
                 # 포트가 plot_data에 초기화되어 있지 않으면 초기화
                 if port not in self.plot_data:
-                    self.plot_data[port] = deque(maxlen=300)
-                    self.plot_change[port] = deque(maxlen=300)
+                    self.plot_data[port] = SensorRingBuffer(self.plot_history)
+                    self.save_data[port] = SensorRingBuffer(self.save_capacity)
 
                     # 그래프 요소도 없으면 초기화
                     if port not in self.plot_curve:
@@ -403,78 +457,65 @@ class Experiment(QWidget):
                     continue
 
                 # 데이터가 없으면 그래프 업데이트 건너뛰기
-                if not self.plot_data[port] or len(self.plot_data[port]) == 0:
+                y_values = self.plot_data[port].view('distance')
+                if len(y_values) == 0:
+                    continue
+
+                # 변화량 = 거리값 - 입력한 실제 거리 (입력이 없으면 0)
+                base_input = self.port_actual_distances.get(port)
+                base_val = 0 if base_input is None else float(base_input)
+                change_values = y_values - base_val
+
+                # X축 - 시간에 따른 인덱스
+                x = self._plot_x[:len(y_values)]
+                self.plot_curve[port].setData(x, y_values)
+                self.plot_curve_change[port].setData(x, change_values)
+
+            # 실험 중일 때만 데이터 처리 및 테이블 업데이트
+            # 그래프는 refresh_rate로 합쳐서 그리지만 파일에는 마지막 갱신 이후의 샘플을 모두 기록
+            for p in self.ports:
+                if p not in self.save_data:
+                    continue
+                timestamps, values = self._samplesSince(p, self.recorded_until)
+                if not self.is_experiment_active or len(timestamps) == 0:
                     continue
+                if p in self.port_index:
+                    val = float(values[0, -1])
+                    self.sensor_table.setItem(0, self.port_index[p], QTableWidgetItem(str(val)))
 
-                # X축 데이터 생성 - 시간에 따른 인덱스
-                x = list(range(len(self.plot_data[port])))
-
-                # Y축 데이터 추출 - 안전 처리
-                y_values = []
-                for point in self.plot_data[port]:
-                    try:
-                        y_value = float(point.distance)
-                        y_values.append(y_value)
-                    except (ValueError, AttributeError):
-                        y_values.append(0)
-
-                # 변화량 데이터 계산
-                change_values = []
-                if len(self.plot_change[port]) > 0:
-                    base_val = None
-                    for point in self.plot_change[port]:
-                        try:
-                            base_val = float(point.distance)
-                            break
-                        except (ValueError, AttributeError):
-                            pass
-
-                    base_input = self.port_actual_distances.get(port)
-                    if base_input is None:
-                        base_val = 0
-                    else:
-                        base_val = float(base_input)
-
-                    for point in self.plot_change[port]:
-                        try:
-                            value = float(point.distance)
-                            change_values.append(value - base_val)
-                        except (ValueError, AttributeError):
-                            change_values.append(0)
-
-                # 데이터가 준비되면 그래프 업데이트
-                if len(y_values) > 0 and len(x) == len(y_values):
-                    self.plot_curve[port].setData(x, y_values)
-
-                if len(change_values) > 0 and len(x) == len(change_values):
-                    self.plot_curve_change[port].setData(x, change_values)
-
-                # 실험 중일 때만 데이터 처리 및 테이블 업데이트
-                if self.is_experiment_active:
-                    for p in self.ports:
-                        val = float(self.plot_data[p][-1].distance)
-                        col = self.port_index[p]
-                        self.sensor_table.setItem(0, col, QTableWidgetItem(str(val)))
-
-                        # 데이터 저장 처리
-                        self.handle_serial_data(p, self.plot_data[p])
+                # 데이터 저장 처리
+                self.handle_serial_data(p, timestamps, values)
         except Exception as e:
             print(f"그래프 업데이트 중 오류 발생: {e}")
             traceback.print_exc()
 
-    def handle_serial_data(self, port, data):
+    def _samplesSince(self, port, marks):
+        """
+        save_data[port]에서 marks[port] 이후에 추가된 샘플을 꺼내고 marks를 갱신
+        기록하기 전에 덮어쓰인 샘플 수는 samples_lost에 더함
+        """
+        start = marks.get(port, 0)
+        timestamps, values, total = self.save_data[port].since(start)
+        marks[port] = total
+        self.samples_lost += total - start - len(timestamps)
+        return timestamps, values
+
+    def handle_serial_data(self, port, timestamps, values):
+        """
+        포트 하나의 새 샘플을 실험 파일에 기록
+
+        Args:
+            timestamps: (N,) monotonic ns
+            values: (3, N) distance, intensity, temperature
+        """
         if port not in self.port_index:
             return
 
-        # data가 비어있는지 확인
-        if not data:
-            # 디버그 수준을 낮추기 위해 경고 출력 생략
-            # print(f"[정보] {port}에 대한 데이터가 아직 없습니다.")
+        # 데이터가 없는지 확인
+        if len(timestamps) == 0:
             return
 
-        os.makedirs("log", exist_ok=True)
-        filename = self.current_filename
-        file_path = os.path.join("log", filename)
+        file_path = os.path.join("log", self.current_filename)
 
         # 무게 변화 방향
         total = sum(self.weight_a)
@@ -491,33 +532,15 @@ class Experiment(QWidget):
         state_flag = b'f' if self.is_paused_global else b't'
         name = self.port_comboboxes[port].currentText()
 
-        # data 가 deque 면 list 로 변환
-        if isinstance(data, deque):
-            data = list(data)
-        if not isinstance(data, list) or len(data) < 1:
-            print(f"[경고] 예상치 못한 데이터 형식 또는 길이 부족: {data}")
-            return
         try:
-            latest_point = data[-1]
-
-            timestamp_str = latest_point.timestamp.strftime("%H%M%S%f")[:-3]
-            timestamp_int = int(timestamp_str)
-
-            value1 = float(latest_point.distance)
-            value2 = float(latest_point.intensity)
-            value3 = float(latest_point.temperature)
-
             weights = self.get_weights_from_table()
+            name = name.encode('utf-8')[:16]
 
-            # weight_bin = struct.pack('<9h', *self.weight_a)
-            weight_bin = struct.pack('<9h', *weights)
-            name_bytes = name.encode('utf-8')[:16]
-            name_bin = name_bytes + b'\x00' * (16 - len(name_bytes))
-            values_bin = struct.pack('<fff', value1, value2, value3)
-            record = struct.pack('<I', timestamp_int) + weight_bin + direction_byte + name_bin + values_bin + state_flag
-
-            with open(file_path, 'ab') as f:
-                f.write(record)
+            for timestamp_int, (value1, value2, value3) in zip(timestamps_to_int(timestamps).tolist(),
+                                                                values.T.tolist()):
+                record = EXPERIMENT_RECORD.pack(timestamp_int, *weights, direction_byte, name,
+                                                value1, value2, value3, state_flag)
+                self.record_writer.write(file_path, record)
         except Exception as e:
             print(f"[오류] 데이터 처리 중 예외 발생: {e}")
 
@@ -547,6 +570,7 @@ class Experiment(QWidget):
                     self.is_experiment_active = False
                     self.is_paused_global = True
                     self.stop_btn.setText("실험 시작")
+                    self.record_writer.flush()  # 실험 종료 시점까지의 데이터는 디스크에 반영
 
             countdown()  # 카운트다운 시작
             QCoreApplication.processEvents()
@@ -554,6 +578,7 @@ class Experiment(QWidget):
             self.is_experiment_active = False
             self.is_paused_global = True
             self.stop_btn.setText("실험 시작")
+            self.record_writer.flush()
 
     def set_weight(self, weight_a):
         if self.is_syncing:
@@ -578,58 +603,103 @@ class Experiment(QWidget):
         self.weight_table.blockSignals(False)
 
         self.current_filename = datetime.datetime.now().strftime("sensor_data_%Y-%m-%d-%H-%M.bin")
+        self.refresh_time_base()
         self.weight_update_text()
 
+    def refresh_time_base(self):
+        # 새 파일을 만들 때 벽시계 오프셋을 다시 측정 (NTP 보정 / 시계 변경이 기록 시각에 쌓이지 않도록)
+        change = refresh_wall_offset()
+        if abs(change) >= NS_PER_MS:
+            print(f"[시간] 벽시계 오프셋 {change / NS_PER_MS:+.1f} ms 보정")
+
+    def check_buffer_overflow(self):
+        # GUI가 센서 데이터를 따라가지 못해 exper_buffer에서 버려진 프레임이 있으면 알림
+        stats = self.serial_manager.getBufferStats()
+        if stats['dropped'] > self.exper_dropped:
+            print(f"[경고] 화면 갱신 지연 - 버려진 프레임 {stats['dropped'] - self.exper_dropped}개 "
+                  f"(누적 {stats['dropped']}/{stats['received']}, 정책 {stats['policy']})")
+            self.exper_dropped = stats['dropped']
+
+        # 소비자 전달이 늦어 dispatcher 대기 큐에서 버려진 프레임
+        stats = self.serial_manager.getDispatchStats()
+        if stats['dropped'] > self.dispatch_dropped:
+            print(f"[경고] 프레임 전달 지연 - 버려진 프레임 {stats['dropped'] - self.dispatch_dropped}개 "
+                  f"(누적 {stats['dropped']}/{stats['submitted']})")
+            self.dispatch_dropped = stats['dropped']
+
+        # 디스크 오류 등으로 파일에 기록하지 못한 레코드
+        stats = self.record_writer.stats()
+        if stats['dropped'] > self.record_dropped:
+            print(f"[경고] 파일 기록 실패 - 버려진 레코드 {stats['dropped'] - self.record_dropped}개 "
+                  f"(누적 {stats['dropped']}, 기록 {stats['written']})")
+            self.record_dropped = stats['dropped']
+
+        # 기록 주기 동안 save_capacity보다 많은 샘플이 들어와 저장하지 못한 샘플
+        if self.samples_lost > self.samples_lost_reported:
+            print(f"[경고] 기록 버퍼 초과 - 저장하지 못한 샘플 {self.samples_lost - self.samples_lost_reported}개 "
+                  f"(누적 {self.samples_lost}, 버퍼 {self.save_capacity})")
+            self.samples_lost_reported = self.samples_lost
+
+    def show_sync_stats(self, stats):
+        # 동기화 상태 표시 (SerialManager가 stats_interval 초마다 전달)
+        text = (f"Sync {stats['mode']}: frames {stats['matched']}, dropped {stats['dropped']}, "
+                f"pending {stats['pending']}")
+        if 'yield' in stats:
+            text += f", yield {stats['yield'] * 100:.1f}%"
+        if 'slop' in stats:
+            text += f", slop {stats['slop'] * 1000:.1f} ms"
+        self.sync_stats_label.setText(text)
+
     def auto_save(self):
-        os.makedirs("log", exist_ok=True)
-        filename = datetime.datetime.now().strftime("raw_data_%Y-%m-%d.bin")
-        file_path = os.path.join("log", filename)
-        with open(file_path, "ab") as f:
-            for port in self.ports:
-                if port not in self.port_index:
-                    continue
+        """
+        save_data에 새로 들어온 샘플만 raw_data 파일에 추가 (샘플마다 한 번씩만 저장)
+        포트별로 저장한 샘플 수 이후의 샘플을 재사용 버퍼에 pack_into 한 뒤 writer로 전달
+        """
+        file_path = os.path.join("log", datetime.datetime.now().strftime("raw_data_%Y-%m-%d.bin"))
+        if file_path != self.raw_data_path:
+            # 날짜가 바뀌어 새 파일에 기록
+            self.raw_data_path = file_path
+            self.refresh_time_base()
 
-                data = list(self.plot_data.get(port, []))
-                if not data:
-                    continue
+        state_flag = b'f' if self.is_paused_global else b't'
+        total = sum(self.weight_a)
+        if total > self.weight_total:
+            self.last_direction = 'U'
+        elif total < self.weight_total:
+            self.last_direction = 'D'
+        direction = self.last_direction.encode() if isinstance(self.last_direction, str) else b'N'
+        self.weight_total = total
+        weights = self.weight_a
 
-                name = self.port_location.get(port, port)
-                state_flag = b'f' if self.is_paused_global else b't'
+        offset = 0
+        for port in self.ports:
+            if port not in self.port_index or port not in self.save_data:
+                continue
 
-                total = sum(self.weight_a)
-                if total > self.weight_total:
-                    direction = b'U'
-                    self.last_direction = 'U'
-                elif total < self.weight_total:
-                    direction = b'D'
-                    self.last_direction = 'D'
-                else:
-                    direction = self.last_direction.encode() if isinstance(self.last_direction, str) else b'N'
-                self.weight_total = total
-
-                for point in data:
-                    try:
-                        timestamp_str = point.timestamp.strftime("%H%M%S%f")[:-3]
-                        timestamp_int = int(timestamp_str)
-
-                        value1 = float(point.distance)
-                        value2 = float(point.intensity)
-                        value3 = float(point.temperature)
-
-                        weight_data = struct.pack('<9h', *self.weight_a)
-                        name_bytes = name.encode('utf-8')[:16]
-                        name_data = name_bytes + b'\x00' * (16 - len(name_bytes))
-                        values_data = struct.pack('<fff', value1, value2, value3)
-
-                        binary_data = (
-                                struct.pack('<I', timestamp_int)
-                                + weight_data + direction + name_data
-                                + values_data + state_flag
-                        )
-                        f.write(binary_data)
-                    except Exception as e:
-                        print(f"[auto_save 오류] {e}")
-                        continue
+            # 마지막 저장 이후에 추가된 샘플만 선택
+            timestamps, values = self._samplesSince(port, self.saved_until)
+            if len(timestamps) == 0:
+                continue
+
+            end = offset + EXPERIMENT_RECORD.size * len(timestamps)
+            if len(self._save_buffer) < end:
+                self._save_buffer.extend(bytes(end - len(self._save_buffer)))
+
+            name = self.port_location.get(port, port).encode('utf-8')[:16]
+            for timestamp, (distance, intensity, temperature) in zip(timestamps_to_int(timestamps).tolist(),
+                                                                    values.T.tolist()):
+                try:
+                    EXPERIMENT_RECORD.pack_into(
+                        self._save_buffer, offset,
+                        timestamp, *weights, direction, name, distance, intensity, temperature, state_flag
+                    )
+                    offset += EXPERIMENT_RECORD.size
+                except Exception as e:
+                    print(f"[auto_save 오류] {e}")
+                    continue
+
+        if offset:
+            self.record_writer.write(file_path, bytes(memoryview(self._save_buffer)[:offset]))
 
     def setup(self):
         # 그래프 최대·최소 입력창 레이아웃
@@ -646,6 +716,7 @@ class Experiment(QWidget):
         setting_layout.addLayout(graph_max_layout)
         setting_layout.addLayout(graph_min_layout)
         setting_layout.addLayout(self.port_label_layout)
+        setting_layout.addWidget(self.sync_stats_label)
 
         # weight_table 옆에 들어갈 + / – 버튼 레이아웃
         weight_input_layout2 = QHBoxLayout()
@@ -1,4 +1,7 @@
 import os
+import atexit
+import threading
+from collections import OrderedDict
 from enum import Enum
 
 from datainfo import SensorData, SENSORLOCATION
@@ -21,3 +24,150 @@ class AlgorithmFileManager():
             full_path = os.path.join(folder, file_name)
             self.files[file_name] = full_path
         return self.files
+
+
+class BufferedRecordWriter:
+    """
+    바이너리 레코드를 백그라운드 스레드에서 파일에 기록하는 writer
+
+    GUI 스레드는 write()로 레코드를 큐에 넣기만 하고,
+    writer 스레드가 파일을 열어둔 채 모아서 한 번에 기록함
+    - flush_size   : 쌓인 데이터가 이 크기(byte) 이상이면 기록
+    - flush_interval : 마지막 기록 후 이 시간(초)이 지나면 기록
+    - fsync        : True면 기록할 때마다 os.fsync까지 수행 (디스크 반영 보장)
+    - max_open     : 열어두는 파일 수, 넘으면 가장 오래 쓰지 않은 파일을 닫음 (파일명이 날짜/시간으로 바뀌어도 fd가 쌓이지 않음)
+    실험 종료 등 반드시 디스크에 남아야 하는 시점에는 flush()를 호출
+    기록에 실패(OSError)한 레코드는 버려지며 dropped / stats()로 확인
+    """
+
+    def __init__(self, flush_size: int = 64 * 1024, flush_interval: float = 1.0, fsync: bool = False,
+                 max_open: int = 2):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_open = max(1, max_open)
+
+        self._cond = threading.Condition()
+        self._pending = []  # (파일 경로, 레코드)
+        self._pendingSize = 0
+        self._flushRequests = 0  # 요청된 flush 수
+        self._flushed = 0  # 완료된 flush 수
+        self._files = OrderedDict()  # 열어둔 파일 {경로: 파일 객체} (최근에 쓴 파일이 뒤)
+        self._running = True
+        self.written = 0  # 기록한 레코드 수
+        self.dropped = 0  # 기록에 실패해 버려진 레코드 수
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, path: str, record: bytes):
+        with self._cond:
+            if not self._running:
+                return
+            self._pending.append((path, record))
+            self._pendingSize += len(record)
+            if self._pendingSize >= self.flush_size:
+                self._cond.notify()
+
+    def flush(self, wait: bool = False, timeout: float = None):
+        """
+        지금까지 write 된 레코드를 기록하도록 요청
+        wait=True면 기록이 끝날 때까지 대기 (GUI 스레드에서는 wait=False 권장)
+        """
+        with self._cond:
+            self._flushRequests += 1
+            target = self._flushRequests
+            self._cond.notify()
+            if wait:
+                self._cond.wait_for(lambda: self._flushed >= target or not self._thread.is_alive(), timeout)
+
+    def close(self):
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: not self._running or self._pendingSize >= self.flush_size
+                                    or self._flushRequests > self._flushed, self.flush_interval)
+                pending, self._pending = self._pending, []
+                self._pendingSize = 0
+                requests = self._flushRequests
+                running = self._running
+
+            self._writePending(pending, sync=self.fsync or requests > self._flushed or not running)
+
+            with self._cond:
+                self._flushed = requests
+                self._cond.notify_all()
+            if not running:
+                break
+
+        while self._files:
+            self._closeFile(*self._files.popitem(last=False), sync=False)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'pending': len(self._pending),
+                'written': self.written,
+                'dropped': self.dropped,
+                'open': list(self._files)
+            }
+
+    def _writePending(self, pending, sync: bool):
+        # 파일별로 묶어서 한 번에 write
+        chunks = dict()
+        for path, record in pending:
+            chunk = chunks.setdefault(path, [bytearray(), 0])
+            chunk[0].extend(record)
+            chunk[1] += 1
+
+        for path, (chunk, count) in chunks.items():
+            try:
+                f = self._open(path)
+                f.write(chunk)
+                self.written += count
+            except OSError as e:
+                self.dropped += count
+                print(f"[BufferedRecordWriter 오류] {path}: {e} (레코드 {count}개 버림, 누적 {self.dropped})")
+                f = self._files.pop(path, None)
+                if f is not None:
+                    self._closeFile(path, f, sync=False)
+
+        for path, f in list(self._files.items()):
+            try:
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"[BufferedRecordWriter 오류] {path}: {e}")
+
+    def _open(self, path):
+        f = self._files.get(path)
+        if f is not None:
+            self._files.move_to_end(path)
+            return f
+
+        # 더 이상 쓰지 않는 파일(이전 날짜 / 시간의 파일)부터 닫음
+        while len(self._files) >= self.max_open:
+            self._closeFile(*self._files.popitem(last=False), sync=True)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        f = self._files[path] = open(path, 'ab')
+        return f
+
+    def _closeFile(self, path, f, sync: bool):
+        try:
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+            f.close()
+        except OSError as e:
+            print(f"[BufferedRecordWriter 오류] {path}: {e}")
@@ -0,0 +1,290 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from datainfo import (SensorData, SensorFrame, ExperimentData, AlgorithmData, SENSORLOCATION,
+                      SCENARIO_TYPE_MAP)
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from frame_log import FRAME_DTYPE
+import timebase
+from timebase import NS_PER_SEC
+
+
+class FrameBatch:
+    """
+    N개의 SensorFrame을 열(column)별 연속 NumPy 배열로 저장하는 묶음
+
+    프레임 / 센서마다 객체를 만들지 않으므로 kHz 수집에서도 할당이 거의 없고,
+    pickle 시 배열 몇 개만 직렬화되므로 프로세스 간 전달 비용이 작음
+    센서 열(column) 순서는 모든 프레임에서 같아야 함 (SerialManager의 동기화 결과는 항상 포트 순서)
+
+    배열 (N: 프레임 수, S: 센서 수)
+        timestamps          (N,)      int64   monotonic ns
+        scenario            (N,)      uint16
+        NofExperiments      (N,)      uint16
+        started, measured   (N,)      bool
+        sensor_timestamps   (N, S)    int64   monotonic ns
+        locations           (N, S)    uint8   SENSORLOCATION 값
+        readings            (N, S, 3) uint16  distance, intensity, temperature
+        weights             (N, 9)    uint16  ExperimentData.weights (has_experiment가 False면 0)
+        algorithms          (N, 4)    uint16  algo_type, predicted_weight, error, position (has_algorithm가 False면 0)
+
+    batch[i]는 기존 SensorFrame 접근자(get_sensor_data, get_scenario_name, pack ...)를 제공하는 FrameView,
+    batch[i:j]는 배열을 복사하지 않는 FrameBatch
+    """
+
+    COLUMNS = {'distance': 0, 'intensity': 1, 'temperature': 2}
+    _ARRAYS = ('timestamps', 'scenario', 'NofExperiments', 'started', 'measured',
+               'sensor_timestamps', 'locations', 'readings',
+               'weights', 'has_experiment', 'algorithms', 'has_algorithm')
+
+    def __init__(self, ports: Sequence[str], size: int = 0):
+        self.ports: Tuple[str, ...] = tuple(ports)
+        nsensors = len(self.ports)
+        self.timestamps = np.zeros(size, dtype=np.int64)
+        self.scenario = np.full(size, 1000, dtype=np.uint16)
+        self.NofExperiments = np.zeros(size, dtype=np.uint16)
+        self.started = np.zeros(size, dtype=bool)
+        self.measured = np.zeros(size, dtype=bool)
+        self.sensor_timestamps = np.zeros((size, nsensors), dtype=np.int64)
+        self.locations = np.zeros((size, nsensors), dtype=np.uint8)
+        self.readings = np.zeros((size, nsensors, len(self.COLUMNS)), dtype=np.uint16)
+        self.weights = np.zeros((size, 9), dtype=np.uint16)
+        self.has_experiment = np.zeros(size, dtype=bool)
+        self.algorithms = np.zeros((size, 4), dtype=np.uint16)
+        self.has_algorithm = np.zeros(size, dtype=bool)
+
+    @classmethod
+    def from_frames(cls, frames: Sequence[SensorFrame]) -> 'FrameBatch':
+        if not frames:
+            raise ValueError("빈 프레임 목록으로 FrameBatch를 만들 수 없습니다")
+        ports = tuple(sensor.serial_port for sensor in frames[0].sensors)
+        for frame in frames:
+            if frame.isEoF or frame.sensors is None:
+                raise ValueError("EoF 프레임은 FrameBatch에 넣을 수 없습니다")
+            if tuple(sensor.serial_port for sensor in frame.sensors) != ports:
+                raise ValueError(f"센서 포트 순서가 다른 프레임이 있습니다: {ports}")
+
+        batch = cls(ports)
+        batch.timestamps = np.array([frame.timestamp for frame in frames], dtype=np.int64)
+        batch.scenario = np.array([frame.scenario for frame in frames], dtype=np.uint16)
+        batch.NofExperiments = np.array([frame.NofExperiments for frame in frames], dtype=np.uint16)
+        batch.started = np.array([frame.started for frame in frames], dtype=bool)
+        batch.measured = np.array([frame.measured for frame in frames], dtype=bool)
+
+        sensors = [sensor for frame in frames for sensor in frame.sensors]
+        shape = (len(frames), len(ports))
+        batch.sensor_timestamps = np.array([s.timestamp for s in sensors], dtype=np.int64).reshape(shape)
+        batch.locations = np.array([s.location.value for s in sensors], dtype=np.uint8).reshape(shape)
+        batch.readings = np.array([(s.distance, s.intensity, s.temperature) for s in sensors],
+                                  dtype=np.uint16).reshape(shape + (len(cls.COLUMNS),))
+
+        batch.has_experiment = np.array([frame.experiment is not None for frame in frames], dtype=bool)
+        batch.weights = np.array([frame.experiment.weights if frame.experiment is not None else [0] * 9
+                                  for frame in frames], dtype=np.uint16)
+        batch.has_algorithm = np.array([frame.algorithms is not None for frame in frames], dtype=bool)
+        batch.algorithms = np.array([(a.algo_type.value, a.predicted_weight, a.error, a.position)
+                                     if a is not None else (0, 0, 0, 0)
+                                     for a in (frame.algorithms for frame in frames)], dtype=np.uint16)
+        return batch
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> 'FrameBatch':
+        """SensorFrameLog.records (FRAME_DTYPE) 구간을 FrameBatch로 변환 (포트 이름은 첫 레코드 기준)"""
+        if len(records) == 0:
+            raise ValueError("빈 레코드로 FrameBatch를 만들 수 없습니다")
+        sensors = records['sensors']
+        ports = [port.decode('utf-8').rstrip('\x00') for port in sensors['serial_port'][0]]
+
+        batch = cls(ports)
+        batch.timestamps = _from_wall_seconds(records['timestamp'])
+        batch.scenario = records['scenario'].astype(np.uint16)
+        batch.NofExperiments = records['NofExperiments'].astype(np.uint16)
+        batch.started = records['started'].astype(bool)
+        batch.measured = records['measured'].astype(bool)
+        batch.sensor_timestamps = _from_wall_seconds(sensors['timestamp'])
+        batch.locations = sensors['location'].astype(np.uint8)
+        batch.readings = np.stack([sensors[name] for name in cls.COLUMNS], axis=-1).astype(np.uint16)
+        # 파일에는 항상 실험 / 알고리즘 데이터가 기록되어 있음
+        batch.weights = records['experiment']['weights'].astype(np.uint16)
+        batch.has_experiment = np.ones(len(records), dtype=bool)
+        algo = records['algorithms']
+        batch.algorithms = np.stack([algo['algo_type'], algo['predicted_weight'], algo['error'], algo['position']],
+                                    axis=-1).astype(np.uint16)
+        batch.has_algorithm = np.ones(len(records), dtype=bool)
+        return batch
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def nsensors(self) -> int:
+        return len(self.ports)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            batch = FrameBatch.__new__(FrameBatch)
+            batch.ports = self.ports
+            for name in self._ARRAYS:
+                setattr(batch, name, getattr(self, name)[index])
+            return batch
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return FrameView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield FrameView(self, index)
+
+    @property
+    def distance(self) -> np.ndarray:
+        """(N, S) 거리값 view"""
+        return self.readings[..., 0]
+
+    @property
+    def intensity(self) -> np.ndarray:
+        return self.readings[..., 1]
+
+    @property
+    def temperature(self) -> np.ndarray:
+        return self.readings[..., 2]
+
+    def distances(self, locations: Sequence[SENSORLOCATION]) -> np.ndarray:
+        """(N, len(locations)) 위치 순서의 거리값 (FrameView.get_sensor_data와 같이 센서 열 = SENSORLOCATION 값)"""
+        return self.readings[:, [location.value for location in locations], 0]
+
+    def set_algorithm(self, index: int, algorithm: AlgorithmData):
+        """index 프레임의 알고리즘 결과 설정 (SensorFrame.algorithms 대입에 해당)"""
+        self.algorithms[index] = (algorithm.algo_type.value, algorithm.predicted_weight,
+                                  algorithm.error, algorithm.position)
+        self.has_algorithm[index] = True
+
+    def to_frames(self) -> List[SensorFrame]:
+        return [view.to_frame() for view in self]
+
+    def to_records(self) -> np.ndarray:
+        """SensorFrame.pack()과 같은 바이트의 FRAME_DTYPE 배열 (센서 4개만 지원)"""
+        if self.nsensors != 4:
+            raise ValueError(f"로그 파일 형식은 센서 4개만 지원합니다: {self.nsensors}")
+        records = np.zeros(len(self), dtype=FRAME_DTYPE)
+        records['timestamp'] = _to_wall_seconds(self.timestamps)
+        records['scenario'] = self.scenario
+        records['NofExperiments'] = self.NofExperiments
+        records['started'] = self.started
+        records['measured'] = self.measured
+
+        sensors = records['sensors']
+        sensors['timestamp'] = _to_wall_seconds(self.sensor_timestamps)
+        sensors['serial_port'] = np.array([port.encode('utf-8') for port in self.ports], dtype='S16')
+        sensors['location'] = self.locations
+        for name, column in self.COLUMNS.items():
+            sensors[name] = self.readings[..., column]
+
+        records['experiment']['weights'] = self.weights
+        algo = records['algorithms']
+        for column, name in enumerate(('algo_type', 'predicted_weight', 'error', 'position')):
+            algo[name] = self.algorithms[:, column]
+        return records
+
+    def pack(self) -> bytes:
+        """모든 프레임을 SensorFrame.pack() 형식으로 이어 붙인 바이트 (로그 파일에 그대로 기록 가능)"""
+        return self.to_records().tobytes()
+
+
+class FrameView:
+    """
+    FrameBatch의 프레임 하나를 SensorFrame처럼 다루기 위한 가벼운 view
+    센서 / 실험 / 알고리즘 객체는 접근할 때만 생성
+    """
+
+    __slots__ = ('batch', 'index')
+    isEoF = False
+
+    def __init__(self, batch: FrameBatch, index: int):
+        self.batch = batch
+        self.index = index
+
+    @property
+    def timestamp(self) -> int:
+        return int(self.batch.timestamps[self.index])
+
+    @property
+    def scenario(self) -> int:
+        return int(self.batch.scenario[self.index])
+
+    @property
+    def NofExperiments(self) -> int:
+        return int(self.batch.NofExperiments[self.index])
+
+    @property
+    def started(self) -> bool:
+        return bool(self.batch.started[self.index])
+
+    @property
+    def measured(self) -> bool:
+        return bool(self.batch.measured[self.index])
+
+    @property
+    def sensors(self) -> List[SensorData]:
+        return [self._sensor(column) for column in range(self.batch.nsensors)]
+
+    @property
+    def experiment(self) -> Optional[ExperimentData]:
+        if not self.batch.has_experiment[self.index]:
+            return None
+        return ExperimentData(weights=self.batch.weights[self.index].tolist())
+
+    @property
+    def algorithms(self) -> Optional[AlgorithmData]:
+        if not self.batch.has_algorithm[self.index]:
+            return None
+        algo_type, predicted_weight, error, position = self.batch.algorithms[self.index].tolist()
+        return AlgorithmData(
+            algo_type=ALGORITHM_TYPE.get_algorithmTypebyValue(algo_type),
+            predicted_weight=predicted_weight,
+            error=error,
+            position=position
+        )
+
+    def _sensor(self, column: int) -> SensorData:
+        batch = self.batch
+        distance, intensity, temperature = batch.readings[self.index, column].tolist()
+        return SensorData(
+            timestamp=int(batch.sensor_timestamps[self.index, column]),
+            serial_port=batch.ports[column],
+            location=SENSORLOCATION.get_sensor_location(int(batch.locations[self.index, column])),
+            distance=distance,
+            intensity=intensity,
+            temperature=temperature
+        )
+
+    def get_scenario_name(self) -> str:
+        return SCENARIO_TYPE_MAP[self.scenario]["name"]
+
+    def get_scenario_desc(self) -> str:
+        return SCENARIO_TYPE_MAP[self.scenario]["description"]
+
+    def get_sensor_data(self, sensor_location: SENSORLOCATION) -> SensorData:
+        return self._sensor(sensor_location.value)
+
+    def get_sensors(self):
+        return self.sensors
+
+    def pack(self) -> bytes:
+        return self.batch[self.index:self.index + 1].pack()
+
+    def to_frame(self) -> SensorFrame:
+        return SensorFrame(self.timestamp, self.sensors, self.scenario, self.NofExperiments,
+                           self.started, self.measured, self.experiment, self.algorithms)
+
+
+def _to_wall_seconds(timestamps: np.ndarray) -> np.ndarray:
+    # timebase.to_wall_seconds의 배열 버전 (정수 덧셈 -> float64 변환 -> 나눗셈 한 번, 결과 비트가 같음)
+    return (timestamps + timebase.WALL_OFFSET_NS).astype(np.float64) / NS_PER_SEC
+
+
+def _from_wall_seconds(seconds: np.ndarray) -> np.ndarray:
+    # timebase.from_wall_seconds의 배열 버전
+    return np.rint(seconds * NS_PER_SEC).astype(np.int64) - timebase.WALL_OFFSET_NS
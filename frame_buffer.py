@@ -0,0 +1,91 @@
+from collections import deque
+from enum import Enum
+from queue import Empty, Full
+from threading import Condition, Lock
+
+
+class OVERFLOW_POLICY(Enum):
+    DROP_OLDEST = 0  # 가장 오래된 프레임을 버리고 새 프레임 저장 (화면은 항상 최신 데이터를 표시)
+    DROP_NEWEST = 1  # 새 프레임을 버림
+    BLOCK = 2        # 공간이 생길 때까지 생산자가 대기
+
+
+class FrameBuffer:
+    """
+    GUI 소비자용 크기 제한 프레임 버퍼 (queue.Queue와 같은 get / put 인터페이스)
+
+    GUI가 멈추거나 탭이 숨겨져 소비가 늦어져도 maxsize 이상 쌓이지 않음
+    가득 찼을 때의 동작은 OVERFLOW_POLICY로 선택하고, 버려진 프레임 수는 dropped로 확인
+    """
+
+    def __init__(self, maxsize: int = 256, policy: OVERFLOW_POLICY = OVERFLOW_POLICY.DROP_OLDEST):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._items = deque()
+        self._lock = Lock()
+        self._notEmpty = Condition(self._lock)
+        self._notFull = Condition(self._lock)
+
+        self.received = 0  # put 된 프레임 수
+        self.dropped = 0  # 가득 차서 버려진 프레임 수
+        self.highWater = 0  # 최대로 쌓였던 프레임 수
+
+    def put(self, item, block: bool = True, timeout: float = None) -> bool:
+        """
+        Returns:
+            저장되었으면 True, DROP_NEWEST 정책으로 버려졌으면 False
+        """
+        with self._lock:
+            self.received += 1
+            if len(self._items) >= self.maxsize:
+                if self.policy == OVERFLOW_POLICY.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                elif self.policy == OVERFLOW_POLICY.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                elif not block or not self._notFull.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                    self.dropped += 1
+                    raise Full
+
+            self._items.append(item)
+            self.highWater = max(self.highWater, len(self._items))
+            self._notEmpty.notify()
+            return True
+
+    def put_nowait(self, item) -> bool:
+        return self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._lock:
+            if not self._items:
+                if not block or not self._notEmpty.wait_for(lambda: self._items, timeout):
+                    raise Empty
+            item = self._items.popleft()
+            self._notFull.notify()
+            return item
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return len(self._items) >= self.maxsize
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+                'policy': self.policy.name,
+                'received': self.received,
+                'dropped': self.dropped,
+                'highWater': self.highWater
+            }
@@ -0,0 +1,78 @@
+from queue import Empty
+from threading import Thread
+from typing import Callable, List
+
+from datainfo import SensorFrame
+from frame_buffer import FrameBuffer, OVERFLOW_POLICY
+
+
+class FrameDispatcher:
+    """
+    동기화된 SensorFrame을 소비자들에게 전달하는 스레드
+
+    SerialManager.try_sync는 동기화 lock을 잡은 상태에서 submit()으로 프레임을 넘기기만 하고,
+    callback 호출 / 알고리즘 버퍼 put / GUI 버퍼 put은 이 스레드에서 lock 없이 수행
+    느린 소비자가 있어도 센서 수집과 동기화는 멈추지 않음 (밀린 프레임 수는 pending()으로 확인)
+    대기 큐는 maxsize로 제한되며 가득 차면 가장 오래된 프레임을 버림 (버려진 수는 dropped / stats()로 확인)
+    """
+
+    _STOP = object()
+
+    def __init__(self, deliver: Callable[[SensorFrame], None], maxsize: int = 1024):
+        self.deliver = deliver  # 프레임 하나를 모든 소비자에게 전달하는 함수
+        self._queue = FrameBuffer(maxsize=maxsize, policy=OVERFLOW_POLICY.DROP_OLDEST)
+        self._thread = None
+        self._stopping = False
+        self.submitted = 0  # 전달 요청된 프레임 수
+        self.dispatched = 0  # 전달이 끝난 프레임 수
+
+    @property
+    def dropped(self) -> int:
+        # 대기 큐가 가득 차서 전달되지 못하고 버려진 프레임 수
+        return self._queue.dropped
+
+    def start(self):
+        self._stopping = False
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, frames: List[SensorFrame]):
+        for frame in frames:
+            self._queue.put(frame)
+        self.submitted += len(frames)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        stats = self._queue.stats()
+        stats.update(submitted=self.submitted, dispatched=self.dispatched)
+        return stats
+
+    def _run(self):
+        while True:
+            try:
+                frame = self._queue.get(timeout=0.5)
+            except Empty:
+                # 종료 신호를 넣지 못했어도 남은 프레임을 모두 전달하면 종료
+                if self._stopping:
+                    break
+                continue
+            if frame is self._STOP:
+                break
+            try:
+                self.deliver(frame)
+            except Exception as e:
+                print(f"[FrameDispatcher 오류] {e}")
+            self.dispatched += 1
+
+    def stop(self, timeout=None):
+        """남아있는 프레임을 모두 전달한 뒤 스레드 종료"""
+        if self._thread is None:
+            return
+        self._stopping = True
+        if not self._queue.full():
+            # 대기 중인 스레드를 바로 깨움 (가득 찼으면 프레임을 밀어내지 않도록 넣지 않음)
+            self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
@@ -0,0 +1,129 @@
+import os
+import struct
+from typing import Iterator, Optional
+
+import numpy as np
+
+from datainfo import SensorFrame, SensorData, ExperimentData, AlgorithmData, SENSORLOCATION
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from timebase import from_wall_seconds
+
+# SensorData.STRUCT_FORMAT ('<d 16s B H H H')
+SENSOR_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('serial_port', 'S16'),
+    ('location', 'u1'),
+    ('distance', '<u2'),
+    ('intensity', '<u2'),
+    ('temperature', '<u2'),
+])
+
+# SensorFrame.STRUCT_HEADER_FORMAT ('<d H H ??') + 4 * SensorData + ExperimentData + AlgorithmData
+FRAME_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('scenario', '<u2'),
+    ('NofExperiments', '<u2'),
+    ('started', '?'),
+    ('measured', '?'),
+    ('sensors', SENSOR_DTYPE, (4,)),
+    ('experiment', [('weights', '<u2', (9,))]),      # ExperimentData.STRUCT_FORMAT_EX ('<9H')
+    ('algorithms', [('algo_type', 'u1'),             # AlgorithmData.STRUCT_FORMAT_ALGO ('<B H H H')
+                    ('predicted_weight', '<u2'),
+                    ('error', '<u2'),
+                    ('position', '<u2')]),
+])
+
+# struct 포맷이 바뀌면 dtype도 같이 바뀌어야 함
+assert SENSOR_DTYPE.itemsize == SensorData.get_total_size()
+assert FRAME_DTYPE.itemsize == (struct.calcsize(SensorFrame.STRUCT_HEADER_FORMAT) + 4 * SensorData.get_total_size()
+                                + ExperimentData.get_total_size() + AlgorithmData.get_total_size())
+
+
+class SensorFrameLog:
+    """
+    SensorFrame 로그(.bin)를 memory-map 하여 NumPy structured array로 보는 reader
+
+    파일을 읽어 객체로 만들지 않으므로 GB 단위 파일도 바로 열림
+    열(column) 접근은 복사 없는 view
+        log = SensorFrameLog('log/xxx.bin')
+        log.distances(SENSORLOCATION.TOP_RIGHT)  # 모든 프레임의 TOP_RIGHT 거리값
+        log.records['algorithms']['predicted_weight']
+    SensorFrame 객체는 log[i] / iter_frames() 로 필요할 때만 생성
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        size = os.path.getsize(filepath)
+        count = size // FRAME_DTYPE.itemsize  # 마지막에 잘린 레코드는 무시
+        if count == 0:
+            self.records = np.zeros(0, dtype=FRAME_DTYPE)
+        else:
+            self.records = np.memmap(filepath, dtype=FRAME_DTYPE, mode='r', shape=(count,))
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> SensorFrame:
+        return self._to_frame(self.records[index])
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records['timestamp']
+
+    @property
+    def sensors(self) -> np.ndarray:
+        """(N, 4) SensorData 레코드"""
+        return self.records['sensors']
+
+    def distances(self, location: Optional[SENSORLOCATION] = None) -> np.ndarray:
+        """location을 주면 (N,), 아니면 (N, 4) 거리값 view (센서 순서는 파일에 저장된 순서)"""
+        distance = self.records['sensors']['distance']
+        if location is None:
+            return distance
+        return distance[:, location.value]
+
+    def iter_frames(self, start: int = 0, stop: Optional[int] = None, chunk_size: int = 4096) -> Iterator[SensorFrame]:
+        stop = len(self) if stop is None else min(stop, len(self))
+        for begin in range(start, stop, chunk_size):
+            # chunk 단위로 메모리에 올린 뒤 객체 생성
+            chunk = np.array(self.records[begin:min(begin + chunk_size, stop)])
+            for record in chunk:
+                yield self._to_frame(record)
+
+    def _to_frame(self, record) -> SensorFrame:
+        sensors = [
+            SensorData(
+                timestamp=from_wall_seconds(float(s['timestamp'])),
+                serial_port=s['serial_port'].decode('utf-8').rstrip('\x00'),
+                location=SENSORLOCATION.get_sensor_location(int(s['location'])),
+                distance=int(s['distance']),
+                intensity=int(s['intensity']),
+                temperature=int(s['temperature'])
+            )
+            for s in record['sensors']
+        ]
+        algo = record['algorithms']
+        return SensorFrame(
+            timestamp=from_wall_seconds(float(record['timestamp'])),
+            sensors=sensors,
+            scenario=int(record['scenario']),
+            NofExperiments=int(record['NofExperiments']),
+            started=bool(record['started']),
+            measured=bool(record['measured']),
+            experiment=ExperimentData(weights=record['experiment']['weights'].tolist()),
+            algorithms=AlgorithmData(
+                algo_type=ALGORITHM_TYPE.get_algorithmTypebyValue(int(algo['algo_type'])),
+                predicted_weight=int(algo['predicted_weight']),
+                error=int(algo['error']),
+                position=int(algo['position'])
+            )
+        )
+
+    def batch(self, start: int = 0, stop: Optional[int] = None) -> 'FrameBatch':
+        """[start, stop) 구간을 FrameBatch로 변환 (프레임 객체를 만들지 않음)"""
+        from frame_batch import FrameBatch
+        return FrameBatch.from_records(self.records[start:stop])
+
+    def close(self):
+        # 남아있는 view가 없으면 mmap이 해제됨
+        self.records = np.zeros(0, dtype=FRAME_DTYPE)
@@ -0,0 +1,245 @@
+import struct
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from queue import Empty
+
+from datainfo import SensorFrame, SensorData, ExperimentData, AlgorithmData, SENSORLOCATION
+
+# slot 헤더 : 시퀀스 번호, 플래그, 센서 수
+SLOT_HEADER = struct.Struct('<Q B B')
+# 같은 머신의 프로세스끼리만 공유하므로 timestamp는 monotonic ns 정수 그대로 저장 (파일 포맷의 '<d' 대신 '<q')
+FRAME_HEADER = struct.Struct('<q' + SensorFrame.STRUCT_HEADER_FORMAT[2:])
+SENSOR = struct.Struct('<q' + SensorData.STRUCT_FORMAT[2:])
+SEQ = struct.Struct('<Q')
+
+FLAG_EXPERIMENT = 0x01
+FLAG_ALGORITHM = 0x02
+FLAG_EOF = 0x04
+
+
+class SharedFrameRing:
+    """
+    SensorFrame을 알고리즘 프로세스로 전달하는 공유메모리 링버퍼 (single producer / multi consumer)
+
+    SerialManager(생산자)는 put()으로 프레임을 슬롯에 직접 pack 하고,
+    각 알고리즘 프로세스는 reader(index)로 얻은 FrameRingReader의 자체 커서로 읽음
+    Manager 서버를 거치지 않으므로 알고리즘 수만큼 pickle/소켓 왕복이 발생하지 않음
+
+    공유메모리 구성
+        [write seq][consumer cursor * N][slot * capacity]
+    생산자는 느린 소비자를 기다리지 않음 (실시간 데이터이므로 오래된 슬롯을 덮어씀)
+    - 기존 Queue와 달리 손실이 있는 전달: capacity 이상 뒤처진 소비자는 가장 오래된 프레임부터 놓침
+    - 놓친 프레임 수는 생산자 쪽 overruns[index] (부모 프로세스에서 확인 / 표시용)와 각 reader의 overruns로 확인
+    """
+
+    def __init__(self, consumers: int, capacity: int = 1024, nsensors: int = 4):
+        self.consumers = consumers
+        self.capacity = capacity
+        self.nsensors = nsensors
+        self.slotSize = SLOT_HEADER.size + SharedFrameRing.payload_size(nsensors)
+        self.slotBase = SEQ.size * (1 + consumers)
+
+        self.shm = shared_memory.SharedMemory(create=True, size=self.slotBase + self.slotSize * capacity)
+        self.shm.buf[:self.slotBase] = bytes(self.slotBase)
+        self.cond = mp.Condition()
+        self._writeSeq = 1  # 다음에 기록할 시퀀스 (0은 빈 슬롯을 의미)
+        self.overruns = [0] * consumers  # 소비자별로 읽기 전에 덮어쓴 프레임 수
+        SEQ.pack_into(self.shm.buf, 0, self._writeSeq)
+
+    @staticmethod
+    def payload_size(nsensors: int) -> int:
+        return (FRAME_HEADER.size + SENSOR.size * nsensors
+                + ExperimentData.get_total_size() + AlgorithmData.get_total_size())
+
+    def reader(self, index: int) -> 'FrameRingReader':
+        return FrameRingReader(self.shm, index, self.consumers, self.capacity, self.nsensors, self.cond)
+
+    def put(self, frame: SensorFrame):
+        buf = self.shm.buf
+        seq = self._writeSeq
+        offset = self.slotBase + (seq % self.capacity) * self.slotSize
+        overwritten = seq - self.capacity  # 이 슬롯에 있던 프레임의 시퀀스
+        if overwritten >= 1:
+            for index in range(self.consumers):
+                # 커서(다음에 읽을 시퀀스)가 덮어쓸 프레임 이하면 그 소비자는 이 프레임을 놓침
+                if SEQ.unpack_from(buf, SEQ.size * (1 + index))[0] <= overwritten:
+                    self.overruns[index] += 1
+
+        # 기록 중에는 시퀀스를 0으로 두어 reader가 읽지 않도록 함
+        SEQ.pack_into(buf, offset, 0)
+        flags, count = self._pack_frame(frame, buf, offset + SLOT_HEADER.size)
+        SLOT_HEADER.pack_into(buf, offset, seq, flags, count)
+
+        self._writeSeq = seq + 1
+        SEQ.pack_into(buf, 0, self._writeSeq)
+        with self.cond:
+            self.cond.notify_all()
+
+    def _pack_frame(self, frame: SensorFrame, buf, offset):
+        flags = 0
+        if frame.isEoF:
+            flags |= FLAG_EOF
+        sensors = frame.sensors or []
+        if len(sensors) > self.nsensors:
+            raise ValueError(f"센서 수 초과: {len(sensors)} > {self.nsensors}")
+
+        FRAME_HEADER.pack_into(
+            buf, offset,
+            frame.timestamp if frame.timestamp is not None else 0,
+            frame.scenario,
+            frame.NofExperiments,
+            frame.started,
+            frame.measured
+        )
+        offset += FRAME_HEADER.size
+        for sensor in sensors:
+            SENSOR.pack_into(
+                buf, offset,
+                sensor.timestamp,
+                sensor.serial_port.encode('utf-8'),
+                sensor.location.value,
+                sensor.distance,
+                sensor.intensity,
+                sensor.temperature
+            )
+            offset += SENSOR.size
+        offset += SENSOR.size * (self.nsensors - len(sensors))
+
+        if frame.experiment is not None:
+            flags |= FLAG_EXPERIMENT
+            frame.experiment.pack_into(buf, offset)
+        offset += ExperimentData.get_total_size()
+
+        if frame.algorithms is not None:
+            flags |= FLAG_ALGORITHM
+            frame.algorithms.pack_into(buf, offset)
+        return flags, len(sensors)
+
+    def lag(self, index: int) -> int:
+        """index번 소비자가 아직 읽지 않은 프레임 수"""
+        cursor = SEQ.unpack_from(self.shm.buf, SEQ.size * (1 + index))[0]
+        return max(0, self._writeSeq - max(cursor, 1))
+
+    def stats(self) -> dict:
+        return {
+            'capacity': self.capacity,
+            'written': self._writeSeq - 1,
+            'lag': [self.lag(index) for index in range(self.consumers)],
+            'overruns': list(self.overruns),
+        }
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class FrameRingReader:
+    """
+    SharedFrameRing의 소비자 측 핸들 (알고리즘 프로세스에서 사용)
+    Queue와 동일하게 get / get_nowait / empty를 제공하여 databuf로 그대로 사용 가능
+    """
+
+    def __init__(self, shm, index, consumers, capacity, nsensors, cond):
+        self.shm = shm
+        self.name = shm.name
+        self.index = index
+        self.consumers = consumers
+        self.capacity = capacity
+        self.nsensors = nsensors
+        self.cond = cond
+        self.slotSize = SLOT_HEADER.size + SharedFrameRing.payload_size(nsensors)
+        self.slotBase = SEQ.size * (1 + consumers)
+        self.cursorOffset = SEQ.size * (1 + index)
+        self.overruns = 0  # 생산자에게 덮어쓰여 놓친 프레임 수
+        self._nextSeq = max(1, SEQ.unpack_from(self.shm.buf, 0)[0])
+        SEQ.pack_into(self.shm.buf, self.cursorOffset, self._nextSeq)
+
+    def __getstate__(self):
+        # spawn 방식으로 전달될 때는 이름으로 다시 연결
+        state = self.__dict__.copy()
+        del state['shm']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.shm = shared_memory.SharedMemory(name=self.name)
+
+    def _writeSeq(self):
+        return SEQ.unpack_from(self.shm.buf, 0)[0]
+
+    def empty(self) -> bool:
+        return self._writeSeq() <= self._nextSeq
+
+    def get_nowait(self) -> SensorFrame:
+        return self.get(block=False)
+
+    def get(self, block=True, timeout=None) -> SensorFrame:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self._read()
+            if frame is not None:
+                return frame
+            if not block:
+                raise Empty
+            with self.cond:
+                if not self.empty():
+                    continue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise Empty
+                self.cond.wait(remaining)
+
+    def _read(self):
+        buf = self.shm.buf
+        write_seq = self._writeSeq()
+        if write_seq - self._nextSeq > self.capacity:
+            # 생산자가 한 바퀴 이상 앞서감 -> 남아있는 가장 오래된 프레임으로 이동
+            skipped = write_seq - self.capacity - self._nextSeq
+            self.overruns += skipped
+            self._nextSeq += skipped
+
+        while self._nextSeq < write_seq:
+            offset = self.slotBase + (self._nextSeq % self.capacity) * self.slotSize
+            seq, flags, count = SLOT_HEADER.unpack_from(buf, offset)
+            if seq == self._nextSeq:
+                frame = self._unpack_frame(buf, offset + SLOT_HEADER.size, flags, count)
+                # 읽는 도중 덮어쓰이지 않았는지 확인
+                if SEQ.unpack_from(buf, offset)[0] == self._nextSeq:
+                    self._nextSeq += 1
+                    SEQ.pack_into(buf, self.cursorOffset, self._nextSeq)
+                    return frame
+            # 이미 덮어쓰인 슬롯
+            self.overruns += 1
+            self._nextSeq += 1
+        SEQ.pack_into(buf, self.cursorOffset, self._nextSeq)
+        return None
+
+    def _unpack_frame(self, buf, offset, flags, count) -> SensorFrame:
+        timestamp, scenario, NofExperiments, started, measured = FRAME_HEADER.unpack_from(buf, offset)
+        offset += FRAME_HEADER.size
+        sensors = []
+        for _ in range(count):
+            ts, port_bytes, loc, distance, intensity, temperature = SENSOR.unpack_from(buf, offset)
+            sensors.append(SensorData(
+                timestamp=ts,
+                serial_port=port_bytes.decode('utf-8').rstrip('\x00'),
+                location=SENSORLOCATION.get_sensor_location(loc),
+                distance=distance,
+                intensity=intensity,
+                temperature=temperature
+            ))
+            offset += SENSOR.size
+        offset += SENSOR.size * (self.nsensors - count)
+
+        experiment = ExperimentData.unpack_from(buf, offset) if flags & FLAG_EXPERIMENT else None
+        offset += ExperimentData.get_total_size()
+        algorithms = AlgorithmData.unpack_from(buf, offset) if flags & FLAG_ALGORITHM else None
+
+        if flags & FLAG_EOF:
+            return SensorFrame(timestamp=None, sensors=None, isEoF=True)
+        return SensorFrame(timestamp, sensors, scenario, NofExperiments,
+                           started, measured, experiment, algorithms)
+
+    def close(self):
+        self.shm.close()
@@ -0,0 +1,69 @@
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from datainfo import SensorData
+
+
+class SensorRingBuffer:
+    """
+    포트 하나의 최근 센서값을 저장하는 고정 크기 NumPy 링버퍼 (그래프 / 파일 기록용)
+
+    값은 capacity 두 배 크기의 배열에 두 번씩 기록하므로 (i, i + capacity)
+    최근 N개 샘플은 항상 연속된 slice로 꺼낼 수 있음 -> 그래프 갱신 시 Python 반복문이 없음
+    열(column)
+        timestamp   : SensorData.timestamp (monotonic ns)를 그대로 저장
+        distance, intensity, temperature
+    """
+
+    COLUMNS = {'distance': 0, 'intensity': 1, 'temperature': 2}
+
+    def __init__(self, capacity: int = 300):
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = np.zeros((len(self.COLUMNS), 2 * capacity), dtype=np.float64)
+        self._lock = threading.Lock()
+        self.total = 0  # 지금까지 추가된 샘플 수 (덮어쓰인 샘플 포함)
+        self.last: Optional[SensorData] = None  # 가장 최근 SensorData
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, sdata: SensorData):
+        values = (sdata.distance, sdata.intensity, sdata.temperature)
+        with self._lock:
+            idx = self.total % self.capacity
+            self._timestamps[idx] = self._timestamps[idx + self.capacity] = sdata.timestamp
+            self._values[:, idx] = self._values[:, idx + self.capacity] = values
+            self.total += 1
+            self.last = sdata
+
+    def _window(self, count: int) -> slice:
+        end = self.total % self.capacity + self.capacity
+        return slice(end - count, end)
+
+    def view(self, column: str = 'distance', count: Optional[int] = None) -> np.ndarray:
+        """가장 최근 count개(기본: 전체) 샘플의 column 값 (오래된 순서, 복사본)"""
+        with self._lock:
+            count = len(self) if count is None else min(count, len(self))
+            return self._values[self.COLUMNS[column], self._window(count)].copy()
+
+    def since(self, total: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        total개 이후에 추가된 샘플 반환 (이미 덮어쓰인 샘플은 제외)
+
+        Returns:
+            (timestamps (N,), values (3, N), 현재 total)
+        """
+        with self._lock:
+            count = min(self.total - total, len(self))
+            if count <= 0:
+                return self._timestamps[:0].copy(), self._values[:, :0].copy(), self.total
+            window = self._window(count)
+            return self._timestamps[window].copy(), self._values[:, window].copy(), self.total
+
+    def clear(self):
+        with self._lock:
+            self.total = 0
+            self.last = None
@@ -12,16 +12,36 @@ class processImpl(metaclass=ABCMeta):
         self.databuf = None
         self.manage = None
         self.resBuf = None
+        self.readyQue = None
+
+    def setBuffers(self, databuf=None, resBuf=None):
+        """
+        부모 프로세스에서 만든 데이터/결과 큐를 사용 (프로세스 시작 전에 호출)
+        지정하지 않은 큐만 자식 프로세스에서 Manager 큐로 생성
+        """
+        if databuf is not None:
+            self.databuf = databuf
+        if resBuf is not None:
+            self.resBuf = resBuf
 
     def _initialize_buffers(self):
-        self.manage = mp.Manager()
-        self.databuf = self.manage.Queue()
-        self.resBuf = self.manage.Queue()
+        if self.databuf is None or self.resBuf is None:
+            self.manage = mp.Manager()
+            if self.databuf is None:
+                self.databuf = self.manage.Queue()  # 센서데이터 큐
+            if self.resBuf is None:
+                self.resBuf = self.manage.Queue()  # 알고리즘 결과 큐
+
+    def _notifyReady(self):
+        if self.readyQue is not None:
+            self.readyQue.put(self.name)  # PM에 준비 완료 보고
         if self.readySig:
-            self.readyQue.put(self.databuf)  # 센서데이터 큐
-            self.readyQue.put(self.resBuf)  # 알고리즘 결과 큐
             self.readySig.set()  # 완료 신호
 
+    def prepare(self):
+        """프로세스 시작 후 준비 완료 보고 전에 수행할 초기화 (모델 로드 등)"""
+        pass
+
     def getDatabuf(self):
         return self.databuf
 
@@ -51,6 +71,8 @@ class processImpl(metaclass=ABCMeta):
 
     def run(self):
         self._initialize_buffers()
+        self.prepare()
+        self._notifyReady()
         self.doProc()
         # self.join()
         self.__done()
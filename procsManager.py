@@ -1,11 +1,32 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from Algorithm.COGMassEstimation_v2 import COGMassEstimation
-from Algorithm.MLPPredictor import KerasMLPPredictor
-from Algorithm.RandomForestPredictor import RandomForestPredictor
 import multiprocessing as mp
+from queue import Empty
 
 from Algorithm.algorithmtype import ALGORITHM_TYPE
+from frame_ring import SharedFrameRing
+from procImpl import processImpl
+
+
+class LazyAlgorithm(processImpl):
+    """
+    알고리즘을 ALGORITHM_TYPE(import 경로)으로만 보관하다가 자식 프로세스 안에서 생성하는 래퍼
+    GUI 프로세스는 TensorFlow / sklearn 등 알고리즘 의존성을 import 하지 않음
+    """
+
+    def __init__(self, algoType: ALGORITHM_TYPE):
+        super().__init__(algoType.name)
+        self.algoType = algoType
+        self.algorithm = None
+
+    def run(self):
+        self.algorithm = self.algoType.load_class()(self.name)
+        self.algorithm.event_readyBuffer(self.readySig, self.readyQue)
+        self.algorithm.setBuffers(self.databuf, self.resBuf)
+        self.algorithm.run()
+
+    def doProc(self):
+        self.algorithm.doProc()
 
 
 class ProcsManagerThread(QThread):
@@ -24,6 +45,9 @@ class ProcsManager:
         self.procs = dict()
         self.sm = sm
         self.databuf = None
+        self.frameRing = None  # 알고리즘 프로세스로 SensorFrame을 전달하는 공유메모리 링버퍼
+        self.ringNames = []  # frameRing 소비자 index 순서의 알고리즘 이름
+        self.reportedOverruns = dict()  # 마지막으로 알린 알고리즘별 overruns
         self.resbuf = dict()
         self.thread = None
         self._ready_handlers = []
@@ -36,16 +60,11 @@ class ProcsManager:
             handler()
 
     def addProcess(self, algoName):
-        if algoName == ALGORITHM_TYPE.COGMassEstimation:
-            algo = COGMassEstimation(algoName.name)
-        elif algoName == ALGORITHM_TYPE.MLPPredictor:
-            algo = KerasMLPPredictor(algoName.name)
-        elif algoName == ALGORITHM_TYPE.RandomForestPredictor:
-            algo = RandomForestPredictor(algoName.name)
-        else:
+        if not isinstance(algoName, ALGORITHM_TYPE):
             return
 
-        self.procs[algoName.name] = algo
+        # 알고리즘 클래스는 자식 프로세스에서 import / 생성
+        self.procs[algoName.name] = LazyAlgorithm(algoName)
 
     def startThread(self, callback=None):  # callback은 스레드가 작업을 끝내고 실행하는 함수(버튼 활성화)
         self.thread = ProcsManagerThread(self)
@@ -54,32 +73,98 @@ class ProcsManager:
         self.thread.start()
 
     def _start(self):  # 스레드로 실행 (기존 start)
-        for n, val in self.procs.items():
-            readySig = mp.Event()
-            databufQue = mp.Queue()
+        self._closeRing()  # 이전 실행의 공유메모리 해제
+        self.frameRing = SharedFrameRing(consumers=len(self.procs))
+        self.ringNames = list(self.procs)
+        self.reportedOverruns = dict()
+        self._launch({n: self.frameRing.reader(idx) for idx, n in enumerate(self.ringNames)})
+
+        self.databuf = self.frameRing
+        self.sm.add_buffer(self.databuf)  # 데이터 큐
+        self._AlgorithmReady()
+
+    def _launch(self, databufs):
+        """
+        모든 알고리즘 프로세스를 동시에 시작하고 준비 완료 보고를 모음
+        큐는 모두 여기(부모)에서 만들어 전달하므로 자식마다 Manager 서버를 띄우지 않음
 
-            val.event_readyBuffer(readySig, databufQue)
+        Args:
+            databufs: {알고리즘 이름: 데이터 큐}
+
+        Returns:
+            준비 완료된 알고리즘 이름 목록 (준비 전에 종료된 프로세스는 resbuf에서도 제외)
+        """
+        readyQue = mp.Queue()
+        resbufs = dict()
+        for n, val in self.procs.items():
+            resbufs[n] = mp.Queue()  # 결과 큐
+            val.event_readyBuffer(None, readyQue)
+            val.setBuffers(databufs[n], resbufs[n])
 
             p = mp.Process(name=n, target=val.run)
             val.start(p)
 
-            readySig.wait()  # 큐 준비 완료 신호를 보낼때 까지 기다림
-            self.databuf = databufQue.get()
-            self.sm.add_buffer(self.databuf)  # 데이터 큐
-            self.resbuf[val.name] = databufQue.get()  # 결과 큐
-
-        self._AlgorithmReady()
+        exited = self._waitReady(readyQue)
+        self.resbuf = {n: buf for n, buf in resbufs.items() if n not in exited}
+        return [n for n in self.procs if n not in exited]
+
+    def _waitReady(self, readyQue) -> set:
+        """
+        모델 로드가 끝난 순서대로 준비 완료 보고가 도착함
+
+        Returns:
+            준비 전에 종료된 알고리즘 이름
+        """
+        waiting = set(self.procs)
+        exited = set()
+        while waiting:
+            try:
+                name = readyQue.get(timeout=1.0)
+            except Empty:
+                for n in [n for n in waiting if not self.procs[n].is_alive()]:
+                    print(n, "exited before ready")
+                    waiting.discard(n)
+                    exited.add(n)
+                continue
+            waiting.discard(name)
+            self._print(name + ' ready', self.procs[name].getPID())
+        return exited
 
     def getResultBufs(self):
         return self.resbuf
 
+    def getRingStats(self) -> dict:
+        """알고리즘별 {'lag': 읽지 않은 프레임 수, 'overruns': 읽기 전에 덮어쓰여 놓친 프레임 수}"""
+        if self.frameRing is None:
+            return dict()
+        stats = self.frameRing.stats()
+        return {n: {'lag': stats['lag'][idx], 'overruns': stats['overruns'][idx]}
+                for idx, n in enumerate(self.ringNames)}
+
+    def checkOverruns(self):
+        # 알고리즘 처리가 데이터 속도를 따라가지 못해 링버퍼에서 놓친 프레임이 있으면 알림
+        for n, stats in self.getRingStats().items():
+            reported = self.reportedOverruns.get(n, 0)
+            if stats['overruns'] > reported:
+                print(f"[경고] {n} 처리 지연 - 놓친 프레임 {stats['overruns'] - reported}개 "
+                      f"(누적 {stats['overruns']}, 링버퍼 {self.frameRing.capacity})")
+                self.reportedOverruns[n] = stats['overruns']
+
     def terminate(self):
         for val in self.procs.values():
             print(val,"terminated")
             self._print(val.name, val.getPID())
             val.terminate()
         self.procs.clear()
-        self.sm.remove_buffer(self.databuf)
+        self._closeRing()
+
+    def _closeRing(self):
+        if self.frameRing is None:
+            return
+        self.sm.remove_buffer(self.frameRing)
+        self.frameRing.close()  # 공유메모리 unlink
+        self.frameRing = None
+        self.databuf = None
 
     def join(self):
         pass
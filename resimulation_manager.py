@@ -1,9 +1,21 @@
+import time
+from enum import Enum
+from queue import Full, Empty
+from threading import Thread
+
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from datainfo import SensorBinaryFileHandler, SensorFrame
 from procsManager import ProcsManager
+from timebase import to_seconds
 import multiprocessing as mp
 
+class REPLAY_MODE(Enum):
+    ASAP = 0      # 최대 속도
+    REALTIME = 1  # 기록된 timestamp 간격 그대로
+    SCALED = 2    # 기록된 timestamp 간격의 N배속
+
+
 class ResimulThread(QThread):
     finishSignal = pyqtSignal()
 
@@ -15,6 +27,7 @@ class ResimulThread(QThread):
         self.manager._start()
         self.finishSignal.emit()
 
+
 class ResimulationManager(ProcsManager):
     def __init__(self, sm):
         super().__init__(sm)
@@ -23,34 +36,122 @@ class ResimulationManager(ProcsManager):
         self.file = None
         self.resbuffer = None
         self.algo_buffers = []
+        self.feeds = dict()  # 데이터를 보내는 중인 알고리즘 {이름: 데이터 큐} (종료된 프로세스는 제외)
+        self.queueSize = 256  # 알고리즘별 데이터 큐 크기 (가득 차면 읽기를 멈추고 기다림)
+        self.chunkSize = 4096  # 파일에서 한 번에 읽는 프레임 수
+        self.isStopped = False
+
+        self.replayMode = REPLAY_MODE.ASAP
+        self.replaySpeed = 1.0
+        self.replayStats = dict()  # 알고리즘별 처리량 {이름: {'frames', 'elapsed', 'fps'}}
+        self._replayStart = None
 
-    def startThread(self, callback=None):  # callback은 스레드가 작업을 끝내고 실행하는 함수(버튼 활성화)
+    def startThread(self, callback=None, onStart=None):
+        """
+        callback은 스레드가 작업을 끝내고 실행하는 함수, onStart는 스레드가 시작하면 실행하는 함수(버튼 활성화)
+        재생이 빨리 끝나도 놓치지 않도록 시그널 연결은 스레드 시작 전에 끝냄
+        """
         self.thread = ResimulThread(self)
+        if onStart:
+            self.thread.started.connect(onStart)
         if callback:
             self.thread.finishSignal.connect(callback)
         self.thread.start()
 
-    def _start(self):
-        for n, val in self.procs.items():
-            readySig = mp.Event()
-            databufQue = mp.Queue()
-
-            val.event_readyBuffer(readySig, databufQue)
-
-            p = mp.Process(name=n, target=val.run)
-            val.start(p)
+    def setReplayMode(self, mode: REPLAY_MODE, speed: float = 1.0):
+        """
+        리시뮬레이션 재생 방식 설정
+        ASAP : 최대 속도, REALTIME : 기록된 시간 간격 그대로, SCALED : speed 배속
+        """
+        self.replayMode = mode
+        self.replaySpeed = speed if mode == REPLAY_MODE.SCALED else 1.0
 
-            readySig.wait()  # 큐 준비 완료 신호를 보낼때 까지 기다림
-            self.addDataQue(databufQue.get())  # 데이터 큐
-            self.resbuf[val.name] = databufQue.get()  # 결과 큐
-            self.sendSensorData()
+    def _start(self):
+        self.isStopped = False
+        self.replayStats.clear()
+        databufs = {n: mp.Queue(maxsize=self.queueSize) for n in self.procs}
+        ready = self._launch(databufs)
+        for n, databuf in databufs.items():
+            if n in ready:
+                self.feeds[n] = databuf
+                self.addDataQue(databuf)  # 데이터 큐
+            else:
+                self._closeFeed(databuf)
+
+        collectors = [Thread(target=self._collectResults, args=(n, buf), daemon=True)
+                      for n, buf in self.resbuf.items()]
+        self._replayStart = time.monotonic()
+        for collector in collectors:
+            collector.start()
+
+        sent = self.sendSensorData()
+        sendTime = time.monotonic() - self._replayStart
+        for collector in collectors:
+            collector.join()
+
+        print(f'[Resimulation] {self.replayMode.name} x{self.replaySpeed}: '
+              f'{sent} frames sent in {sendTime:.2f}s')
+        for name, stat in self.replayStats.items():
+            print(f"[Resimulation] {name}: {stat['frames']} frames, {stat['elapsed']:.2f}s, {stat['fps']:.1f} fps")
+
+    def _collectResults(self, name, resbuf):
+        """
+        알고리즘 결과 큐를 비우며 EoF 결과가 올 때까지 처리량을 측정
+        프로세스가 도중에 종료되면 남은 결과까지만 세고 끝난 것으로 처리
+        """
+        frames = 0
+        exited = False
+        lastTime = self._replayStart
+        while not self.isStopped:
+            try:
+                res = resbuf.get(timeout=0.5)
+            except Empty:
+                if not self._isAlive(name):
+                    exited = True
+                    self._dropFeed(name)
+                    break
+                continue
+            data = res.get('input') if isinstance(res, dict) else None
+            if isinstance(data, SensorFrame) and data.isEoF:
+                break
+            frames += 1
+            lastTime = time.monotonic()
+
+        elapsed = lastTime - self._replayStart
+        self.replayStats[name] = {
+            'frames': frames,
+            'elapsed': elapsed,
+            'fps': frames / elapsed if elapsed > 0 else 0.0,
+            'exited': exited  # EoF 전에 프로세스가 종료됨
+        }
+
+    def _isAlive(self, name) -> bool:
+        proc = self.procs.get(name)
+        return proc is not None and proc.is_alive()
+
+    def _dropFeed(self, name):
+        # 종료된 알고리즘에는 더 이상 데이터를 보내지 않음 (아무도 비우지 않는 큐에 put 하며 멈추지 않도록)
+        databuf = self.feeds.pop(name, None)
+        if databuf is None:
+            return
+        print(f'[Resimulation] {name} exited, stop feeding')
+        self.algo_buffers = [buf for buf in self.algo_buffers if buf is not databuf]
+        self._closeFeed(databuf)
+
+    @staticmethod
+    def _closeFeed(databuf):
+        # 읽는 프로세스가 없는 큐의 feeder 스레드 때문에 종료 시 기다리지 않도록 함
+        # (보내는 스레드가 아직 put 중일 수 있으므로 close 하지 않음)
+        databuf.cancel_join_thread()
 
     def terminate(self):
+        self.isStopped = True
         for val in self.procs.values():
             print(val,"terminated")
             self._print(val.name, val.getPID())
             val.terminate()
         self.procs.clear()
+        self.feeds.clear()
         self.removeDataQue()
 
     def getDataFile(self, filepath):
@@ -63,17 +164,64 @@ class ResimulationManager(ProcsManager):
     def removeDataQue(self):
         self.algo_buffers.clear()
 
-    def sendSensorData(self):
+    def sendSensorData(self) -> int:
         """
-        bin파일에 있는 데이터를 읽어와 알고리즘 버퍼에 전달
-        """
-        records = self.load_File()
-        for data in records:
-            for algo_buf in self.algo_buffers:
-                algo_buf.put(data)
+        bin파일에 있는 데이터를 chunk 단위로 읽어 알고리즘 버퍼에 전달
+        큐가 가득 차면 알고리즘이 소비할 때까지 기다리므로 파일 크기와 관계없이 메모리 사용량이 일정함
+        replayMode가 ASAP가 아니면 SensorFrame.timestamp 간격에 맞춰 전달
 
-        for algo_buf in self.algo_buffers:
-            algo_buf.put(SensorFrame(timestamp=None, sensors=None, isEoF=True))
+        Returns:
+            전달한 프레임 수
+        """
+        sent = 0
+        firstTimestamp = None
+        for data in self.readFrames():
+            if self.replayMode != REPLAY_MODE.ASAP:
+                if firstTimestamp is None:
+                    firstTimestamp = data.timestamp
+                offset = to_seconds(data.timestamp - firstTimestamp) / self.replaySpeed
+                if not self._sleepUntil(self._replayStart + offset):
+                    return sent
+
+            if not self.feeds:
+                # 모든 알고리즘 프로세스가 종료됨
+                return sent
+            for name, algo_buf in list(self.feeds.items()):
+                if not self._put(name, algo_buf, data) and self.isStopped:
+                    return sent
+            sent += 1
+
+        for name, algo_buf in list(self.feeds.items()):
+            self._put(name, algo_buf, SensorFrame(timestamp=None, sensors=None, isEoF=True))
+        return sent
+
+    def _sleepUntil(self, target) -> bool:
+        # terminate 되면 대기를 중단
+        while not self.isStopped:
+            remaining = target - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 0.5))
+        return False
+
+    def readFrames(self):
+        log = SensorBinaryFileHandler(self.file).load_mapped()
+        try:
+            yield from log.iter_frames(chunk_size=self.chunkSize)
+        finally:
+            log.close()
+
+    def _put(self, name, algo_buf, data) -> bool:
+        # terminate 되거나 알고리즘 프로세스가 종료되면 대기 중인 put을 중단
+        while not self.isStopped:
+            try:
+                algo_buf.put(data, timeout=0.5)
+                return True
+            except Full:
+                if not self._isAlive(name):
+                    self._dropFeed(name)
+                    return False
+        return False
 
     def load_File(self):
         loadData = SensorBinaryFileHandler(self.file).load_frames()
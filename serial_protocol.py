@@ -0,0 +1,166 @@
+import struct
+from enum import Enum
+from typing import List, Tuple
+
+
+class SERIAL_PROTOCOL(Enum):
+    ASCII = 0   # "loc,dist,int,temp\n" 텍스트 라인 (기존 펌웨어)
+    BINARY = 1  # SYNC + 고정 길이 payload + CRC8
+
+
+# 프로토콜별 기본 baudrate
+DEFAULT_BAUDRATE = {
+    SERIAL_PROTOCOL.ASCII: 9600,
+    SERIAL_PROTOCOL.BINARY: 115200,
+}
+
+# 바이너리 프레임 (10 byte, little endian)
+#     0xA5 0x5A | location(B) distance(H) intensity(H) temperature(H) | CRC8
+# CRC8 : poly 0x07, init 0x00, payload(7 byte)에 대해 계산
+#
+# 아두이노 예시
+#     uint8_t buf[10] = {0xA5, 0x5A, loc, dist & 0xFF, dist >> 8, ...};
+#     buf[9] = crc8(buf + 2, 7);
+#     Serial.write(buf, 10);
+SYNC = b'\xA5\x5A'
+PAYLOAD = struct.Struct('<B H H H')
+FRAME_SIZE = len(SYNC) + PAYLOAD.size + 1
+
+
+def _make_crc8_table(poly: int = 0x07) -> bytes:
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[i] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE = _make_crc8_table()
+
+
+def crc8(data) -> int:
+    crc = 0
+    for b in data:
+        crc = _CRC8_TABLE[crc ^ b]
+    return crc
+
+
+def encode_frame(location: int, distance: int, intensity: int, temperature: int) -> bytes:
+    """센서 값 하나를 바이너리 프레임으로 변환 (펌웨어 / 테스트용)"""
+    payload = PAYLOAD.pack(location, distance, intensity, temperature)
+    return SYNC + payload + bytes([crc8(payload)])
+
+
+class BinaryFrameParser:
+    """
+    바이너리 프레임 스트림 파서
+
+    serial.read(in_waiting)로 읽은 임의 길이의 chunk를 feed() 하면 완성된 프레임들을 한 번에 반환하고,
+    잘린 프레임은 다음 chunk가 들어올 때까지 보관함
+    SYNC가 깨졌거나 CRC가 맞지 않으면 한 byte씩 밀면서 다음 SYNC를 찾음
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.frames = 0  # 정상 프레임 수
+        self.crcErrors = 0  # CRC 오류 프레임 수
+        self.skippedBytes = 0  # 동기화를 위해 버린 byte 수
+
+    def feed(self, data) -> List[Tuple[int, int, int, int]]:
+        """
+        Returns:
+            (location, distance, intensity, temperature) 목록
+        """
+        buf = self._buffer
+        buf += data
+        samples = []
+        pos = 0
+        end = len(buf)
+        while end - pos >= FRAME_SIZE:
+            if buf[pos] != SYNC[0] or buf[pos + 1] != SYNC[1]:
+                nxt = buf.find(SYNC, pos + 1)
+                if nxt < 0:
+                    # 마지막 byte는 SYNC의 첫 byte일 수 있으므로 남겨둠
+                    nxt = end - 1
+                self.skippedBytes += nxt - pos
+                pos = nxt
+                continue
+
+            payload_start = pos + len(SYNC)
+            payload_end = payload_start + PAYLOAD.size
+            if crc8(buf[payload_start:payload_end]) != buf[payload_end]:
+                self.crcErrors += 1
+                self.skippedBytes += 1
+                pos += 1
+                continue
+
+            samples.append(PAYLOAD.unpack_from(buf, payload_start))
+            self.frames += 1
+            pos += FRAME_SIZE
+
+        del buf[:pos]
+        return samples
+
+    def reset(self):
+        self._buffer.clear()
+
+
+class AsciiLineParser:
+    """
+    "loc,dist,int,temp\n" 텍스트 라인 스트림 파서 (기존 펌웨어용)
+
+    feed()로 들어온 chunk를 내부 bytearray에 이어 붙인 뒤 완성된 라인만 잘라서 파싱하고,
+    줄바꿈이 오지 않은 나머지는 다음 chunk까지 보관함
+    형식이 잘못된 라인은 출력하지 않고 badLines로만 집계
+    """
+
+    def __init__(self, max_line: int = 128):
+        self._buffer = bytearray()
+        self.max_line = max_line  # 줄바꿈 없이 이 길이를 넘으면 버림 (잘못된 baudrate 등)
+        self.lines = 0  # 정상 라인 수
+        self.badLines = 0  # 형식이 잘못된 라인 수
+        self._discarding = False  # max_line을 넘은 라인의 나머지를 줄바꿈까지 버리는 중
+
+    def feed(self, data) -> List[Tuple[int, int, int, int]]:
+        """
+        Returns:
+            (location, distance, intensity, temperature) 목록
+        """
+        buf = self._buffer
+        buf += data
+        samples = []
+        pos = 0
+        while True:
+            end = buf.find(b'\n', pos)
+            if end < 0:
+                break
+            parts = buf[pos:end].split(b',')
+            pos = end + 1
+            if self._discarding:
+                # 이미 badLines로 집계한 긴 라인의 끝부분
+                self._discarding = False
+                continue
+            if len(parts) != 4:
+                if len(parts) > 1 or parts[0].strip():
+                    self.badLines += 1
+                continue
+            try:
+                # int()는 bytes의 앞뒤 공백 / \r을 무시함
+                samples.append((int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])))
+                self.lines += 1
+            except ValueError:
+                self.badLines += 1
+
+        del buf[:pos]
+        if len(buf) > self.max_line:
+            if not self._discarding:
+                self.badLines += 1
+                self._discarding = True
+            buf.clear()
+        return samples
+
+    def reset(self):
+        self._buffer.clear()
+        self._discarding = False
@@ -0,0 +1,88 @@
+"""
+GUI 시작 시간 측정 스크립트
+
+main.Main()이 show()에 도달할 때까지 걸린 시간과
+그 시점에 무거운 알고리즘 의존성(TensorFlow, sklearn 등)이 로드되었는지 확인
+
+    python startup_benchmark.py            # 5회 측정 (매번 새 프로세스)
+    python startup_benchmark.py --runs 10
+"""
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+
+# GUI 시작 시 로드되면 안 되는 모듈
+HEAVY_MODULES = ['tensorflow', 'keras', 'sklearn', 'scipy', 'joblib']
+
+
+def measure_once():
+    start = time.perf_counter()
+
+    from PyQt5.QtWidgets import QApplication
+    import main
+
+    shown = {}
+    original_show = main.Main.show
+
+    def timed_show(self):
+        shown['time'] = time.perf_counter()
+        original_show(self)
+
+    main.Main.show = timed_show
+
+    imported = time.perf_counter()
+    app = QApplication(sys.argv[:1])
+    ex = main.Main()
+
+    result = {
+        'import': imported - start,
+        'show': shown.get('time', time.perf_counter()) - start,
+        'loaded': [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+    print(json.dumps(result))
+    sys.stdout.flush()
+
+    # 센서 / GUI 스레드가 종료를 막지 않도록 바로 프로세스 종료
+    ex.serial_manager.stop_threads()
+    os._exit(0)
+
+
+def main(runs):
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    results = []
+    for i in range(runs):
+        out = subprocess.run([sys.executable, __file__, '--child'], env=env,
+                             capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        lines = [line for line in out.stdout.splitlines() if line.startswith('{')]
+        if not lines:
+            print(f'[{i + 1}] 측정 실패\n{out.stderr}')
+            return 1
+        res = json.loads(lines[-1])
+        results.append(res)
+        print(f"[{i + 1}] import {res['import'] * 1000:.0f} ms, show {res['show'] * 1000:.0f} ms, "
+              f"heavy modules: {res['loaded'] or '-'}")
+
+    show_times = [res['show'] for res in results]
+    print(f"show() 도달 시간 : median {statistics.median(show_times) * 1000:.0f} ms, "
+          f"min {min(show_times) * 1000:.0f} ms, max {max(show_times) * 1000:.0f} ms")
+
+    loaded = sorted({name for res in results for name in res['loaded']})
+    if any(name in loaded for name in ('tensorflow', 'sklearn')):
+        print(f'[실패] GUI 시작 시 알고리즘 의존성이 로드됨: {loaded}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    if '--child' in sys.argv:
+        measure_once()
+    else:
+        runs = 5
+        if '--runs' in sys.argv:
+            runs = int(sys.argv[sys.argv.index('--runs') + 1])
+        sys.exit(main(runs))
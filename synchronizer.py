@@ -0,0 +1,425 @@
+import heapq
+import math
+from collections import deque
+from enum import Enum
+from typing import Dict, List
+
+from datainfo import SensorData, SensorFrame
+from timebase import from_seconds, to_seconds
+
+
+class SYNC_MODE(Enum):
+    APPROXIMATE = 0  # ApproximateTimeSynchronizer : slop 이내의 샘플끼리 묶음 (차이가 크면 샘플을 버림)
+    INTERPOLATE = 1  # InterpolatingSynchronizer : 고정 주기로 각 포트 값을 선형 보간
+
+
+def insert_by_timestamp(buffer: deque, sdata: SensorData):
+    # 타임스탬프 순서를 유지하도록 삽입 (같은 타임스탬프면 기존 샘플 앞)
+    left, right = 0, len(buffer)
+    while left < right:
+        mid = (left + right) // 2
+        if buffer[mid].timestamp < sdata.timestamp:
+            left = mid + 1
+        else:
+            right = mid
+    buffer.insert(left, sdata)
+
+
+class SkewEstimator:
+    """
+    포트별 샘플 시각 모델 / 지터 추정기 (adaptive slop 용)
+
+    포트마다 샘플 시각을 t = anchor + n * period 직선으로 추적하는 alpha-beta 필터 (위상 고정 루프와 같음)
+    - 샘플이 들어오면 예측 시각과의 차이(residual)로 anchor와 period를 보정
+    - 처음에는 최소제곱 직선 맞춤과 같은 큰 이득으로 시작해 alpha / beta까지 줄임
+        offset(port, t) : 시각 t 근처 샘플의 예측 시각이 기준 포트(ports[0]) 샘플 격자에서 떨어진 위상 (-P/2 ~ P/2)
+        jitter          : residual 크기의 평균
+    아두이노마다 전송 주기가 조금씩 달라 기준 포트 대비 위상이 계속 밀려도
+    추정한 period로 위상을 외삽하므로 평균을 내는 방식처럼 뒤처지지 않음
+    같은 chunk에서 읽은 샘플은 타임스탬프가 같으므로 첫 샘플만 모델에 반영 (n으로 건너뛴 샘플 수를 계산)
+    모든 시간 값은 ns 단위
+    """
+
+    def __init__(self, ports: List[str], alpha: float = 0.02, k: float = 3.0):
+        self.ports = list(ports)
+        self.reference = self.ports[0]
+        self.alpha = alpha  # anchor 보정 이득, jitter EWMA 가중치
+        self.beta = alpha * alpha / (2 - alpha)  # period 보정 이득 (임계 감쇠)
+        self.k = k  # slop = k * sqrt(sum(jitter^2))
+        self.anchor = {port: None for port in self.ports}  # 마지막 샘플의 추정 시각
+        self.period = {port: None for port in self.ports}
+        self.jitter = {port: 0.0 for port in self.ports}
+        self.observed = 0  # 모델에 반영한 샘플 수
+
+        self._updates = {port: 0 for port in self.ports}
+        self._lastTime = {port: None for port in self.ports}
+        self._sameCount = {port: 0 for port in self.ports}
+
+    def observeSample(self, sdata: SensorData):
+        port = sdata.serial_port
+        timestamp = sdata.timestamp
+        last = self._lastTime.get(port)
+        if last is not None and timestamp <= last:
+            if timestamp == last:
+                self._sameCount[port] += 1
+            return  # 같은 chunk의 샘플 / 순서가 바뀐 샘플
+
+        anchor = self.anchor[port]
+        period = self.period[port]
+        if anchor is None:
+            self.anchor[port] = timestamp
+        elif period is None:
+            self.period[port] = (timestamp - last) / self._sameCount[port]
+            self.anchor[port] = timestamp
+            self._updates[port] = 2
+        else:
+            n = max(1, round((timestamp - anchor) / period))
+            predicted = anchor + n * period
+            residual = timestamp - predicted
+            updates = self._updates[port] = self._updates[port] + 1
+            alpha = max(self.alpha, 2 * (2 * updates - 1) / (updates * (updates + 1)))
+            beta = max(self.beta, 6 / (updates * (updates + 1)))
+            self.anchor[port] = predicted + alpha * residual
+            self.period[port] = period + beta * residual / n
+            self.jitter[port] += self.alpha * (abs(residual) - self.jitter[port])
+            self.observed += 1
+        self._lastTime[port] = timestamp
+        self._sameCount[port] = 1
+
+    def offset(self, port: str, timestamp: int) -> float:
+        """timestamp 근처 port 샘플의 기준 포트 샘플 격자 대비 위상 (모델이 아직 없으면 0)"""
+        period = self.period[port]
+        ref_period = self.period[self.reference]
+        if period is None or ref_period is None:
+            return 0.0
+        anchor = self.anchor[port]
+        predicted = anchor + round((timestamp - anchor) / period) * period
+        return _wrap(predicted - self.anchor[self.reference], ref_period)
+
+    def offsets(self, limit: int) -> Dict[str, int]:
+        """각 포트의 마지막 샘플 시각에서의 오프셋 ([-limit, limit]로 제한, 기준 포트는 0)"""
+        return {port: round(min(limit, max(-limit, self.offset(port, last)))) if last is not None else 0
+                for port, last in self._lastTime.items()}
+
+    def suggestSlop(self) -> int:
+        # 포트들의 오차가 독립이라고 보고 합성한 크기의 k배
+        return round(self.k * math.sqrt(sum(jitter * jitter for jitter in self.jitter.values())))
+
+    def slopLimit(self, max_slop: int) -> int:
+        """
+        slop 상한 : max_slop과 (가장 짧은 샘플 주기 / 2) 중 작은 값
+        보정 후 차이가 주기의 절반을 넘으면 가장 가까운 샘플 대신 이전 / 다음 샘플과 묶인 것
+        """
+        periods = [period for period in self.period.values() if period]
+        if not periods:
+            return max_slop
+        return min(max_slop, round(min(periods) / 2))
+
+
+def _wrap(delta: float, period: float) -> float:
+    # delta를 (-period/2, period/2] 범위로
+    return (delta + period / 2) % period - period / 2
+
+
+class ApproximateTimeSynchronizer:
+    """
+    ROS의 ApproximateTimeSynchronizer와 동일한 규칙으로 센서 데이터를 동기화하는 엔진
+
+    각 포트의 데이터는 타임스탬프 순서의 deque에 저장하고,
+    각 deque의 head 타임스탬프는 min-heap으로 관리
+    - head들의 타임스탬프(monotonic ns) 차이가 slop(초) 이하이면 SensorFrame 생성
+    - 아니면 가장 오래된 head를 버림
+    SensorData 하나당 비용은 amortized O(log ports)
+
+    adaptive=True면 SkewEstimator로 포트별 샘플 주기 / 위상과 지터를 추정하여
+    - 각 head 타임스탬프에서 그 시각의 추정 오프셋을 빼고 비교 (기준 포트의 가장 가까운 샘플과 묶이도록)
+    - tune_interval 샘플마다 slop을 k * (포트별 jitter의 합성 크기)로 조정 (min_slop 이상, max_slop과 샘플 주기 / 2 중 작은 값 이하)
+    - 보정 전 실제 타임스탬프 차이가 max_slop(staleness 상한, 기본값은 slop)을 넘는 후보는 묶지 않음
+    처음 warmup개의 샘플을 관측하는 동안은 주어진 slop을 그대로 사용
+    """
+
+    def __init__(self, ports: List[str], slop: float = 0.1, adaptive: bool = False,
+                 max_slop: float = None, min_slop: float = 0.001, warmup: int = 200, tune_interval: int = 32):
+        self.ports = list(ports)
+        self.slop = slop  # 초 단위 허용 오차 (비교는 정수 ns로 수행)
+        self.adaptive = adaptive
+        self.maxSlop = from_seconds(max_slop if max_slop is not None else slop)  # staleness 상한 (ns)
+        self.minSlop = from_seconds(min_slop)
+        self.warmup = warmup
+        self.tuneInterval = tune_interval
+        self.estimator = SkewEstimator(self.ports) if adaptive else None
+        self._initialSlop = from_seconds(slop)
+        self._tuned = False  # warmup이 끝나 오프셋 보정을 적용 중
+        self.queues: Dict[str, deque] = {port: deque() for port in self.ports}
+
+        self._heap = []  # (head timestamp, port index, head version)
+        self._portIndex = {port: idx for idx, port in enumerate(self.ports)}
+        self._headVersion = {port: 0 for port in self.ports}
+        self._maxHead = None  # 현재 head들 중 가장 최근 타임스탬프
+        self._readyPorts = 0  # 데이터가 있는 포트 수
+
+        self.received = 0  # 들어온 샘플 수
+        self.matched = 0  # 생성된 프레임 수
+        self.dropped = 0  # 버려진 샘플 수
+
+    @property
+    def slop(self) -> float:
+        return self._slop
+
+    @slop.setter
+    def slop(self, slop: float):
+        self._slop = slop
+        self._slopNs = from_seconds(slop)
+
+    def push(self, sdata: SensorData) -> List[SensorFrame]:
+        """
+        샘플 하나를 추가하고, 그 결과 완성된 SensorFrame 목록을 반환
+        """
+        queue = self.queues.get(sdata.serial_port)
+        if queue is None:
+            return []
+        self.received += 1
+        if self.estimator is not None:
+            self.estimator.observeSample(sdata)
+            if self.received % self.tuneInterval == 0:
+                self._tune()
+
+        if not queue:
+            queue.append(sdata)
+            self._readyPorts += 1
+            self._setHead(sdata.serial_port)
+        elif queue[-1].timestamp < sdata.timestamp:
+            queue.append(sdata)
+        else:
+            # 순서가 뒤바뀐 샘플 (드묾) - 타임스탬프 위치에 삽입
+            insert_by_timestamp(queue, sdata)
+            if queue[0] is sdata:
+                self._setHead(sdata.serial_port)
+                self._maxHead = max(self._headTime(port) for port in self.ports if self.queues[port])
+
+        return self._match()
+
+    def _headTime(self, port) -> int:
+        # 오프셋 보정된 head 타임스탬프 (adaptive가 아니거나 warmup 중이면 보정하지 않음)
+        timestamp = self.queues[port][0].timestamp
+        if not self._tuned:
+            return timestamp
+        offset = self.estimator.offset(port, timestamp)
+        return timestamp - round(min(self.maxSlop, max(-self.maxSlop, offset)))
+
+    def _setHead(self, port):
+        head_time = self._headTime(port)
+        self._headVersion[port] += 1
+        heapq.heappush(self._heap, (head_time, self._portIndex[port], self._headVersion[port]))
+        if self._maxHead is None or self._maxHead < head_time:
+            self._maxHead = head_time
+
+    def _popOldest(self):
+        # head가 바뀌어 무효화된 heap 항목은 여기서 정리
+        while True:
+            timestamp, idx, version = self._heap[0]
+            port = self.ports[idx]
+            if version == self._headVersion[port]:
+                return timestamp, port
+            heapq.heappop(self._heap)
+
+    def _match(self) -> List[SensorFrame]:
+        frames = []
+        while self._readyPorts == len(self.ports):
+            min_time, oldest_port = self._popOldest()
+            max_time = self._maxHead
+
+            matched = max_time - min_time <= self._slopNs
+            if matched and self.estimator is not None:
+                heads = [self.queues[port][0].timestamp for port in self.ports]
+                matched = max(heads) - min(heads) <= self.maxSlop
+
+            if matched:
+                candidate_list = [self.queues[port].popleft() for port in self.ports]
+                frames.append(SensorFrame(
+                    timestamp=max(sensor.timestamp for sensor in candidate_list),  # 동기화 기준 시간
+                    sensors=candidate_list
+                ))
+                self.matched += 1
+                self._resetHeads()
+            else:
+                heapq.heappop(self._heap)
+                queue = self.queues[oldest_port]
+                queue.popleft()
+                self.dropped += 1
+                if queue:
+                    self._setHead(oldest_port)
+                else:
+                    self._readyPorts -= 1
+                    self._headVersion[oldest_port] += 1
+        return frames
+
+    def _resetHeads(self):
+        # heap을 현재 head들로 다시 만듦 (프레임 생성 후 / 오프셋 변경 후)
+        self._heap.clear()
+        self._maxHead = None
+        self._readyPorts = 0
+        for port in self.ports:
+            if self.queues[port]:
+                self._readyPorts += 1
+                self._setHead(port)
+            else:
+                self._headVersion[port] += 1
+
+    def _tune(self):
+        estimator = self.estimator
+        if estimator.observed < self.warmup:
+            return
+        slop = min(estimator.slopLimit(self.maxSlop), max(self.minSlop, estimator.suggestSlop()))
+        if not self._tuned:
+            # heap 안의 값은 보정 전 타임스탬프이므로 다시 만듦
+            self._tuned = True
+            self._resetHeads()
+        if slop != self._slopNs:
+            self.slop = to_seconds(slop)
+
+    def pending(self) -> int:
+        """아직 동기화되지 않은 샘플 수"""
+        return sum(len(q) for q in self.queues.values())
+
+    def stats(self) -> dict:
+        """
+        동기화 상태 - yield는 프레임에 사용된 샘플 비율
+        adaptive면 staleness 상한과 포트별 offset(마지막 샘플 시각 기준) / jitter / period(초)도 포함
+        """
+        stats = {
+            'mode': SYNC_MODE.APPROXIMATE.name,
+            'received': self.received,
+            'matched': self.matched,
+            'dropped': self.dropped,
+            'pending': self.pending(),
+            'yield': self.matched * len(self.ports) / self.received if self.received else 0.0,
+            'slop': self.slop,
+            'adaptive': self.adaptive
+        }
+        if self.estimator is not None:
+            estimator = self.estimator
+            stats['stalenessBound'] = to_seconds(self.maxSlop)
+            offsets = estimator.offsets(self.maxSlop) if self._tuned else {port: 0 for port in self.ports}
+            stats['offset'] = {port: to_seconds(offset) for port, offset in offsets.items()}
+            stats['jitter'] = {port: to_seconds(jitter) for port, jitter in estimator.jitter.items()}
+            stats['period'] = {port: to_seconds(period) if period else None
+                               for port, period in estimator.period.items()}
+        return stats
+
+
+class InterpolatingSynchronizer:
+    """
+    고정 출력 주기(rate Hz)로 SensorFrame을 생성하는 동기화 엔진
+
+    ApproximateTimeSynchronizer는 head들의 차이가 slop을 넘으면 샘플을 버리므로
+    아두이노마다 전송 주기가 조금씩 다르면 버려지는 샘플이 많아짐
+    이 엔진은 샘플을 버리지 않고, 출력 시각 t마다 각 포트에서 t를 감싸는 두 샘플(a <= t <= b)의
+    distance / intensity를 선형 보간하여 프레임을 만듦 (temperature는 가까운 샘플 값)
+    - 모든 포트에 t 이후의 샘플이 들어와야 t 프레임이 생성됨 (가장 느린 포트만큼 지연)
+    - 두 샘플 간격이 max_gap(초)보다 크면(센서 끊김 등) 보간하지 않고 다음 샘플 이후의 출력 시각으로 바로 건너뜀
+      (건너뛴 출력 시각 수는 skipped)
+    - 프레임과 보간된 SensorData의 timestamp는 모두 출력 시각 t (원래 샘플의 수신 시각은 남지 않음)
+    push() / pending() / matched / dropped는 ApproximateTimeSynchronizer와 같음
+    """
+
+    def __init__(self, ports: List[str], rate: float = 50.0, max_gap: float = 0.5, queue_size: int = 256):
+        self.ports = list(ports)
+        self.rate = rate
+        self.period = from_seconds(1.0 / rate)  # 출력 주기 (ns)
+        self.maxGap = from_seconds(max_gap)
+        self.queueSize = queue_size  # 포트별 최대 보관 샘플 수 (다른 포트가 멈춘 경우 대비)
+        self.queues: Dict[str, deque] = {port: deque() for port in self.ports}
+        self._nextTime = None  # 다음 프레임의 출력 시각
+
+        self.received = 0  # 들어온 샘플 수
+        self.matched = 0  # 생성된 프레임 수
+        self.dropped = 0  # 버려진 샘플 수 (늦게 도착했거나 queue_size 초과)
+        self.skipped = 0  # 보간할 수 없어 건너뛴 출력 시각 수
+
+    def push(self, sdata: SensorData) -> List[SensorFrame]:
+        queue = self.queues.get(sdata.serial_port)
+        if queue is None:
+            return []
+        self.received += 1
+
+        if self._nextTime is not None and sdata.timestamp < queue[0].timestamp:
+            # 이미 출력이 끝난 구간의 샘플
+            self.dropped += 1
+            return []
+        # 같은 chunk에서 읽은 샘플은 타임스탬프가 같으므로 뒤에 붙임 (보간에는 마지막 샘플이 쓰임)
+        if not queue or queue[-1].timestamp <= sdata.timestamp:
+            queue.append(sdata)
+        else:
+            insert_by_timestamp(queue, sdata)
+        if len(queue) > self.queueSize:
+            queue.popleft()
+            self.dropped += 1
+
+        if self._nextTime is None:
+            if not all(self.queues.values()):
+                return []
+            # 모든 포트의 첫 샘플이 들어온 시점부터 출력 시작
+            self._nextTime = max(q[0].timestamp for q in self.queues.values())
+        return self._emit()
+
+    def _emit(self) -> List[SensorFrame]:
+        frames = []
+        while all(q[-1].timestamp >= self._nextTime for q in self.queues.values()):
+            t = self._nextTime
+            self._nextTime += self.period
+            sensors = []
+            for port in self.ports:
+                queue = self.queues[port]
+                sensor = self._interpolate(queue, t)
+                if sensor is None:
+                    break
+                sensors.append(sensor)
+            else:
+                frames.append(SensorFrame(timestamp=t, sensors=sensors))
+                self.matched += 1
+                continue
+
+            # 이 포트는 t 다음 샘플(a가 t 이후면 a, 아니면 b) 전까지 보간할 수 없으므로 그 이후의 출력 시각으로 이동
+            resume = queue[0].timestamp if queue[0].timestamp >= t else queue[1].timestamp
+            steps = max(1, -(-(resume - t) // self.period))
+            self._nextTime = t + steps * self.period
+            self.skipped += steps
+        return frames
+
+    def _interpolate(self, queue: deque, t: int):
+        # t를 감싸는 (a, b)를 찾고, a 이전의 샘플은 더 이상 필요 없으므로 버림
+        while len(queue) > 1 and queue[1].timestamp <= t:
+            queue.popleft()
+        a = queue[0]
+        if a.timestamp >= t or len(queue) == 1:
+            b = a
+        else:
+            b = queue[1]
+        span = b.timestamp - a.timestamp
+        if span > self.maxGap or (span == 0 and a.timestamp != t):
+            return None
+        ratio = (t - a.timestamp) / span if span else 0.0
+        return SensorData(
+            timestamp=t,
+            serial_port=a.serial_port,
+            location=a.location,
+            distance=round(a.distance + (b.distance - a.distance) * ratio),
+            intensity=round(a.intensity + (b.intensity - a.intensity) * ratio),
+            temperature=a.temperature if ratio < 0.5 else b.temperature
+        )
+
+    def pending(self) -> int:
+        """아직 프레임에 쓰이지 않은 샘플 수"""
+        return sum(len(q) for q in self.queues.values())
+
+    def stats(self) -> dict:
+        return {
+            'mode': SYNC_MODE.INTERPOLATE.name,
+            'received': self.received,
+            'matched': self.matched,
+            'dropped': self.dropped,
+            'skipped': self.skipped,
+            'pending': self.pending(),
+            'rate': self.rate
+        }
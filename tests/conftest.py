@@ -0,0 +1,46 @@
+import os
+import sys
+
+# 모듈이 저장소 루트에 있으므로 tests에서 바로 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random  # noqa: E402
+
+from Algorithm.algorithmtype import ALGORITHM_TYPE  # noqa: E402
+from AlgorithmInterface import AlgorithmBase  # noqa: E402
+from datainfo import SensorData, SensorFrame, SENSORLOCATION, ExperimentData, AlgorithmData  # noqa: E402
+from timebase import NS_PER_MS, now_ns  # noqa: E402
+
+# 여러 테스트 모듈에서 쓰는 공용 helper (from conftest import ...)
+
+PORTS = [f"COM{i}" for i in range(4)]
+LOCATIONS = [SENSORLOCATION.get_sensor_location(i) for i in range(4)]
+ALGO_TYPE = ALGORITHM_TYPE.list_all()[0]
+
+
+def make_frames(count=200, seed=0):
+    """포트 4개의 임의 SensorFrame 목록 (ns 단위까지 임의의 timestamp)"""
+    rnd = random.Random(seed)
+    start = now_ns()
+    frames = []
+    for i in range(count):
+        # ns 단위까지 임의의 값 -> float64 초 변환의 반올림이 모든 경우에 같은지 확인
+        timestamp = start + i * 20 * NS_PER_MS + rnd.randrange(NS_PER_MS)
+        sensors = [SensorData(timestamp - rnd.randrange(5 * NS_PER_MS), port, location,
+                              rnd.randrange(900), rnd.randrange(900), rnd.randrange(60))
+                   for port, location in zip(PORTS, LOCATIONS)]
+        frames.append(SensorFrame(timestamp, sensors, 1000, i % 7, bool(i % 2), bool(i % 3),
+                                  ExperimentData([rnd.randrange(100) for _ in range(9)]),
+                                  AlgorithmData(ALGO_TYPE, rnd.randrange(500), rnd.randrange(10), rnd.randrange(9))))
+    return frames
+
+
+class SumAlgorithm(AlgorithmBase):
+    """프레임 단위 runAlgo만 구현 (FrameView로 호출됨), 결과는 거리 합"""
+
+    def runAlgo(self) -> AlgorithmData:
+        total = sum(self.input_data.get_sensor_data(loc).distance for loc in LOCATIONS)
+        return AlgorithmData(ALGO_TYPE, total, 0, 1)
+
+    def initAlgorithm(self):
+        pass
@@ -0,0 +1,60 @@
+import queue
+import threading
+
+from conftest import SumAlgorithm, make_frames
+from datainfo import SensorFrame
+
+
+def eof():
+    return SensorFrame(timestamp=None, sensors=None, isEoF=True)
+
+
+def make_algorithm(frames, batch_size=8):
+    algorithm = SumAlgorithm("Sum")
+    algorithm.batch_size = batch_size
+    algorithm.poll_timeout = 0.05
+    algorithm.setBuffers(queue.Queue(), queue.Queue())
+    for frame in frames:
+        algorithm.databuf.put(frame)
+    return algorithm
+
+
+def drain(q):
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+def test_get_batch_limits_size_and_stops_at_eof():
+    frames = make_frames(10)
+    algorithm = make_algorithm(frames[:6] + [eof()] + frames[6:], batch_size=4)
+
+    assert algorithm._getBatch() == frames[:4]
+    batch = algorithm._getBatch()
+    assert batch[:2] == frames[4:6] and batch[-1].isEoF
+    assert algorithm._getBatch() == frames[6:10]
+    assert algorithm._getBatch() == []  # poll_timeout 동안 데이터 없음
+
+
+def test_get_batch_waits_for_deadline():
+    frames = make_frames(2)
+    algorithm = make_algorithm(frames[:1])
+    algorithm.batch_deadline = 0.3
+    threading.Timer(0.05, algorithm.databuf.put, args=(frames[1],)).start()
+
+    assert algorithm._getBatch() == frames
+
+
+def test_do_proc_processes_every_frame_then_forwards_eof():
+    frames = make_frames(20)
+    algorithm = make_algorithm(frames + [eof()], batch_size=6)
+    algorithm.doProc()
+
+    results = drain(algorithm.resBuf)
+    assert [res['input'] for res in results[:-1]] == frames
+    assert [res['output'].predicted_weight for res in results[:-1]] == \
+           [sum(s.distance for s in frame.sensors) for frame in frames]
+    # execute()가 재사용하는 output_data와 분리된 결과
+    assert len({id(res) for res in results}) == len(results)
+    assert results[-1]['input'].isEoF and results[-1]['output'] is None
@@ -0,0 +1,87 @@
+import pytest
+
+import batch_resimulation
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from conftest import ALGO_TYPE, LOCATIONS, SumAlgorithm, make_frames
+from datainfo import AlgorithmData
+from frame_batch import FrameBatch
+from frame_log import SensorFrameLog
+
+
+class BatchSumAlgorithm(SumAlgorithm):
+    """배열에서 바로 계산하는 runAlgoBatch, 홀수 번째 결과는 오류로 처리"""
+
+    def runAlgoBatch(self, frames):
+        assert isinstance(frames, FrameBatch)
+        totals = frames.distances(LOCATIONS).sum(axis=1)
+        return [AlgorithmData(ALGO_TYPE, int(total), 0, 1) if total % 2 == 0 else None for total in totals]
+
+
+def resimulate(tmp_path, algorithm, frames):
+    source = tmp_path / "session.bin"
+    source.write_bytes(b''.join(frame.pack() for frame in frames))
+    batch_resimulation._algorithms.clear()
+    batch_resimulation._algorithms['Sum'] = algorithm
+    try:
+        summary = batch_resimulation._resimulate_file((str(source), str(tmp_path), 64))
+    finally:
+        batch_resimulation._algorithms.clear()
+    assert summary['errors'] == {}
+    log = SensorFrameLog(summary['outputs'][0])
+    try:
+        return summary, [log[i] for i in range(len(log))]
+    finally:
+        log.close()
+
+
+def test_find_log_files(tmp_path):
+    for name in ("b.bin", "a.bin", "c.txt"):
+        (tmp_path / name).write_bytes(b"")
+    assert batch_resimulation.find_log_files(str(tmp_path)) == [str(tmp_path / "a.bin"), str(tmp_path / "b.bin")]
+
+
+def test_resimulate_file_with_frame_algorithm(tmp_path):
+    frames = make_frames(150)
+    algorithm = SumAlgorithm("Sum")
+    algorithm.batch_size = 10
+    summary, results = resimulate(tmp_path, algorithm, frames)
+
+    assert summary['frames'] == summary['results']['Sum'] == 150
+    # 처리 시간 (청크 시작 위치가 아닌 실제 경과 시간)
+    assert 0 <= summary['elapsed'] < 60
+    assert [frame.algorithms.predicted_weight for frame in results] == \
+           [sum(s.distance for s in frame.sensors) for frame in frames]
+    # 알고리즘 결과(레코드 끝) 외에는 입력 프레임 그대로
+    size = AlgorithmData.get_total_size()
+    assert [frame.pack()[:-size] for frame in results] == [frame.pack()[:-size] for frame in frames]
+
+
+def test_resimulate_file_skips_non_algorithm_outputs(tmp_path):
+    frames = make_frames(150)
+    summary, results = resimulate(tmp_path, BatchSumAlgorithm("Sum"), frames)
+
+    totals = [sum(s.distance for s in frame.sensors) for frame in frames]
+    expected = [total for total in totals if total % 2 == 0]
+    assert summary['results']['Sum'] == len(expected)
+    assert [frame.algorithms.predicted_weight for frame in results] == expected
+
+
+def test_batch_resimulator_runs_files_in_workers(tmp_path):
+    pytest.importorskip("scipy")
+    frames = make_frames(100)
+    files = []
+    for i in range(2):
+        path = tmp_path / f"session{i}.bin"
+        path.write_bytes(b''.join(frame.pack() for frame in frames[i * 50:(i + 1) * 50]))
+        files.append(str(path))
+
+    progress = []
+    resimulator = batch_resimulation.BatchResimulator([ALGORITHM_TYPE.COGMassEstimation], workers=2,
+                                                      outDir=str(tmp_path / "out"), chunkSize=16)
+    summaries = resimulator.run(files, callback=lambda done, total, summary: progress.append((done, total)))
+
+    assert progress == [(1, 2), (2, 2)]
+    assert sorted(summary['file'] for summary in summaries) == files
+    for summary in summaries:
+        assert summary['errors'] == {}
+        assert summary['frames'] == summary['results']['COGMassEstimation'] == 50
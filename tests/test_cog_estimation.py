@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from Algorithm.COGMassEstimation_v2 import COGMassEstimation
+from conftest import make_frames
+from frame_batch import FrameBatch
+
+
+def run_frames(algorithm, frames):
+    """프레임 단위 runAlgo (기존 경로)"""
+    results = []
+    for frame in frames:
+        algorithm.set_input_data(frame)
+        results.append(algorithm.runAlgo())
+    return results
+
+
+@pytest.fixture
+def frames():
+    frames = make_frames(300, seed=3)
+    # 초기값이 유효하지 않은(0) 프레임으로 시작하는 경우
+    for frame in frames[:5]:
+        frame.sensors[1].distance = 0
+    return frames
+
+
+def test_nearest_constant_index_matches_min_index():
+    algorithm = COGMassEstimation("COG")
+    rnd = random.Random(0)
+    for location, constants in algorithm.constants.items():
+        values = [rnd.uniform(-1, max(constants) + 1) for _ in range(200)] + list(constants[:20])
+        expected = [constants.index(min(constants, key=lambda c: abs(c - v))) for v in values]
+        assert algorithm.nearest_constant_index(location, values).tolist() == expected
+
+
+def test_batch_matches_sequential_run_algo(frames):
+    frames[2].sensors[0].distance = -1  # 센서 오류값 (파일에는 저장되지 않으므로 프레임 목록 경로만)
+    scalar = COGMassEstimation("COG")
+    vector = COGMassEstimation("COG")
+
+    expected = run_frames(scalar, frames)
+    results = []
+    for start in range(0, len(frames), 64):  # 배치 경계에서도 초기값 / 변화량 상태가 이어져야 함
+        results += vector.runAlgoBatch(frames[start:start + 64])
+
+    assert results == expected
+    assert vector.initial_laser_values == scalar.initial_laser_values
+    assert vector.laser_changes == scalar.laser_changes
+
+
+def test_frame_batch_path_matches_frame_list(frames):
+    from_list = COGMassEstimation("COG").runAlgoBatch(frames)
+    from_batch = COGMassEstimation("COG").runAlgoBatch(FrameBatch.from_frames(frames))
+    assert from_batch == from_list
+
+
+def test_reset_clears_initial_values(frames):
+    algorithm = COGMassEstimation("COG")
+    algorithm.runAlgoBatch(frames)
+    algorithm.resetAlgorithm()
+    positions, weights = algorithm.estimate_batch(np.full((3, 4), 400))
+    # 새 세션의 첫 프레임이 초기값 -> 변화량 0
+    assert algorithm.initial_laser_values == [400] * 4
+    assert algorithm.laser_changes == {i: [0.0] for i in range(4)}
@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+pytest.importorskip("pyqtgraph")
+
+import experiment
+from datainfo import SensorData, SENSORLOCATION
+from experiment import EXPERIMENT_RECORD, Experiment
+from plot_buffer import SensorRingBuffer
+
+PORT = "COM1"
+
+
+class FakeWriter:
+    def __init__(self):
+        self.records = []
+
+    def write(self, path, data):
+        self.records += [data[i:i + EXPERIMENT_RECORD.size] for i in range(0, len(data), EXPERIMENT_RECORD.size)]
+
+
+def make_experiment(save_capacity):
+    # 화면 없이 auto_save에 필요한 상태만 설정
+    ex = Experiment.__new__(Experiment)
+    ex.ports = [PORT]
+    ex.port_index = {PORT: 0}
+    ex.port_location = {PORT: "TopLeft"}
+    ex.weight_a = [0] * 9
+    ex.weight_total = 0
+    ex.last_direction = '-'
+    ex.is_paused_global = True
+    ex.raw_data_path = None
+    ex._save_buffer = bytearray()
+    ex.record_writer = FakeWriter()
+    ex.save_capacity = save_capacity
+    ex.save_data = {PORT: SensorRingBuffer(save_capacity)}
+    ex.plot_data = {PORT: SensorRingBuffer(10)}
+    ex.saved_until = {}
+    ex.samples_lost = 0
+    return ex
+
+
+def push(ex, start, count):
+    for i in range(start, start + count):
+        sdata = SensorData(timestamp=i, serial_port=PORT, location=SENSORLOCATION.TOP_LEFT,
+                           distance=i, intensity=0, temperature=0)
+        ex.plot_data[PORT].append(sdata)
+        ex.save_data[PORT].append(sdata)
+
+
+def distances(ex):
+    return [int(EXPERIMENT_RECORD.unpack(record)[-4]) for record in ex.record_writer.records]
+
+
+@pytest.fixture(autouse=True)
+def no_refresh(monkeypatch):
+    monkeypatch.setattr(experiment, "refresh_wall_offset", lambda: 0)
+
+
+def test_auto_save_writes_each_sample_once_beyond_plot_history():
+    ex = make_experiment(save_capacity=1000)
+    push(ex, 0, 500)  # 그래프 버퍼(10)보다 많은 샘플
+    ex.auto_save()
+    push(ex, 500, 300)
+    ex.auto_save()
+    ex.auto_save()
+
+    assert distances(ex) == list(range(800))
+    assert ex.samples_lost == 0
+
+
+def test_auto_save_counts_overwritten_samples():
+    ex = make_experiment(save_capacity=100)
+    push(ex, 0, 50)
+    ex.auto_save()
+    push(ex, 50, 250)  # 저장 주기 동안 버퍼 크기보다 많은 샘플
+    ex.auto_save()
+
+    assert distances(ex) == list(range(50)) + list(range(200, 300))
+    assert ex.samples_lost == 150
@@ -0,0 +1,88 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from Algorithm.algorithmtype import ALGORITHM_TYPE
+from conftest import LOCATIONS, make_frames
+from datainfo import SensorFrame, SENSORLOCATION, AlgorithmData
+from frame_batch import FrameBatch
+from frame_log import FRAME_DTYPE, SensorFrameLog
+
+
+def test_from_frames_round_trip():
+    frames = make_frames()
+    batch = FrameBatch.from_frames(frames)
+
+    assert len(batch) == len(frames)
+    assert batch.to_frames() == frames
+    assert batch[5].get_sensor_data(LOCATIONS[2]) == frames[5].sensors[2]
+    assert batch[-1].to_frame() == frames[-1]
+    assert np.array_equal(batch.distance[:, 1], [frame.sensors[1].distance for frame in frames])
+
+
+def test_pack_matches_sensor_frame_pack_exactly():
+    frames = make_frames(1000)
+    batch = FrameBatch.from_frames(frames)
+
+    assert batch.pack() == b''.join(frame.pack() for frame in frames)
+    assert batch[10].pack() == frames[10].pack()
+
+
+def test_from_records_round_trip():
+    frames = make_frames()
+    records = np.frombuffer(b''.join(frame.pack() for frame in frames), dtype=FRAME_DTYPE)
+    batch = FrameBatch.from_records(records)
+
+    # 파일의 timestamp는 float64 초이므로 ns 값은 1µs 이내로만 복원됨
+    assert np.abs(batch.timestamps - [frame.timestamp for frame in frames]).max() < 1000
+    assert batch.to_records().tobytes() == records.tobytes()
+    assert [frame.pack() for frame in batch.to_frames()] == [frame.pack() for frame in frames]
+
+
+def test_slice_shares_arrays_and_pickles():
+    batch = FrameBatch.from_frames(make_frames(50))
+    part = batch[10:20]
+
+    assert len(part) == 10
+    assert np.shares_memory(part.readings, batch.readings)
+    assert part[0].to_frame() == batch[10].to_frame()
+    assert pickle.loads(pickle.dumps(part)).to_frames() == part.to_frames()
+
+
+def test_distances_and_set_algorithm():
+    frames = make_frames(20)
+    batch = FrameBatch.from_frames(frames)
+    order = [SENSORLOCATION.TOP_RIGHT, SENSORLOCATION.TOP_LEFT]
+    assert batch.distances(order).tolist() == [[frame.get_sensor_data(loc).distance for loc in order]
+                                               for frame in frames]
+
+    result = AlgorithmData(list(ALGORITHM_TYPE)[0], 321, 1, 4)
+    batch.set_algorithm(3, result)
+    frames[3].algorithms = result
+    assert batch[3].pack() == frames[3].pack()
+
+
+def test_sensor_frame_log_batch(tmp_path):
+    frames = make_frames(100)
+    path = tmp_path / "frames.bin"
+    path.write_bytes(b''.join(frame.pack() for frame in frames))
+
+    log = SensorFrameLog(str(path))
+    try:
+        # 프레임 단위 읽기(log[i])와 같은 값
+        assert log.batch(10, 30).to_frames() == [log[i] for i in range(10, 30)]
+        assert log.batch().pack() == path.read_bytes()
+    finally:
+        log.close()
+
+
+def test_rejects_eof_and_mismatched_ports():
+    frames = make_frames(3)
+    with pytest.raises(ValueError):
+        FrameBatch.from_frames([])
+    with pytest.raises(ValueError):
+        FrameBatch.from_frames(frames + [SensorFrame(timestamp=None, sensors=None, isEoF=True)])
+    frames[1].sensors = list(reversed(frames[1].sensors))
+    with pytest.raises(ValueError):
+        FrameBatch.from_frames(frames)
@@ -0,0 +1,125 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from queue import Empty
+
+import pytest
+
+from conftest import make_frames
+from datainfo import SensorFrame
+from frame_ring import SharedFrameRing
+
+
+@pytest.fixture
+def ring():
+    rings = []
+
+    def create(consumers=1, capacity=8):
+        rings.append(SharedFrameRing(consumers=consumers, capacity=capacity))
+        return rings[-1]
+
+    yield create
+    for r in rings:
+        r.close()
+
+
+def drain(reader):
+    frames = []
+    while not reader.empty():
+        frames.append(reader.get_nowait())
+    return frames
+
+
+def read_in_child(reader, count, results):
+    results.put([reader.get(timeout=5.0) for _ in range(count)])
+    reader.close()
+
+
+def test_round_trip_across_wraparound(ring):
+    r = ring(capacity=8)
+    reader = r.reader(0)
+    frames = make_frames(30)
+
+    received = []
+    for start in range(0, 30, 5):  # 소비자가 따라가는 동안 슬롯을 여러 바퀴 재사용
+        for frame in frames[start:start + 5]:
+            r.put(frame)
+        received += drain(reader)
+
+    assert received == frames
+    assert reader.overruns == 0 and r.overruns == [0]
+    with pytest.raises(Empty):
+        reader.get(timeout=0.01)
+
+
+def test_slow_reader_loses_oldest_frames(ring):
+    r = ring(consumers=2, capacity=8)
+    slow, fast = r.reader(0), r.reader(1)
+    frames = make_frames(20)
+    for frame in frames:
+        r.put(frame)
+        fast.get_nowait()
+
+    assert drain(slow) == frames[-8:]
+    assert slow.overruns == 12
+    # 부모 프로세스에서 확인하는 생산자 쪽 집계도 같음
+    assert r.stats()['overruns'] == [12, 0]
+    assert r.stats()['lag'] == [0, 0]
+
+
+def test_eof_frame(ring):
+    r = ring()
+    reader = r.reader(0)
+    frame = make_frames(1)[0]
+    r.put(frame)
+    r.put(SensorFrame(timestamp=None, sensors=None, isEoF=True))
+
+    assert reader.get(timeout=1.0) == frame
+    assert reader.get(timeout=1.0).isEoF
+
+
+def test_every_consumer_reads_every_frame(ring):
+    r = ring(consumers=3, capacity=64)
+    readers = [r.reader(index) for index in range(3)]
+    frames = make_frames(40)
+
+    results = mp.Queue()
+    child = mp.Process(target=read_in_child, args=(readers[2], len(frames), results))
+    child.start()
+    for frame in frames:
+        r.put(frame)
+
+    assert drain(readers[0]) == frames
+    assert drain(readers[1]) == frames
+    assert results.get(timeout=10.0) == frames
+    child.join(timeout=5.0)
+    assert r.overruns == [0, 0, 0]
+
+
+def test_procs_manager_releases_previous_ring():
+    pytest.importorskip("PyQt5.QtCore")
+    from procsManager import ProcsManager
+
+    class FakeSerialManager:
+        def __init__(self):
+            self.buffers = []
+
+        def add_buffer(self, buffer):
+            self.buffers.append(buffer)
+
+        def remove_buffer(self, buffer):
+            self.buffers.remove(buffer)
+
+    sm = FakeSerialManager()
+    manager = ProcsManager(sm)
+    manager._start()
+    first = manager.frameRing.shm.name
+    manager._start()  # Stop 없이 다시 Run
+    second = manager.frameRing.shm.name
+
+    assert sm.buffers == [manager.frameRing]
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=first)
+    manager.terminate()
+    assert sm.buffers == [] and manager.frameRing is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=second)
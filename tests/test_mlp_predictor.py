@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+pytest.importorskip("joblib")
+
+from Algorithm.MLPPredictor import KerasMLPPredictor
+from conftest import LOCATIONS, make_frames
+from frame_batch import FrameBatch
+
+
+class StubScaler:
+    def transform(self, values):
+        return np.asarray(values) / 10.0
+
+
+class StubModel:
+    """(N, 4) 입력 -> (무게, 위치) - 입력값에 따라 결과가 달라지도록 단순 선형 계산"""
+
+    def __call__(self, values, training=False):
+        values = np.asarray(values)
+        return np.stack([500 + values.sum(axis=1), 1 + np.abs(values[:, 0]) % 9], axis=1)
+
+    def predict(self, values, verbose=0):
+        return self(values)
+
+
+def make_predictor(loaded=True):
+    predictor = KerasMLPPredictor("MLPPredictor")
+    if loaded:
+        predictor.model = StubModel()
+        predictor.scaler = StubScaler()
+    return predictor
+
+
+def test_batch_matches_per_frame_execute():
+    frames = make_frames(100)
+    batch = make_predictor()
+    single = make_predictor()
+
+    results = batch.runAlgoBatch(frames[:40]) + batch.runAlgoBatch(frames[40:])
+    outputs = [single.execute(frame) for frame in frames]
+
+    assert [output['input'] for output in outputs] == frames
+    assert results == [output['output'] for output in outputs]
+    assert all(result.error == 0 for result in results)
+    assert batch.initial_values == single.initial_values
+    assert set(batch.initial_values) == set(LOCATIONS)
+
+
+def test_frame_batch_path_matches_frame_list():
+    frames = make_frames(50)
+    assert make_predictor().runAlgoBatch(FrameBatch.from_frames(frames)) == make_predictor().runAlgoBatch(frames)
+
+
+def test_errors_are_returned_per_frame():
+    frames = make_frames(5)
+    frames[2].sensors = frames[2].sensors[:2]  # 센서 데이터 누락
+
+    predictor = make_predictor()
+    results = predictor.executeBatch(frames)
+    assert [res['input'] for res in results] == frames
+    assert [res['output'].error for res in results] == [0, 0, KerasMLPPredictor.ERROR_NO_SENSOR, 0, 0]
+
+    unloaded = make_predictor(loaded=False)
+    assert [res['output'].error for res in unloaded.executeBatch(frames)] == [KerasMLPPredictor.ERROR_NOT_LOADED] * 5
+
+
+def test_legacy_dict_input_shares_initial_values():
+    frames = make_frames(2)
+    predictor = make_predictor()
+    legacy = {f"VCOM{i + 1}": {'value': frames[0].get_sensor_data(loc).distance} for i, loc in enumerate(LOCATIONS)}
+
+    assert predictor.execute(legacy)['delta_values'] == [0.0] * 4
+    # dict 입력에서 정한 초기값을 프레임 입력에서도 사용
+    expected = make_predictor().runAlgoBatch(frames)[1]
+    assert predictor.execute(frames[1])['output'] == expected
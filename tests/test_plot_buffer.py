@@ -0,0 +1,34 @@
+import numpy as np
+
+from datainfo import SensorData, SENSORLOCATION
+from plot_buffer import SensorRingBuffer
+
+
+def fill(buffer, start, count):
+    for i in range(start, start + count):
+        buffer.append(SensorData(timestamp=i, serial_port="COM1", location=SENSORLOCATION.TOP_LEFT,
+                                 distance=i, intensity=2 * i, temperature=30))
+
+
+def test_large_window_view_is_contiguous_after_wraparound():
+    buffer = SensorRingBuffer(10000)
+    fill(buffer, 0, 25000)
+
+    assert len(buffer) == 10000
+    assert np.array_equal(buffer.view('distance'), np.arange(15000, 25000))
+    assert np.array_equal(buffer.view('intensity', 3), [49994, 49996, 49998])
+    assert buffer.last.distance == 24999
+
+
+def test_since_returns_only_new_samples():
+    buffer = SensorRingBuffer(100)
+    fill(buffer, 0, 30)
+    timestamps, values, total = buffer.since(20)
+    assert timestamps.tolist() == list(range(20, 30)) and total == 30
+    assert values.shape == (3, 10)
+
+    fill(buffer, 30, 250)
+    # 덮어쓰인 샘플은 제외하고 남아있는 최근 capacity개만
+    timestamps, _, total = buffer.since(total)
+    assert timestamps.tolist() == list(range(180, 280)) and total == 280
+    assert len(buffer.since(total)[0]) == 0
@@ -0,0 +1,34 @@
+import os
+
+from file_manager import BufferedRecordWriter
+
+
+def test_writer_keeps_at_most_max_open_files(tmp_path):
+    writer = BufferedRecordWriter(flush_interval=0.05, max_open=2)
+    paths = [str(tmp_path / f"raw_{i}.bin") for i in range(4)]
+    for path in paths:
+        writer.write(path, b"abcd")
+        writer.flush(wait=True, timeout=2.0)
+        assert len(writer.stats()['open']) <= 2
+    writer.write(paths[0], b"efgh")  # 닫힌 파일은 다시 열어 이어서 기록
+    writer.close()
+
+    assert [os.path.getsize(path) for path in paths] == [8, 4, 4, 4]
+    assert writer.stats() == {'pending': 0, 'written': 5, 'dropped': 0, 'open': []}
+
+
+def test_writer_counts_dropped_records(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_bytes(b"")
+    good = str(tmp_path / "good.bin")
+
+    writer = BufferedRecordWriter(flush_interval=0.05)
+    writer.write(str(blocker / "raw.bin"), b"abcd")  # 디렉터리를 만들 수 없어 OSError
+    writer.write(str(blocker / "raw.bin"), b"efgh")
+    writer.write(good, b"ijkl")
+    writer.close()
+
+    stats = writer.stats()
+    assert stats['dropped'] == 2
+    assert stats['written'] == 1
+    assert os.path.getsize(good) == 4
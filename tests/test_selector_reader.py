@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+pytest.importorskip("serial")
+if os.name != "posix":
+    pytest.skip("pty / selectors는 POSIX에서만 사용 가능", allow_module_level=True)
+
+from arduino_manager import SerialSelectorReader, SerialManager, INGEST_MODE
+from serial_protocol import SERIAL_PROTOCOL, encode_frame
+
+
+def open_pty():
+    """(master fd, slave 경로) - slave를 아두이노 포트 대신 사용"""
+    master, slave = os.openpty()
+    path = os.ttyname(slave)
+    os.close(slave)
+    return master, path
+
+
+def write_later(master, data, delay=0.2):
+    # 포트를 열 때 입력 버퍼를 비우므로 open() 이후에 도착하도록 늦게 씀
+    threading.Timer(delay, os.write, args=(master, data)).start()
+
+
+def poll_until(reader, cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        reader._poll(0.05)
+    return cond()
+
+
+@pytest.fixture
+def ptys():
+    pairs = [open_pty() for _ in range(2)]
+    yield pairs
+    for master, _ in pairs:
+        try:
+            os.close(master)
+        except OSError:
+            pass
+
+
+@pytest.mark.parametrize("protocol", [SERIAL_PROTOCOL.ASCII, SERIAL_PROTOCOL.BINARY])
+def test_reader_delivers_samples_from_every_port(ptys, protocol):
+    received = []
+    reader = SerialSelectorReader([path for _, path in ptys], sink=received.append, protocol=protocol)
+    for loc, (master, _) in enumerate(ptys):
+        if protocol == SERIAL_PROTOCOL.BINARY:
+            write_later(master, encode_frame(loc, 100 + loc, 10, 25) * 3)
+        else:
+            write_later(master, f"{loc},{100 + loc},10,25\n".encode() * 3)
+
+    opened = reader.open(init_timeout=2.0)
+    assert [sport.port for sport in opened] == [path for _, path in ptys]
+    assert all(sport.sensorInitted for sport in opened)
+    assert poll_until(reader, lambda: len(received) == 6)
+    assert sorted({(s.serial_port, s.distance) for s in received}) == sorted(
+        (path, 100 + loc) for loc, (_, path) in enumerate(ptys))
+    reader.stop()
+
+
+def test_stop_after_disconnect(ptys):
+    reader = SerialSelectorReader([path for _, path in ptys], sink=lambda sdata: None)
+    for master, _ in ptys:
+        write_later(master, b"0,100,10,25\n")
+    reader.open(init_timeout=2.0)
+
+    # 아두이노 분리 -> 읽기 오류로 포트가 닫힘
+    master, _ = ptys[0]
+    os.close(master)
+    assert poll_until(reader, lambda: not reader.ports[0].is_open)
+
+    reader.stop()  # 이미 닫힌 포트가 있어도 예외 없이 종료
+
+
+def test_synchronizer_uses_only_opened_ports(ptys):
+    master, path = ptys[0]
+    write_later(master, b"0,100,10,25\n")
+    missing = "/dev/does-not-exist"
+
+    manager = SerialManager(debug_mode=False, ingest=INGEST_MODE.SELECTOR)
+    manager.ports = [path, missing]
+    manager.synchronizer = manager._createSynchronizer(manager.ports)
+    manager._start_reader()
+    try:
+        assert [sport.port for sport in manager.sensors] == [path]
+        assert manager.synchronizer.ports == [path]
+    finally:
+        manager.stop_threads()
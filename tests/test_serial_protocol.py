@@ -0,0 +1,70 @@
+import random
+
+from serial_protocol import AsciiLineParser, BinaryFrameParser, FRAME_SIZE, SYNC, encode_frame
+
+SAMPLES = [(i % 4, 100 + i, 10 * i % 900, 20 + i % 10) for i in range(50)]
+
+
+def chunks(data, seed=0, max_size=7):
+    """serial.read(in_waiting)처럼 임의 길이로 자른 chunk"""
+    rnd = random.Random(seed)
+    pos = 0
+    while pos < len(data):
+        size = rnd.randint(1, max_size)
+        yield data[pos:pos + size]
+        pos += size
+
+
+def feed_all(parser, data, seed=0):
+    samples = []
+    for chunk in chunks(data, seed):
+        samples += parser.feed(chunk)
+    return samples
+
+
+def test_binary_frames_split_across_chunks():
+    data = b''.join(encode_frame(*s) for s in SAMPLES)
+    for seed in range(5):
+        parser = BinaryFrameParser()
+        assert feed_all(parser, data, seed) == SAMPLES
+        assert parser.frames == len(SAMPLES)
+        assert parser.skippedBytes == 0
+
+
+def test_binary_resyncs_after_garbage_and_crc_error():
+    corrupted = bytearray(encode_frame(*SAMPLES[1]))
+    corrupted[4] ^= 0xFF  # payload 손상 -> CRC 불일치
+    data = (b'\x00\x13' + SYNC[:1] + encode_frame(*SAMPLES[0]) + bytes(corrupted)
+            + b'\xA5' * 3 + encode_frame(*SAMPLES[2]))
+
+    parser = BinaryFrameParser()
+    assert feed_all(parser, data) == [SAMPLES[0], SAMPLES[2]]
+    assert parser.crcErrors == 1
+    assert parser.skippedBytes == len(data) - 2 * FRAME_SIZE
+
+
+def test_binary_keeps_partial_frame_until_next_chunk():
+    frame = encode_frame(*SAMPLES[0])
+    parser = BinaryFrameParser()
+    assert parser.feed(frame[:-1]) == []
+    assert parser.feed(frame[-1:]) == [SAMPLES[0]]
+    parser.feed(frame[:3])
+    parser.reset()
+    assert parser.feed(encode_frame(*SAMPLES[1])) == [SAMPLES[1]]
+
+
+def test_ascii_lines_split_across_chunks():
+    data = b''.join(f"{l},{d},{i},{t}\r\n".encode() for l, d, i, t in SAMPLES)
+    for seed in range(5):
+        parser = AsciiLineParser()
+        assert feed_all(parser, data, seed) == SAMPLES
+        assert parser.lines == len(SAMPLES)
+        assert parser.badLines == 0
+
+
+def test_ascii_counts_bad_lines_and_recovers():
+    data = b"\n0,100,10,25\n1,abc,10,25\n1,2,3\n" + b"x" * 200 + b"\n2,200,20,26\n"
+    parser = AsciiLineParser(max_line=128)
+    assert feed_all(parser, data) == [(0, 100, 10, 25), (2, 200, 20, 26)]
+    # 빈 줄은 무시, 숫자 오류 / 필드 수 오류 / 너무 긴 라인은 badLines
+    assert parser.badLines == 3
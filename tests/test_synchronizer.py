@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from datainfo import SensorData, SENSORLOCATION
+from synchronizer import ApproximateTimeSynchronizer, InterpolatingSynchronizer, SkewEstimator
+from timebase import NS_PER_MS, NS_PER_SEC
+
+PORTS = [f"P{i}" for i in range(4)]
+
+
+def sample(port, timestamp, distance=100):
+    return SensorData(timestamp=timestamp, serial_port=port,
+                      location=SENSORLOCATION.get_sensor_location(PORTS.index(port)),
+                      distance=distance, intensity=500, temperature=30)
+
+
+def generate(rates, skews_ms=(0, 0, 0, 0), seconds=60, jitter_ms=1.0, seed=1):
+    """포트별 rate(Hz)로 샘플을 만들고 수신 순서(타임스탬프 순)로 정렬"""
+    rnd = random.Random(seed)
+    samples = []
+    for port, rate, skew in zip(PORTS, rates, skews_ms):
+        period = NS_PER_SEC / rate
+        for k in range(int(seconds * rate)):
+            timestamp = NS_PER_SEC + round(k * period + skew * NS_PER_MS + rnd.gauss(0, jitter_ms * NS_PER_MS))
+            samples.append(sample(port, timestamp, distance=k % 1000))
+    samples.sort(key=lambda s: s.timestamp)
+    return samples
+
+
+def run(synchronizer, samples):
+    frames = []
+    for sdata in samples:
+        frames += synchronizer.push(sdata)
+    return frames
+
+
+def span(frame):
+    timestamps = [s.timestamp for s in frame.sensors]
+    return max(timestamps) - min(timestamps)
+
+
+def test_matches_heads_within_slop():
+    sync = ApproximateTimeSynchronizer(PORTS, slop=0.01)
+    assert sync.push(sample("P0", 0)) == []
+    assert sync.push(sample("P1", 2 * NS_PER_MS)) == []
+    assert sync.push(sample("P2", 4 * NS_PER_MS)) == []
+    frames = sync.push(sample("P3", 6 * NS_PER_MS))
+
+    assert len(frames) == 1
+    assert [s.serial_port for s in frames[0].sensors] == PORTS
+    assert frames[0].timestamp == 6 * NS_PER_MS
+    assert sync.pending() == 0
+
+
+def test_drops_oldest_head_outside_slop():
+    sync = ApproximateTimeSynchronizer(PORTS, slop=0.01)
+    sync.push(sample("P0", 0))  # 다른 포트보다 50ms 이전 -> 버려짐
+    for port in PORTS:
+        sync.push(sample(port, 50 * NS_PER_MS) if port != "P0" else sample(port, 51 * NS_PER_MS))
+
+    assert sync.matched == 1
+    assert sync.dropped == 1
+    assert sync.stats()['yield'] == pytest.approx(4 / 5)
+
+
+def test_out_of_order_sample_is_inserted_by_timestamp():
+    sync = ApproximateTimeSynchronizer(PORTS, slop=0.005)
+    sync.push(sample("P0", 20 * NS_PER_MS))
+    sync.push(sample("P0", 0))
+    assert [s.timestamp for s in sync.queues["P0"]] == [0, 20 * NS_PER_MS]
+
+    frames = run(sync, [sample(port, 1 * NS_PER_MS) for port in PORTS[1:]])
+    assert len(frames) == 1
+    assert frames[0].sensors[0].timestamp == 0
+
+
+def test_skew_estimator_tracks_period_and_offset():
+    estimator = SkewEstimator(PORTS[:2])
+    for sdata in generate([50, 51, 50, 50], skews_ms=(0, 5, 0, 0), seconds=20, jitter_ms=0.5):
+        if sdata.serial_port in estimator.ports:
+            estimator.observeSample(sdata)
+
+    assert estimator.period["P0"] == pytest.approx(NS_PER_SEC / 50, rel=1e-3)
+    assert estimator.period["P1"] == pytest.approx(NS_PER_SEC / 51, rel=1e-3)
+    assert estimator.jitter["P1"] < 1 * NS_PER_MS
+    # 주기가 다르면 위상이 계속 밀리므로 오프셋은 시각에 따라 달라지지만 항상 (-P/2, P/2] 범위
+    period = estimator.period["P0"]
+    for t in range(0, 2 * NS_PER_SEC, 7 * NS_PER_MS):
+        assert abs(estimator.offset("P1", 20 * NS_PER_SEC + t)) <= period / 2
+
+
+@pytest.mark.parametrize("rates", [[50, 50.1, 49.9, 50.05], [50, 50.5, 49.5, 51]])
+def test_adaptive_keeps_yield_with_rate_mismatch(rates):
+    samples = generate(rates)
+    fixed = ApproximateTimeSynchronizer(PORTS, slop=0.1)
+    adaptive = ApproximateTimeSynchronizer(PORTS, slop=0.1, adaptive=True)
+    run(fixed, samples)
+    frames = run(adaptive, samples)
+
+    assert adaptive.stats()['yield'] >= fixed.stats()['yield'] - 0.02
+    assert adaptive.slop < 0.01
+    # warmup 이후 프레임은 가장 가까운 샘플끼리 묶임 (샘플 주기 + 지터 이내)
+    assert max(span(frame) for frame in frames[100:]) < 35 * NS_PER_MS
+
+
+def test_adaptive_learns_fixed_skew():
+    samples = generate([50] * 4, skews_ms=(0, 2, 5, 8))
+    sync = ApproximateTimeSynchronizer(PORTS, slop=0.1, adaptive=True)
+    run(sync, samples)
+    stats = sync.stats()
+
+    assert stats['yield'] > 0.98
+    assert stats['slop'] < 0.006
+    for port, skew in zip(PORTS, (0, 2, 5, 8)):
+        assert stats['offset'][port] == pytest.approx(skew / 1000, abs=0.5e-3)
+
+
+def test_adaptive_respects_staleness_bound():
+    samples = generate([50, 50.5, 49.5, 51])
+    sync = ApproximateTimeSynchronizer(PORTS, slop=0.005, adaptive=True, max_slop=0.012)
+    frames = run(sync, samples)
+    assert max(span(frame) for frame in frames) <= 12 * NS_PER_MS
+
+
+def test_interpolates_at_fixed_rate():
+    sync = InterpolatingSynchronizer(PORTS, rate=100)
+    samples = [sample(port, k * 20 * NS_PER_MS + offset * NS_PER_MS, distance=k * 100)
+               for k in range(5) for offset, port in enumerate(PORTS)]
+    frames = run(sync, sorted(samples, key=lambda s: s.timestamp))
+
+    # 첫 출력 시각은 모든 포트의 첫 샘플 이후(3ms), 이후 10ms 간격
+    assert [frame.timestamp for frame in frames] == [(3 + 10 * k) * NS_PER_MS for k in range(8)]
+    # P0: 0ms=0, 20ms=100 -> 13ms에서 65
+    assert frames[1].sensors[0].distance == 65
+    assert all(s.timestamp == frames[1].timestamp for s in frames[1].sensors)
+
+
+def test_interpolating_jumps_over_gap():
+    sync = InterpolatingSynchronizer(PORTS, rate=50, max_gap=0.1)
+    period = 20 * NS_PER_MS
+    gap_end = 3600 * NS_PER_SEC + 5 * NS_PER_MS  # P0가 1시간 동안 끊김
+    samples = [sample(port, k * period) for k in range(3) for port in PORTS]
+    samples += [sample(port, gap_end + k * period) for k in range(3) for port in PORTS]
+    samples += [sample(port, 3 * period) for port in PORTS[1:]]
+    frames = run(sync, sorted(samples, key=lambda s: s.timestamp))
+
+    timestamps = [frame.timestamp for frame in frames]
+    assert timestamps == sorted(timestamps)
+    # 끊긴 구간 이후 첫 프레임은 gap_end 이후의 첫 출력 시각
+    after = [t for t in timestamps if t > 2 * period]
+    assert after[0] == gap_end - 5 * NS_PER_MS + period
+    assert sync.matched + sync.skipped == after[-1] // period + 1
@@ -0,0 +1,97 @@
+import datetime
+import time
+
+import numpy as np
+import pytest
+
+import timebase
+from frame_batch import _from_wall_seconds, _to_wall_seconds
+from timebase import (NS_PER_SEC, NS_PER_MS, now_ns, to_wall_ns, to_wall_seconds, from_wall_seconds,
+                      to_datetime, from_datetime, to_seconds, from_seconds, refresh_wall_offset)
+
+
+@pytest.fixture
+def restore_offset():
+    offset = timebase.WALL_OFFSET_NS
+    yield
+    timebase.WALL_OFFSET_NS = offset
+
+
+def test_now_is_monotonic_and_close_to_wall_clock():
+    first, second = now_ns(), now_ns()
+    assert isinstance(first, int) and first <= second
+    assert abs(to_wall_seconds(first) - time.time()) < 0.1
+
+
+def test_wall_seconds_round_trip():
+    timestamp = now_ns()
+    assert to_wall_ns(timestamp) == timestamp + timebase.WALL_OFFSET_NS
+    # float64 초의 분해능은 현재 시각 기준 약 0.24µs
+    assert abs(from_wall_seconds(to_wall_seconds(timestamp)) - timestamp) < 1000
+
+
+def test_datetime_round_trip():
+    timestamp = now_ns()
+    dt = to_datetime(timestamp)
+    assert isinstance(dt, datetime.datetime)
+    assert abs(from_datetime(dt) - timestamp) <= 1000  # datetime은 µs 단위
+
+
+def test_seconds_conversion():
+    assert to_seconds(1_500_000_000) == 1.5
+    assert from_seconds(0.0015) == 1_500_000
+    assert from_seconds(to_seconds(123 * NS_PER_MS)) == 123 * NS_PER_MS
+
+
+def test_array_conversion_matches_scalar():
+    timestamps = np.array([now_ns() + i * 7_654_321 for i in range(1000)], dtype=np.int64)
+    seconds = _to_wall_seconds(timestamps)
+    assert seconds.tolist() == [to_wall_seconds(t) for t in timestamps.tolist()]
+    assert _from_wall_seconds(seconds).tolist() == [from_wall_seconds(s) for s in seconds.tolist()]
+
+
+def test_refresh_wall_offset(monkeypatch, restore_offset):
+    timestamp = now_ns()
+    before = to_wall_seconds(timestamp)
+    offset = timebase.WALL_OFFSET_NS
+    # NTP가 벽시계를 2초 앞당긴 상황
+    wall_ns = time.time_ns
+    monkeypatch.setattr(timebase.time, 'time_ns', lambda: wall_ns() + 2 * NS_PER_SEC)
+
+    change = refresh_wall_offset()
+    assert abs(change - 2 * NS_PER_SEC) < 10 * NS_PER_MS
+    assert timebase.WALL_OFFSET_NS == offset + change
+    assert to_wall_seconds(timestamp) == pytest.approx(before + change / NS_PER_SEC)
+    # 배열 변환도 새 오프셋을 사용
+    assert _to_wall_seconds(np.array([timestamp]))[0] == to_wall_seconds(timestamp)
+
+
+def test_old_log_timestamps_become_negative():
+    # 부팅 전(10년 전)에 기록된 UNIX 시간은 현재 monotonic 기준으로 음수
+    assert from_wall_seconds(time.time() - 10 * 365 * 86400) < 0
+
+
+@pytest.fixture
+def berlin_time(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset이 없는 플랫폼")
+    monkeypatch.setenv('TZ', 'Europe/Berlin')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_experiment_timestamps_to_int_across_dst(berlin_time):
+    pytest.importorskip("PyQt5.QtWidgets")
+    pytest.importorskip("pyqtgraph")
+    from experiment import timestamp_to_int, timestamps_to_int
+
+    # 2025-03-30 01:59:59 CET -> 03:00:00 CEST
+    transition = datetime.datetime(2025, 3, 30, 1, 0, tzinfo=datetime.timezone.utc).timestamp()
+    timestamps = np.array([from_wall_seconds(transition + delta) for delta in (-2.5, -0.001, 0.0, 1.25)],
+                          dtype=np.int64)
+    expected = [timestamp_to_int(t) for t in timestamps.tolist()]
+    assert expected == [15957500, 15959999, 30000000, 30001250]
+    assert timestamps_to_int(timestamps).tolist() == expected
+    assert timestamps_to_int(timestamps[:2]).tolist() == expected[:2]
@@ -0,0 +1,71 @@
+"""
+센서 파이프라인 시간 기준
+
+수집 / 동기화 / 알고리즘 경로의 timestamp는 time.monotonic_ns() 정수 (ns)
+- 비교와 차이 계산이 정수 연산이고, NTP 보정이나 시계 변경에 영향을 받지 않음
+- NumPy int64 배열에 그대로 저장 가능
+벽시계(datetime, UNIX 시간)로의 변환은 화면 표시 / 파일 저장 시점에만 수행
+monotonic 시계와 벽시계의 차이(WALL_OFFSET_NS)는 import 시점에 기록하고 refresh_wall_offset()을 호출할 때만 다시 측정
+- 그 사이의 NTP 보정 / 시계 변경은 변환에 반영되지 않으므로 새 파일을 만들 때마다 refresh 하여 오차가 쌓이지 않도록 함
+- refresh 이후에는 같은 monotonic 값도 새 오프셋으로 변환됨 (이미 저장된 값은 바뀌지 않음)
+"""
+import datetime
+import time
+
+NS_PER_SEC = 1_000_000_000
+NS_PER_MS = 1_000_000
+
+# 벽시계(UNIX ns) - monotonic ns (다른 모듈은 값을 복사하지 말고 timebase.WALL_OFFSET_NS로 참조)
+WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+now_ns = time.monotonic_ns
+
+
+def refresh_wall_offset() -> int:
+    """
+    벽시계 오프셋을 다시 측정 (실험 파일 / 날짜별 raw_data 파일 교체 시 호출)
+
+    Returns:
+        이전 오프셋 대비 변화량 (ns)
+    """
+    global WALL_OFFSET_NS
+    offset = time.time_ns() - time.monotonic_ns()
+    change = offset - WALL_OFFSET_NS
+    WALL_OFFSET_NS = offset
+    return change
+
+
+def to_wall_ns(timestamp: int) -> int:
+    return timestamp + WALL_OFFSET_NS
+
+
+def to_wall_seconds(timestamp: int) -> float:
+    """
+    monotonic ns -> UNIX 시간(초), 파일 저장용
+    정수 덧셈 후 float64로 바꿔 한 번만 나눔 (NumPy 배열 변환 frame_batch._to_wall_seconds와 같은 값)
+    """
+    return float(timestamp + WALL_OFFSET_NS) / NS_PER_SEC
+
+
+def from_wall_seconds(seconds: float) -> int:
+    """UNIX 시간(초) -> monotonic ns, 파일에서 읽을 때 사용"""
+    # 현재 부팅의 monotonic 기준으로 바꾸므로 이전 부팅에서 기록한 로그는
+    # 다른 부팅의 monotonic 값(대개 음수)이 됨 -> 순서 / 차이 계산에만 쓰고 표시는 to_datetime으로 변환
+    return round(seconds * NS_PER_SEC) - WALL_OFFSET_NS
+
+
+def to_datetime(timestamp: int) -> datetime.datetime:
+    """monotonic ns -> 로컬 시간 datetime, 화면 표시 / CSV 용"""
+    return datetime.datetime.fromtimestamp(to_wall_seconds(timestamp))
+
+
+def from_datetime(dt: datetime.datetime) -> int:
+    return from_wall_seconds(dt.timestamp())
+
+
+def to_seconds(ns: int) -> float:
+    return ns / NS_PER_SEC
+
+
+def from_seconds(seconds: float) -> int:
+    return round(seconds * NS_PER_SEC)